@@ -0,0 +1,41 @@
+"""Benchmark per-profile aggregates over a shot history.
+
+Run with: python benchmarks/benchmark_analytics.py
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.analytics import aggregate_shots
+from gaggiuino_api.models import GaggiuinoShot
+
+SHOTS = 5000
+SAMPLES = 600
+
+
+def main() -> None:
+    shots = []
+    for index in range(SHOTS):
+        data = make_shot(SAMPLES)
+        data["timestamp"] += index * 3600
+        data["profile"]["id"] = index % 8
+        shots.append(GaggiuinoShot.from_dict(data))
+
+    cases = {
+        "pure python": {"use_numpy": False},
+        "numpy": {},
+        f"numpy, {os.cpu_count()} workers": {"workers": os.cpu_count()},
+    }
+    for name, kwargs in cases.items():
+        started = time.perf_counter()
+        aggregates = aggregate_shots(shots, window=7 * 86400, **kwargs)
+        elapsed = time.perf_counter() - started
+        print(f"{name:20} {len(aggregates)} groups in {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark scoring shot deviation from the targets.
+
+Run with: python benchmarks/benchmark_deviation.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.deviation import score_shots
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.tools import optional_numpy
+
+SHOTS = 1000
+SAMPLES = 600
+
+
+def main() -> None:
+    shots = [GaggiuinoShot.from_dict(make_shot(SAMPLES)) for _ in range(SHOTS)]
+    for shot in shots:
+        # Segment once, the scores reuse the phases
+        _ = shot.segments
+    backends = [False] + ([True] if optional_numpy() is not None else [])
+    for use_numpy in backends:
+        # Custom tolerances are not cached on the shots, so every round scores
+        elapsed = min(
+            timeit.repeat(
+                lambda: score_shots(
+                    shots, tolerances={"pressure": 0.5}, use_numpy=use_numpy
+                ),
+                number=1,
+                repeat=3,
+            )
+        )
+        backend = "numpy" if use_numpy else "python"
+        print(f"{backend:7} {SHOTS} shots in {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark downsampling a shot for charting.
+
+Run with: python benchmarks/benchmark_downsample.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.tools import optional_numpy
+
+SAMPLES = 3000
+POINTS = 200
+ROUNDS = 20
+
+
+def main() -> None:
+    shot = GaggiuinoShot.from_dict(make_shot(SAMPLES))
+    backends = [False] + ([True] if optional_numpy() is not None else [])
+    for method in ("lttb", "minmax"):
+        # LTTB always runs in pure Python
+        for use_numpy in backends if method == "minmax" else [False]:
+            elapsed = min(
+                timeit.repeat(
+                    lambda: shot.downsample(POINTS, method=method, use_numpy=use_numpy),
+                    number=ROUNDS,
+                    repeat=3,
+                )
+            )
+            backend = "numpy" if use_numpy else "python"
+            print(f"{method:7} {backend:7} {elapsed / ROUNDS * 1e3:8.2f} ms/shot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark the JSON backends on a large shot payload.
+
+Run with: python benchmarks/benchmark_json.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.json_backend import JSON_BACKENDS, get_json_backend
+
+SAMPLES = 3000
+ROUNDS = 50
+
+
+def main() -> None:
+    shot = make_shot(SAMPLES)
+    body = get_json_backend("json").dumps(shot)
+    print(f"Payload: {len(body) / 1024:.0f} KiB")
+
+    for name in JSON_BACKENDS:
+        try:
+            backend = get_json_backend(name)
+        except ImportError:
+            print(f"{name:10} not installed")
+            continue
+        loads = min(timeit.repeat(lambda: backend.loads(body), number=ROUNDS, repeat=5))
+        dumps = min(timeit.repeat(lambda: backend.dumps(shot), number=ROUNDS, repeat=5))
+        print(
+            f"{name:10} loads {loads / ROUNDS * 1e3:7.2f} ms"
+            f"  dumps {dumps / ROUNDS * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
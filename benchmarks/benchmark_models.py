@@ -0,0 +1,80 @@
+"""Benchmark decoding of shot payloads into models.
+
+Run with: python benchmarks/benchmark_models.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from gaggiuino_api.models import GaggiuinoProfile, GaggiuinoShot
+
+SAMPLES = 600
+ROUNDS = 200
+
+
+def make_shot(samples: int = SAMPLES) -> dict:
+    """Build a shot payload resembling a 60 second shot."""
+    rng = random.Random(0)
+    series = (
+        "pressure",
+        "pumpFlow",
+        "shotWeight",
+        "targetPressure",
+        "targetPumpFlow",
+        "targetTemperature",
+        "temperature",
+        "timeInShot",
+        "waterPumped",
+        "weightFlow",
+    )
+    phase = {
+        "restriction": 2,
+        "skip": False,
+        "stopConditions": {"pressureAbove": 2, "time": 15000, "weight": 0.1},
+        "target": {"curve": "EASE_IN_OUT", "start": 2, "end": 9, "time": 10000},
+        "type": "PRESSURE",
+    }
+    datapoints = {
+        name: [rng.randint(0, 1000) for _ in range(samples)] for name in series
+    }
+    # Samples arrive every 0.1 to 0.3 s
+    time_in_shot = 0
+    for index in range(samples):
+        datapoints["timeInShot"][index] = time_in_shot
+        time_in_shot += rng.randint(1, 3)
+    return {
+        "datapoints": datapoints,
+        "duration": samples,
+        "id": 1,
+        "profile": {
+            "id": 8,
+            "name": "_Long",
+            "globalStopConditions": {"weight": 36},
+            "phases": [phase] * 4,
+            "recipe": {},
+            "waterTemperature": 93,
+        },
+        "timestamp": 1731316192,
+    }
+
+
+def main() -> None:
+    shot = make_shot()
+    profile = shot["profile"]
+    cases = {
+        # Previous decoding, nested payloads are left as raw dicts
+        "GaggiuinoProfile(**kwargs)": lambda: GaggiuinoProfile(**profile),
+        "GaggiuinoShot(**kwargs)": lambda: GaggiuinoShot(**shot),
+        # Full typed tree, datapoints packed into arrays
+        "GaggiuinoProfile.from_dict": lambda: GaggiuinoProfile.from_dict(profile),
+        "GaggiuinoShot.from_dict": lambda: GaggiuinoShot.from_dict(shot),
+    }
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=ROUNDS, repeat=5)) / ROUNDS
+        print(f"{name:36} {elapsed * 1e6:10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
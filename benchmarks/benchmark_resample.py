@@ -0,0 +1,51 @@
+"""Benchmark resampling a shot onto a uniform time grid.
+
+Run with: python benchmarks/benchmark_resample.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from bisect import bisect_left
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.tools import optional_numpy
+
+SAMPLES = 600
+ROUNDS = 100
+
+
+def naive(shot: GaggiuinoShot) -> dict[str, list[float]]:
+    """Interpolate each series separately, bisecting the samples per point."""
+    times = shot.datapoints.timeInShot
+    grid = range(times[0], times[-1] + 1)
+    columns = {}
+    for name, values in shot.datapoints.series().items():
+        column = []
+        for t in grid:
+            right = bisect_left(times, t)
+            left = max(right - 1, 0)
+            span = times[right] - times[left]
+            w = (t - times[left]) / span if span else 0.0
+            column.append(values[left] + (values[right] - values[left]) * w)
+        columns[name] = column
+    return columns
+
+
+def main() -> None:
+    shot = GaggiuinoShot.from_dict(make_shot(SAMPLES))
+    cases = {
+        "per-series search": lambda: naive(shot),
+        "resample (python)": lambda: shot.resample(1, use_numpy=False),
+    }
+    if optional_numpy() is not None:
+        cases["resample (numpy)"] = lambda: shot.resample(1, use_numpy=True)
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=ROUNDS, repeat=3)) / ROUNDS
+        print(f"{name:20} {elapsed * 1e3:9.3f} ms/shot")
+
+
+if __name__ == "__main__":
+    main()
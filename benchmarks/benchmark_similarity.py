@@ -0,0 +1,48 @@
+"""Benchmark nearest shot queries over a shot index.
+
+Run with: python benchmarks/benchmark_similarity.py
+"""
+
+from __future__ import annotations
+
+import time
+import timeit
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.similarity import GaggiuinoShotIndex
+from gaggiuino_api.tools import optional_numpy
+
+SHOTS = 2000
+QUERIES = 20
+
+
+def main() -> None:
+    shots = []
+    for shot_id in range(1, SHOTS + 1):
+        data = make_shot()
+        data["id"] = shot_id
+        shots.append(GaggiuinoShot.from_dict(data))
+    backends = [False] + ([True] if optional_numpy() is not None else [])
+    for use_numpy in backends:
+        index = GaggiuinoShotIndex(use_numpy=use_numpy)
+        started = time.perf_counter()
+        index.extend(shots)
+        built = time.perf_counter() - started
+        elapsed = min(
+            timeit.repeat(
+                lambda: [index.nearest(_) for _ in range(1, QUERIES + 1)],
+                number=1,
+                repeat=3,
+            )
+        )
+        backend = "numpy" if use_numpy else "python"
+        print(
+            f"{backend:7} {SHOTS} shots indexed in {built * 1e3:8.1f} ms, "
+            f"query {elapsed / QUERIES * 1e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark rendering profile target curves for many shots.
+
+Run with: python benchmarks/benchmark_simulate.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.simulate import _simulate, simulate_profile
+from gaggiuino_api.tools import optional_numpy
+
+SHOTS = 1000
+PERIOD = 0.5
+
+
+def main() -> None:
+    shots = [GaggiuinoShot.from_dict(make_shot()) for _ in range(SHOTS)]
+    backends = [False] + ([True] if optional_numpy() is not None else [])
+    for use_numpy in backends:
+
+        def _render(shots=shots, use_numpy=use_numpy) -> None:
+            for shot in shots:
+                simulate_profile(shot.profile, PERIOD, use_numpy=use_numpy)
+
+        def _cold() -> None:
+            _simulate.cache_clear()
+            _render(shots[:1])
+
+        cold = min(timeit.repeat(_cold, number=1, repeat=5))
+        warm = min(timeit.repeat(_render, number=1, repeat=3))
+        backend = "numpy" if use_numpy else "python"
+        print(
+            f"{backend:7} first render {cold * 1e3:6.2f} ms, "
+            f"{SHOTS} shots {warm * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark streamed against buffered parsing of a large shot payload.
+
+Run with: python benchmarks/benchmark_stream.py
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.const import DEFAULT_STREAM_CHUNK_SIZE
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.stream import GaggiuinoShotStreamParser
+
+SAMPLES = 3000
+ROUNDS = 20
+
+
+def buffered(body: bytes) -> GaggiuinoShot:
+    return GaggiuinoShot.from_dict(json.loads(body))
+
+
+def streamed(body: bytes) -> GaggiuinoShot:
+    parser = GaggiuinoShotStreamParser()
+    for start in range(0, len(body), DEFAULT_STREAM_CHUNK_SIZE):
+        parser.feed(body[start : start + DEFAULT_STREAM_CHUNK_SIZE])
+    return GaggiuinoShot.from_dict(parser.close())
+
+
+def peak_memory(parse, body: bytes) -> int:
+    tracemalloc.start()
+    parse(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    body = json.dumps(make_shot(SAMPLES)).encode()
+    print(f"Payload: {len(body) / 1024:.0f} KiB")
+
+    for parse in (buffered, streamed):
+        elapsed = min(timeit.repeat(lambda: parse(body), number=ROUNDS, repeat=5))
+        print(
+            f"{parse.__name__:10} {elapsed / ROUNDS * 1e3:7.2f} ms"
+            f"  peak {peak_memory(parse, body) / 1024:7.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Benchmark computing shot summaries in batch.
+
+Run with: python benchmarks/benchmark_summary.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmark_models import make_shot
+
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.summary import summarize_shots
+from gaggiuino_api.tools import optional_numpy
+
+SHOTS = 1000
+SAMPLES = 600
+
+
+def main() -> None:
+    shots = [GaggiuinoShot.from_dict(make_shot(SAMPLES)) for _ in range(SHOTS)]
+    backends = [False] + ([True] if optional_numpy() is not None else [])
+    for use_numpy in backends:
+        elapsed = min(
+            timeit.repeat(
+                lambda: summarize_shots(shots, use_numpy=use_numpy), number=1, repeat=3
+            )
+        )
+        backend = "numpy" if use_numpy else "python"
+        print(f"{backend:7} {SHOTS} shots in {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
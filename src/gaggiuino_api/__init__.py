@@ -1,6 +1,12 @@
+from .analytics import GaggiuinoShotAggregate, aggregate_shots
 from .api import GaggiuinoAPI
+from .breaker import GaggiuinoCircuitBreaker
+from .cache import GaggiuinoResponseCache
+from .deviation import GaggiuinoShotDeviation, score_shots
+from .discovery import GaggiuinoDevice, GaggiuinoDiscovery
 from .exceptions import (
     GaggiuinoError,
+    GaggiuinoCircuitOpenError,
     GaggiuinoConnectionError,
     GaggiuinoEndpointNotFoundError,
     GaggiuinoConnectionTimeoutError,
@@ -26,12 +32,28 @@ from .models import (
     GaggiuinoVersions,
     GaggiuinoSettings,
 )
+from .fleet import GaggiuinoFleet, GaggiuinoFleetResult
+from .json_backend import GaggiuinoJSONBackend, get_json_backend
+from .limiter import GaggiuinoRateLimiter
+from .phases import GaggiuinoShotPhase, segment_phases
+from .poller import GaggiuinoStatusPoller
+from .retry import GaggiuinoEndpointStats, GaggiuinoRetryPolicy
+from .shot_cache import GaggiuinoShotCache
+from .similarity import GaggiuinoShotIndex
+from .simulate import simulate_profile
+from .sse import GaggiuinoEvent
+from .stream import GaggiuinoShotStreamParser
+from .summary import GaggiuinoShotSummary, summarize_shots
+from .sync import GaggiuinoShotSync, GaggiuinoSyncResult
+from .transport import GaggiuinoTransport, GaggiuinoTransportStats
 
 __all__ = [
     'GaggiuinoAPI',
     'GaggiuinoError',
     'GaggiuinoConnectionError',
     'GaggiuinoEndpointNotFoundError',
+    'GaggiuinoCircuitOpenError',
+    'GaggiuinoCircuitBreaker',
     'GaggiuinoShot',
     'GaggiuinoShotDataPoints',
     'GaggiuinoProfile',
@@ -52,4 +74,32 @@ __all__ = [
     'GaggiuinoThemeSettings',
     'GaggiuinoVersions',
     'GaggiuinoSettings',
+    'GaggiuinoEvent',
+    'GaggiuinoJSONBackend',
+    'get_json_backend',
+    'GaggiuinoResponseCache',
+    'GaggiuinoRetryPolicy',
+    'GaggiuinoRateLimiter',
+    'GaggiuinoFleet',
+    'GaggiuinoFleetResult',
+    'GaggiuinoDevice',
+    'GaggiuinoDiscovery',
+    'GaggiuinoEndpointStats',
+    'GaggiuinoShotCache',
+    'GaggiuinoShotIndex',
+    'GaggiuinoShotStreamParser',
+    'GaggiuinoShotSummary',
+    'summarize_shots',
+    'GaggiuinoShotAggregate',
+    'aggregate_shots',
+    'GaggiuinoShotDeviation',
+    'score_shots',
+    'GaggiuinoShotPhase',
+    'segment_phases',
+    'simulate_profile',
+    'GaggiuinoShotSync',
+    'GaggiuinoSyncResult',
+    'GaggiuinoStatusPoller',
+    'GaggiuinoTransport',
+    'GaggiuinoTransportStats',
 ]
@@ -0,0 +1,158 @@
+"""Batch shot analytics for Gaggiuino"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.shot_cache import GaggiuinoShotCache
+from gaggiuino_api.summary import GaggiuinoShotSummary, summarize_shots
+from gaggiuino_api.tools import optional_numpy
+
+# Summary metrics aggregated per group
+_METRICS = ("finalWeight", "duration", "peakPressure")
+
+
+@dataclass(frozen=True)
+class GaggiuinoShotAggregate:
+    """
+    {
+        'profileId': 8,
+        'profileName': '_Long',
+        'windowStart': 1731283200,
+        'shots': 42,
+        'finalWeightP50': 36.1,
+        'finalWeightP95': 38.4,
+        'durationP50': 29.5,
+        'durationP95': 34.2,
+        'peakPressureP50': 9.0,
+        'peakPressureP95': 9.4
+    }
+
+    Field Notes:
+    - windowStart: Unix timestamp the time window starts at, 0 without windows
+    - Percentiles use linear interpolation and skip shots missing the metric,
+      None if no shot has it
+    """
+
+    profileId: int
+    profileName: str
+    windowStart: int
+    shots: int
+    finalWeightP50: float | None = None
+    finalWeightP95: float | None = None
+    durationP50: float | None = None
+    durationP95: float | None = None
+    peakPressureP50: float | None = None
+    peakPressureP95: float | None = None
+
+
+def iter_archive(cache: GaggiuinoShotCache) -> Iterator[GaggiuinoShot]:
+    """Read every shot stored in a shot cache in ascending ID order."""
+    for shot_id in cache.ids():
+        shot = cache.get(shot_id)
+        if shot is not None:
+            yield GaggiuinoShot.from_dict(shot)
+
+
+def aggregate_shots(
+    shots: Iterable[GaggiuinoShot] | GaggiuinoShotCache,
+    *,
+    window: int | None = None,
+    workers: int | None = None,
+    use_numpy: bool | None = None,
+) -> list[GaggiuinoShotAggregate]:
+    """Compute per-profile distributions over many shots.
+
+    Shots are grouped by profile ID and name, and by time window if given.
+    The shot metrics are computed with summarize_shots, in worker processes
+    if requested, and the percentiles per group with NumPy when installed.
+
+    Args:
+        shots: Shots or a shot cache holding an archive
+        window: Window length in seconds, e.g. 86400 for daily groups, None
+            to aggregate over all time
+        workers: Processes computing the shot metrics, None to compute them
+            in the calling process
+        use_numpy: True to require NumPy, False for pure Python, None to use
+            NumPy when installed
+
+    Returns:
+        One aggregate per group, ordered by profile ID, name and window
+    """
+    if isinstance(shots, GaggiuinoShotCache):
+        shots = iter_archive(shots)
+    shots = list(shots)
+    summaries = _summaries(shots, workers, use_numpy)
+
+    groups: dict[tuple[int, str, int], list[GaggiuinoShotSummary]] = {}
+    for shot, summary in zip(shots, summaries):
+        start = shot.timestamp // window * window if window else 0
+        key = (shot.profile.id, shot.profile.name, start)
+        groups.setdefault(key, []).append(summary)
+
+    numpy = optional_numpy(use_numpy)
+    aggregates = []
+    for (profile_id, profile_name, start), members in sorted(groups.items()):
+        percentiles = {}
+        for metric in _METRICS:
+            values = [
+                value
+                for value in (getattr(_, metric) for _ in members)
+                if value is not None
+            ]
+            p50, p95 = _percentiles(numpy, values, (50, 95))
+            percentiles[f"{metric}P50"] = p50
+            percentiles[f"{metric}P95"] = p95
+        aggregates.append(
+            GaggiuinoShotAggregate(
+                profileId=profile_id,
+                profileName=profile_name,
+                windowStart=start,
+                shots=len(members),
+                **percentiles,
+            )
+        )
+    return aggregates
+
+
+def _summaries(
+    shots: list[GaggiuinoShot], workers: int | None, use_numpy: bool | None
+) -> list[GaggiuinoShotSummary]:
+    if not workers or workers < 2 or len(shots) < 2:
+        return summarize_shots(shots, use_numpy=use_numpy)
+
+    # A few chunks per worker to even out the load
+    size = max(1, -(-len(shots) // (workers * 4)))
+    chunks = [shots[i : i + size] for i in range(0, len(shots), size)]
+    with ProcessPoolExecutor(workers) as executor:
+        results = executor.map(_summarize_chunk, chunks, [use_numpy] * len(chunks))
+        return [summary for chunk in results for summary in chunk]
+
+
+def _summarize_chunk(
+    shots: list[GaggiuinoShot], use_numpy: bool | None
+) -> list[GaggiuinoShotSummary]:
+    return summarize_shots(shots, use_numpy=use_numpy)
+
+
+def _percentiles(
+    numpy, values: list[float], quantiles: tuple[float, ...]
+) -> list[float | None]:
+    if not values:
+        return [None] * len(quantiles)
+    if numpy is not None:
+        return [float(_) for _ in numpy.percentile(values, quantiles)]
+
+    values = sorted(values)
+    result = []
+    for quantile in quantiles:
+        position = (len(values) - 1) * quantile / 100
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        result.append(
+            values[lower] + (values[upper] - values[lower]) * (position - lower)
+        )
+    return result
@@ -6,19 +6,36 @@ import asyncio
 import logging
 import os
 import sys
-from typing import Type, Any, Literal
+import time
+from typing import Type, Any, AsyncIterator, Callable, Iterable, Literal
 from urllib import parse as urllib_parse
 
 from aiohttp import ClientSession, ClientTimeout
 from aiohttp.client_exceptions import ClientConnectionError
 
-from gaggiuino_api.const import DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+from gaggiuino_api.breaker import GaggiuinoCircuitBreaker
+from gaggiuino_api.cache import GaggiuinoResponseCache
+from gaggiuino_api.const import (
+    DEFAULT_BASE_URL,
+    DEFAULT_TIMEOUT,
+    DEFAULT_EVENTS_PATH,
+    DEFAULT_EVENTS_RETRY,
+    DEFAULT_EVENTS_READ_TIMEOUT,
+    DEFAULT_SHOT_CONCURRENCY,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+)
 from gaggiuino_api.exceptions import (
     GaggiuinoError,
+    GaggiuinoCircuitOpenError,
     GaggiuinoConnectionError,
     GaggiuinoEndpointNotFoundError,
     GaggiuinoConnectionTimeoutError,
 )
+from gaggiuino_api.json_backend import GaggiuinoJSONBackend, get_json_backend
+from gaggiuino_api.limiter import GaggiuinoRateLimiter
 from gaggiuino_api.models import (
     GaggiuinoProfile,
     GaggiuinoShot,
@@ -33,7 +50,12 @@ from gaggiuino_api.models import (
     GaggiuinoVersions,
     GaggiuinoSettings,
 )
-from gaggiuino_api.tools import strtobool
+from gaggiuino_api.retry import GaggiuinoEndpointStats, GaggiuinoRetryPolicy
+from gaggiuino_api.shot_cache import GaggiuinoShotCache
+from gaggiuino_api.sse import GaggiuinoEvent, GaggiuinoEventParser
+from gaggiuino_api.stream import GaggiuinoShotStreamParser
+from gaggiuino_api.tools import endpoint_path, strtobool
+from gaggiuino_api.transport import GaggiuinoTransport, GaggiuinoTransportStats
 
 if sys.platform == "win32" and strtobool(
     os.getenv("GAGGIUINO_DISABLE_WIN_SELECTOR", "False")
@@ -52,12 +74,37 @@ class GaggiuinoClient:
         session: ClientSession | None = None,
         *,
         timeout: float | ClientTimeout | None = None,
+        transport: GaggiuinoTransport | None = None,
+        cache: GaggiuinoResponseCache | None = None,
+        json_backend: GaggiuinoJSONBackend | str | None = None,
+        retry_policy: GaggiuinoRetryPolicy | None = None,
+        circuit_breaker: GaggiuinoCircuitBreaker | None = None,
+        rate_limiter: GaggiuinoRateLimiter | None = None,
     ):
         self.session = session
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        # Keyed by 'METHOD /api/path' with numeric segments as {id}
+        self.endpoint_stats: dict[str, GaggiuinoEndpointStats] = {}
+        if not isinstance(json_backend, GaggiuinoJSONBackend):
+            json_backend = get_json_backend(json_backend)
+        self.json_backend = json_backend
+        # Only applied to the session created in connect()
+        self.transport = transport or GaggiuinoTransport()
+        self.transport_stats = GaggiuinoTransportStats()
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        # Bumped by invalidate(), responses of requests started before are
+        # not cached
+        self._generation = 0
+        self._url_generations: dict[str, int] = {}
+        self.coalesced_requests = 0
         # Normalize base_url to avoid trailing slash duplication
         self.base_url = base_url.rstrip("/")
         self.headers = {}
         self.post_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        self.json_headers = {"Content-Type": "application/json"}
         self.close_session = False
         if isinstance(timeout, ClientTimeout):
             self._client_timeout = timeout
@@ -85,7 +132,10 @@ class GaggiuinoClient:
         if self.session is None:
             self.close_session = True
             self.session = ClientSession(
-                headers=self.headers, timeout=self._client_timeout
+                headers=self.headers,
+                timeout=self._client_timeout,
+                connector=self.transport.create_connector(),
+                trace_configs=[self.transport_stats.trace_config()],
             )
 
     async def disconnect(self) -> None:
@@ -103,36 +153,182 @@ class GaggiuinoClient:
         *,
         json_response: bool = False,
         json_data: dict[str, Any] | None = None,
+        stream_parser: Callable[[], GaggiuinoShotStreamParser] | None = None,
+        priority: int | None = None,
     ) -> bool | dict[str, Any]:
         """Shared request handler.
 
+        Idempotent requests failing with a connection error or timeout are
+        retried according to retry_policy, if given; without it a request is
+        sent once and waits at most timeout. While circuit_breaker is open,
+        requests fail fast with GaggiuinoCircuitOpenError. Every attempt waits
+        for its turn from rate_limiter.
+
         Args:
             method: HTTP method to use
             url: Target URL
             params: Request parameters
             json_response: Whether to parse response as JSON
             json_data: JSON payload to send in POST/DELETE requests
+            stream_parser: Factory of an incremental parser fed with the
+                response body as it arrives instead of buffering it
+            priority: Rate limiter lane, PRIORITY_HIGH for writes and
+                PRIORITY_NORMAL for reads if None
 
         Returns:
             JSON data if json_response=True, otherwise bool indicating success
         """
+        if priority is None:
+            priority = PRIORITY_NORMAL if method == "GET" else PRIORITY_HIGH
+
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            await self._check_circuit(breaker)
+
+        try:
+            result = await self._retry(
+                method,
+                url,
+                params,
+                json_response=json_response,
+                json_data=json_data,
+                stream_parser=stream_parser,
+                priority=priority,
+            )
+        except (GaggiuinoConnectionError, GaggiuinoConnectionTimeoutError):
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    async def _check_circuit(self, breaker: GaggiuinoCircuitBreaker) -> None:
+        """Reject requests while the circuit is open, probe once half-open.
+
+        Only the first caller after the circuit turned half-open probes the
+        machine, the others are rejected at once instead of waiting for it.
+        """
+        state = breaker.state
+        if state == "closed":
+            return
+        if state == "half_open" and not breaker.probe_lock.locked():
+            async with breaker.probe_lock:
+                reachable = await self._probe()
+            if reachable:
+                _LOGGER.info("%s is reachable again", self.base_url)
+                breaker.record_success()
+                return
+            breaker.record_failure()
+        if breaker.probe_lock.locked():
+            raise GaggiuinoCircuitOpenError(
+                f"{self.base_url} is unreachable, probe in progress"
+            )
+        raise GaggiuinoCircuitOpenError(
+            f"{self.base_url} is unreachable, next probe in {breaker.retry_in:.0f}s"
+        )
+
+    async def _probe(self) -> bool:
+        """Check whether the machine answers again after the circuit opened."""
+        try:
+            await self._probe_send(self.base_url, json_response=False)
+        except GaggiuinoError:
+            return False
+        return True
+
+    async def _probe_send(
+        self, url: str, *, json_response: bool
+    ) -> bool | dict[str, Any]:
+        """Send a single GET attempt, bypassing the breaker, retries and cache."""
+        return await self._send(
+            "GET",
+            url,
+            None,
+            timeout=self.timeout,
+            json_response=json_response,
+            json_data=None,
+            stream_parser=None,
+            priority=PRIORITY_NORMAL,
+        )
+
+    async def _retry(
+        self,
+        method: Literal["GET", "POST", "DELETE"],
+        url: str,
+        params: dict | None,
+        **kwargs,
+    ) -> bool | dict[str, Any]:
+        """Send a request, retrying it according to retry_policy."""
+        endpoint = endpoint_path(url)
+        stats = self.endpoint_stats.setdefault(
+            f"{method} {endpoint}", GaggiuinoEndpointStats()
+        )
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            timeout = self.timeout
+            if policy is not None and policy.deadline is not None:
+                remaining = policy.deadline - (time.monotonic() - started)
+                # Never zero, which would disable the timeout
+                timeout = min(timeout, max(remaining, 0.001))
+            try:
+                result = await self._send(
+                    method, url, params, timeout=timeout, **kwargs
+                )
+            except Exception as err:
+                elapsed = time.monotonic() - started
+                if policy is None or attempt >= policy.attempts:
+                    stats.record(attempt, elapsed, failed=True)
+                    raise
+                delay = policy.delay(attempt)
+                if not policy.should_retry(method, endpoint, err) or (
+                    policy.deadline is not None and elapsed + delay >= policy.deadline
+                ):
+                    stats.record(attempt, elapsed, failed=True)
+                    raise
+                _LOGGER.debug(
+                    "%s %s failed (%s), retrying in %.2fs", method, url, err, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            stats.record(attempt, time.monotonic() - started)
+            return result
+
+    async def _send(
+        self,
+        method: Literal["GET", "POST", "DELETE"],
+        url: str,
+        params: dict | None,
+        *,
+        timeout: float,
+        json_response: bool,
+        json_data: dict[str, Any] | None,
+        stream_parser: Callable[[], GaggiuinoShotStreamParser] | None,
+        priority: int,
+    ) -> bool | dict[str, Any]:
+        """Send a single request attempt, see _request."""
         assert self.session is not None, "Session not created"
 
         # Prepare request args
         is_get = method == "GET"
         data = None
-        json_body = None
+        headers = self.headers
         if not is_get:
             if json_data is not None:
-                json_body = json_data
-            elif params is not None:
-                data = urllib_parse.urlencode(params)
-        headers = (
-            self.post_headers
-            if method in ["POST", "DELETE"] and json_data is None
-            else self.headers
-        )
-
+                data = self.json_backend.dumps(json_data)
+                headers = self.json_headers
+            else:
+                if params is not None:
+                    data = urllib_parse.urlencode(params)
+                headers = self.post_headers
+
+        limiter = self.rate_limiter
+        if limiter is not None:
+            await limiter.acquire(priority)
+        started = time.perf_counter()
         try:
             async with self.session.request(
                 method,
@@ -140,16 +336,25 @@ class GaggiuinoClient:
                 params=params if is_get else None,
                 data=data,
                 headers=headers,
-                json=json_body,
-                timeout=self.timeout,
+                timeout=ClientTimeout(total=timeout),
             ) as response:
                 _LOGGER.debug("%s %s -> %s", method, url, response.status)
                 if response.status == 404:
                     raise GaggiuinoEndpointNotFoundError("endpoint not found")
 
+                if stream_parser is not None:
+                    parser = stream_parser()
+                    async for chunk in response.content.iter_chunked(
+                        DEFAULT_STREAM_CHUNK_SIZE
+                    ):
+                        parser.feed(chunk)
+                    return parser.close()
                 if not json_response:
                     return response.status == 200
-                return await response.json()
+                body = await response.read()
+                if not body.strip():
+                    return None
+                return self.json_backend.loads(body)
 
         except ClientConnectionError as err:
             raise GaggiuinoConnectionError("Connection failed") from err
@@ -161,6 +366,10 @@ class GaggiuinoClient:
             raise GaggiuinoError(
                 f"Unhandled exception: {type(err)}: {str(err)}"
             ) from err
+        finally:
+            self.transport_stats.record_request(time.perf_counter() - started)
+            if limiter is not None:
+                limiter.release()
 
     async def post(self, url: str, params: dict | None = None, **kwargs) -> bool:
         """Send POST request.
@@ -195,6 +404,10 @@ class GaggiuinoClient:
     ) -> dict[str, Any] | list[dict[str, Any]]:
         """Send GET request.
 
+        Concurrent identical requests share a single round-trip and responses
+        may be served from the cache, so callers can receive the same response
+        object and must not mutate it.
+
         Args:
             url: Target URL (defaults to base_url)
             params: Query parameters
@@ -204,9 +417,143 @@ class GaggiuinoClient:
             JSON response data
         """
         url = url or self.base_url
-        return await self._request(
-            "GET", url, params, json_response=json_response, **kwargs
+        key = (url, tuple(sorted((params or {}).items())), json_response)
+        if self.cache is not None:
+            hit, cached = self.cache.get(key)
+            if hit:
+                return cached
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self.coalesced_requests += 1
+            return await asyncio.shield(pending)
+
+        pending = asyncio.ensure_future(
+            self._fetch(key, url, params, json_response=json_response, **kwargs)
         )
+        self._in_flight[key] = pending
+        pending.add_done_callback(lambda future: self._forget_in_flight(key, future))
+        # Keep the round-trip alive for the followers if the first caller is
+        # cancelled
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self, key: tuple, url: str, params: dict | None, **kwargs
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        generation = self._cache_generation(url)
+        result = await self._request("GET", url, params, **kwargs)
+        # A write invalidated the URL while the request was in flight
+        if self.cache is not None and generation == self._cache_generation(url):
+            self.cache.set(key, url, result)
+        return result
+
+    def _cache_generation(self, url: str) -> tuple[int, int]:
+        return self._generation, self._url_generations.get(url, 0)
+
+    def invalidate(self, *urls: str) -> None:
+        """Drop cached responses of the given URLs.
+
+        Requests of these URLs already in flight are no longer shared with
+        later callers and their responses are not cached.
+
+        Args:
+            urls: URLs whose cached responses are dropped, all if none given
+        """
+        if not urls:
+            self._generation += 1
+            self._url_generations.clear()
+            self._in_flight.clear()
+            if self.cache is not None:
+                self.cache.clear()
+            return
+        for url in urls:
+            self._url_generations[url] = self._url_generations.get(url, 0) + 1
+            if self.cache is not None:
+                self.cache.invalidate(url)
+        for key in [_ for _ in self._in_flight if _[0] in urls]:
+            del self._in_flight[key]
+
+    def _forget_in_flight(self, key: tuple, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the error as retrieved when every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    async def events(
+        self,
+        url: str | None = None,
+        *,
+        last_event_id: str | None = None,
+        reconnect: bool = True,
+    ) -> AsyncIterator[GaggiuinoEvent]:
+        """Subscribe to the Server-Sent Events stream.
+
+        The stream is reopened after network errors or when the device closes
+        it, resuming after the last received event ID.
+
+        Args:
+            url: Stream URL (defaults to base_url + DEFAULT_EVENTS_PATH)
+            last_event_id: Event ID to resume after
+            reconnect: Whether to reopen the stream once it ends or fails
+
+        Yields:
+            Received events
+        """
+        assert self.session is not None, "Session not created"
+
+        url = url or f"{self.base_url}{DEFAULT_EVENTS_PATH}"
+        parser = GaggiuinoEventParser(last_event_id)
+        # The stream stays open indefinitely, only detect a silent device
+        timeout = ClientTimeout(total=None, sock_read=DEFAULT_EVENTS_READ_TIMEOUT)
+
+        while True:
+            headers = {
+                **self.headers,
+                "Accept": "text/event-stream",
+                "Cache-Control": "no-cache",
+            }
+            if parser.last_event_id is not None:
+                headers["Last-Event-ID"] = parser.last_event_id
+
+            try:
+                async with self.session.get(
+                    url, headers=headers, timeout=timeout
+                ) as response:
+                    _LOGGER.debug("GET %s -> %s", url, response.status)
+                    if response.status == 404:
+                        raise GaggiuinoEndpointNotFoundError("endpoint not found")
+                    if response.status != 200:
+                        raise GaggiuinoConnectionError(
+                            f"Event stream refused with status {response.status}"
+                        )
+
+                    async for line in response.content:
+                        event = parser.feed_line(line.decode("utf-8").rstrip("\r\n"))
+                        if event is not None:
+                            yield event
+
+            except ClientConnectionError as err:
+                if not reconnect:
+                    raise GaggiuinoConnectionError("Connection failed") from err
+                _LOGGER.debug("Event stream %s lost: %s", url, err)
+            except asyncio.TimeoutError as err:
+                if not reconnect:
+                    raise GaggiuinoConnectionTimeoutError from err
+                _LOGGER.debug("Event stream %s timed out", url)
+            except GaggiuinoConnectionError:
+                if not reconnect:
+                    raise
+                _LOGGER.debug("Event stream %s refused", url)
+
+            parser.discard()
+            if not reconnect:
+                return
+
+            delay = DEFAULT_EVENTS_RETRY
+            if parser.retry is not None:
+                delay = parser.retry / 1000
+            await asyncio.sleep(delay)
 
 
 class GaggiuinoAPI(GaggiuinoClient):
@@ -216,9 +563,27 @@ class GaggiuinoAPI(GaggiuinoClient):
         *,
         session: ClientSession | None = None,
         timeout: float | ClientTimeout | None = None,
+        transport: GaggiuinoTransport | None = None,
+        cache: GaggiuinoResponseCache | None = None,
+        shot_cache: GaggiuinoShotCache | None = None,
+        json_backend: GaggiuinoJSONBackend | str | None = None,
+        retry_policy: GaggiuinoRetryPolicy | None = None,
+        circuit_breaker: GaggiuinoCircuitBreaker | None = None,
+        rate_limiter: GaggiuinoRateLimiter | None = None,
     ) -> None:
-        super().__init__(base_url=base_url, session=session, timeout=timeout)
+        super().__init__(
+            base_url=base_url,
+            session=session,
+            timeout=timeout,
+            transport=transport,
+            cache=cache,
+            json_backend=json_backend,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+        )
         self.api_base = f"{self.base_url}/api"
+        self.shot_cache = shot_cache
         self._profile: GaggiuinoProfile | None = None
         self._profiles: list[GaggiuinoProfile] | None = None
         self._status: GaggiuinoStatus | None = None
@@ -260,7 +625,7 @@ class GaggiuinoAPI(GaggiuinoClient):
         if profiles is None:
             return None
 
-        self._profiles = [GaggiuinoProfile(**_) for _ in profiles]
+        self._profiles = [GaggiuinoProfile.from_dict(_) for _ in profiles]
         return self._profiles
 
     async def _select_profile(self, profile_id: int) -> bool:
@@ -273,7 +638,10 @@ class GaggiuinoAPI(GaggiuinoClient):
             True if successful
         """
         url = f"{self.api_base}/profile-select/{profile_id}"
-        return await self.post(url)
+        result = await self.post(url)
+        if result:
+            self.invalidate(f"{self.api_base}/profiles/all")
+        return result
 
     async def select_profile(self, profile: GaggiuinoProfile | int) -> bool:
         """Select a profile.
@@ -300,7 +668,10 @@ class GaggiuinoAPI(GaggiuinoClient):
             True if successful
         """
         url = f"{self.api_base}/profile-select/{profile_id}"
-        return await self.delete(url)
+        result = await self.delete(url)
+        if result:
+            self.invalidate(f"{self.api_base}/profiles/all")
+        return result
 
     async def delete_profile(self, profile: GaggiuinoProfile | int) -> bool:
         """Delete a profile.
@@ -317,33 +688,142 @@ class GaggiuinoAPI(GaggiuinoClient):
 
         return await self._delete_profile(profile_id=profile_id)
 
-    async def _get_shot(self, shot_id: int | Literal["latest"]) -> dict:
+    async def _get_shot(
+        self,
+        shot_id: int | Literal["latest"],
+        stream: bool = False,
+        priority: int = PRIORITY_NORMAL,
+    ) -> dict:
         """Get shot data by ID.
 
         Args:
             shot_id: Shot ID or 'latest'
+            stream: Parse the response while it downloads, see get_shot
+            priority: Rate limiter lane
 
         Returns:
             Raw shot data
         """
         url = f"{self.api_base}/shots/{shot_id}"
-        return await self.get(url)
+        if stream:
+            return await self._request(
+                "GET", url, stream_parser=GaggiuinoShotStreamParser, priority=priority
+            )
+        return await self.get(url, priority=priority)
 
-    async def get_shot(self, shot_id: int) -> GaggiuinoShot | None:
+    async def get_shot(
+        self, shot_id: int, *, stream: bool = False, priority: int = PRIORITY_NORMAL
+    ) -> GaggiuinoShot | None:
         """Retrieve shot data.
 
         Args:
             shot_id: Shot ID to retrieve
+            stream: Parse the response while it downloads, packing the
+                datapoints straight into arrays instead of buffering the whole
+                body. Streamed requests are not coalesced.
+            priority: Rate limiter lane
 
         Returns:
             Shot data or None
         """
-        shot = await self._get_shot(shot_id)
+        shot = None
+        if self.shot_cache is not None:
+            shot = await asyncio.to_thread(self.shot_cache.get, shot_id)
+
+        if shot is None:
+            shot = await self._get_shot(shot_id, stream=stream, priority=priority)
+            if shot is not None and self.shot_cache is not None:
+                await asyncio.to_thread(self.shot_cache.put, shot_id, shot)
+
         if shot is None:
             _LOGGER.debug("Couldn't retrieve shot %s", shot_id)
             return None
 
-        return GaggiuinoShot(**shot)
+        return GaggiuinoShot.from_dict(shot)
+
+    async def get_shots(
+        self,
+        shot_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_SHOT_CONCURRENCY,
+        ordered: bool = False,
+        progress: Callable[[int, int], Any] | None = None,
+        stream: bool = False,
+        priority: int = PRIORITY_LOW,
+    ) -> AsyncIterator[GaggiuinoShot]:
+        """Retrieve many shots concurrently.
+
+        Deleted shots are skipped. Any other error stops the download and is
+        raised from the iterator.
+
+        Args:
+            shot_ids: Shot IDs to retrieve, e.g. range(1, latest + 1)
+            concurrency: Maximum number of shots downloaded at once
+            ordered: Yield shots in the order of shot_ids instead of as they
+                complete
+            progress: Callable receiving the number of processed and total shots
+            stream: Parse each response while it downloads, see get_shot
+            priority: Rate limiter lane, by default behind interactive requests
+
+        Yields:
+            Shot data
+
+        Raises:
+            ValueError: concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        shot_ids = list(shot_ids)
+        total = len(shot_ids)
+        if not total:
+            return
+
+        pending = iter(enumerate(shot_ids))
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def _worker() -> None:
+            # Workers share one iterator, so every shot is fetched exactly once
+            for index, shot_id in pending:
+                try:
+                    shot = await self.get_shot(
+                        shot_id, stream=stream, priority=priority
+                    )
+                except GaggiuinoEndpointNotFoundError:
+                    _LOGGER.debug("Shot %s not found, skipping", shot_id)
+                    shot = None
+                except Exception as err:
+                    await results.put((index, None, err))
+                    return
+                await results.put((index, shot, None))
+
+        workers = [
+            asyncio.create_task(_worker()) for _ in range(min(concurrency, total))
+        ]
+        buffered: dict[int, GaggiuinoShot | None] = {}
+        next_index = 0
+        try:
+            for done in range(1, total + 1):
+                index, shot, error = await results.get()
+                if error is not None:
+                    raise error
+                if progress is not None:
+                    progress(done, total)
+
+                if not ordered:
+                    if shot is not None:
+                        yield shot
+                    continue
+
+                buffered[index] = shot
+                while next_index in buffered:
+                    shot = buffered.pop(next_index)
+                    next_index += 1
+                    if shot is not None:
+                        yield shot
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
     async def get_status(self) -> GaggiuinoStatus | None:
         """Retrieve system status.
@@ -360,6 +840,32 @@ class GaggiuinoAPI(GaggiuinoClient):
 
         return None
 
+    async def status_events(
+        self, url: str | None = None
+    ) -> AsyncIterator[GaggiuinoStatus]:
+        """Receive system status pushed over Server-Sent Events.
+
+        Events that do not carry a status payload are skipped.
+
+        Args:
+            url: Stream URL (defaults to base_url + DEFAULT_EVENTS_PATH)
+
+        Yields:
+            System status
+        """
+        async for event in self.events(url):
+            try:
+                data = self.json_backend.loads(event.data)
+                if isinstance(data, list):
+                    data = data[0]
+                status = GaggiuinoStatus.from_dict(data)
+            except (ValueError, TypeError, KeyError, IndexError) as err:
+                _LOGGER.debug("Skipping %s event: %s", event.event, err)
+                continue
+
+            self._status = status
+            yield status
+
     async def get_latest_shot_id(self) -> GaggiuinoLatestShotResult | None:
         """Retrieve latest shot ID.
 
@@ -383,7 +889,11 @@ class GaggiuinoAPI(GaggiuinoClient):
             True if update initiated successfully
         """
         url = f"{self.api_base}/firmware/update-all"
-        return await self.post(url, json_data={"version": version})
+        result = await self.post(url, json_data={"version": version})
+        if result:
+            # Versions and possibly settings change with the firmware
+            self.invalidate()
+        return result
 
     async def get_firmware_progress(self) -> dict[str, Any]:
         """Get firmware update progress status.
@@ -415,8 +925,32 @@ class GaggiuinoAPI(GaggiuinoClient):
             _LOGGER.debug("Healthy check failed: %s", e)
             return False
 
+    async def _probe(self) -> bool:
+        try:
+            health = await self._probe_send(
+                f"{self.api_base}/health", json_response=True
+            )
+        except GaggiuinoError:
+            return False
+        return isinstance(health, dict) and health.get("status") == "ok"
+
     # Settings API Methods
 
+    async def _post_settings(self, url: str, data: dict[str, Any]) -> bool:
+        """Post a settings category and drop its cached responses.
+
+        Args:
+            url: Settings category URL
+            data: Settings payload
+
+        Returns:
+            True if successful
+        """
+        result = await self.post(url, json_data=data)
+        if result:
+            self.invalidate(url, f"{self.api_base}/settings")
+        return result
+
     async def get_settings(self) -> GaggiuinoSettings | None:
         """Retrieve all settings in a single response.
 
@@ -460,7 +994,7 @@ class GaggiuinoAPI(GaggiuinoClient):
             data = settings.to_api_dict()
         else:
             data = settings
-        return await self.post(url, json_data=data)
+        return await self._post_settings(url, data)
 
     async def get_system_settings(self) -> GaggiuinoSystemSettings | None:
         """Retrieve system-level settings.
@@ -493,7 +1027,7 @@ class GaggiuinoAPI(GaggiuinoClient):
             data = settings.to_api_dict()
         else:
             data = settings
-        return await self.post(url, json_data=data)
+        return await self._post_settings(url, data)
 
     async def get_theme_settings(self) -> GaggiuinoThemeSettings | None:
         """Retrieve theme color settings.
@@ -527,7 +1061,7 @@ class GaggiuinoAPI(GaggiuinoClient):
             data = settings.to_api_dict()
         else:
             data = settings
-        return await self.post(url, json_data=data)
+        return await self._post_settings(url, data)
 
     async def get_display_settings(self) -> GaggiuinoDisplaySettings | None:
         """Retrieve display-related settings.
@@ -559,7 +1093,7 @@ class GaggiuinoAPI(GaggiuinoClient):
             data = settings.to_api_dict()
         else:
             data = settings
-        return await self.post(url, json_data=data)
+        return await self._post_settings(url, data)
 
     async def get_scales_settings(self) -> GaggiuinoScalesSettings | None:
         """Retrieve scales-related settings.
@@ -591,7 +1125,7 @@ class GaggiuinoAPI(GaggiuinoClient):
             data = settings.to_api_dict()
         else:
             data = settings
-        return await self.post(url, json_data=data)
+        return await self._post_settings(url, data)
 
     async def get_led_settings(self) -> GaggiuinoLedSettings | None:
         """Retrieve LED-related settings.
@@ -623,7 +1157,7 @@ class GaggiuinoAPI(GaggiuinoClient):
             data = settings.to_api_dict()
         else:
             data = settings
-        return await self.post(url, json_data=data)
+        return await self._post_settings(url, data)
 
     async def get_versions(self) -> GaggiuinoVersions | None:
         """Retrieve version information for all system components.
@@ -0,0 +1,66 @@
+"""Circuit breaker for Gaggiuino"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Literal
+
+from gaggiuino_api.const import (
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RESET_TIMEOUT,
+)
+
+
+class GaggiuinoCircuitBreaker:
+    """Fail fast while a machine is unreachable.
+
+    The circuit opens after ``failure_threshold`` consecutive requests failed
+    with a connection error or timeout, and requests are then rejected at once
+    instead of each waiting for the timeout. After ``reset_timeout`` seconds
+    the circuit is half-open: a single health probe without retries decides
+    whether it closes again or stays open for another ``reset_timeout``, and
+    requests arriving during the probe are rejected as well.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: float | None = None
+        # Held during the half-open probe, other callers fail fast meanwhile
+        self.probe_lock = asyncio.Lock()
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the circuit turns half-open, 0 if not open."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.trips += 1
+            self.opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        self.record_success()
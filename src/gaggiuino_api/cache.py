@@ -0,0 +1,101 @@
+"""Response caching for Gaggiuino"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+from urllib import parse as urllib_parse
+
+from gaggiuino_api.const import DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_POLICIES
+
+
+class GaggiuinoResponseCache:
+    """LRU cache of decoded GET responses with a lifetime per API path.
+
+    Policies map a path prefix (e.g. ``/api/settings``) to a lifetime in
+    seconds; the longest matching prefix applies and responses of paths
+    without a policy are not stored.
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, float] | None = None,
+        *,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        if policies is None:
+            policies = DEFAULT_CACHE_POLICIES
+        # Longest prefix first so the first match is the most specific one
+        self.policies = dict(
+            sorted(policies.items(), key=lambda item: len(item[0]), reverse=True)
+        )
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[str, float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, url: str) -> float | None:
+        """Lifetime of responses for the URL or None if it is not cached."""
+        path = urllib_parse.urlsplit(url).path
+        for prefix, ttl in self.policies.items():
+            if path == prefix or path.startswith(f"{prefix}/"):
+                return ttl if ttl > 0 else None
+        return None
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a response.
+
+        Returns:
+            Tuple of a hit flag and the cached response
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        _url, expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, url: str, value: Any) -> None:
+        """Store a response if the URL has a caching policy."""
+        ttl = self.ttl(url)
+        if ttl is None:
+            return
+
+        self._entries[key] = (url, time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, url: str, *, prefix: bool = False) -> int:
+        """Drop the responses of a URL.
+
+        Args:
+            url: URL whose responses are dropped
+            prefix: Also drop the responses of every URL below it
+
+        Returns:
+            Number of dropped responses
+        """
+        stale = [
+            key
+            for key, (entry_url, _expires, _value) in self._entries.items()
+            if entry_url == url or (prefix and entry_url.startswith(f"{url}/"))
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
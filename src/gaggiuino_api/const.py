@@ -1,2 +1,89 @@
 DEFAULT_BASE_URL = 'http://gaggiuino.local'
 DEFAULT_TIMEOUT = 5.0
+
+# The ESP32 web server only tolerates a handful of concurrent sockets
+DEFAULT_CONNECTION_LIMIT = 4
+DEFAULT_LIMIT_PER_HOST = 2
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_DNS_CACHE_TTL = 300
+
+DEFAULT_EVENTS_PATH = '/events'
+DEFAULT_EVENTS_RETRY = 3.0
+DEFAULT_EVENTS_READ_TIMEOUT = 30.0
+
+DEFAULT_POLL_IDLE_INTERVAL = 30.0
+DEFAULT_POLL_HEATING_INTERVAL = 5.0
+DEFAULT_POLL_SHOT_INTERVAL = 0.5
+# Temperature gap (°C) and pressure (bar) that mark the machine as busy
+DEFAULT_POLL_TEMPERATURE_DELTA = 2.0
+DEFAULT_POLL_PRESSURE_THRESHOLD = 0.5
+
+DEFAULT_CACHE_MAX_ENTRIES = 128
+# Response cache lifetime in seconds per API path prefix, the longest prefix wins.
+# Paths without a policy (e.g. system status) are never cached.
+DEFAULT_CACHE_POLICIES = {
+    '/api/settings': 300.0,
+    '/api/settings/versions': 6 * 3600.0,
+    '/api/profiles/all': 300.0,
+}
+
+DEFAULT_SHOT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+DEFAULT_SHOT_CONCURRENCY = DEFAULT_LIMIT_PER_HOST
+
+# Read size when streaming shot responses
+DEFAULT_STREAM_CHUNK_SIZE = 16 * 1024
+
+# Request retries, times in seconds
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.2
+DEFAULT_RETRY_MAX_BACKOFF = 2.0
+DEFAULT_RETRY_DEADLINE = 15.0
+
+# Circuit breaker, reset timeout in seconds
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30.0
+
+# Client-side rate limiting, rate in requests per second
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_RATE_BURST = 5
+DEFAULT_MAX_IN_FLIGHT = DEFAULT_LIMIT_PER_HOST
+
+# Request priorities, lower values are served first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# Machines queried at once by a fleet
+DEFAULT_FLEET_CONCURRENCY = 16
+
+# Device discovery, times in seconds
+DEFAULT_DISCOVERY_TIMEOUT = 0.5
+DEFAULT_DISCOVERY_CONCURRENCY = 256
+DEFAULT_DISCOVERY_TTL = 300.0
+# Shortest IPv4 prefix a scan accepts, /16 is 65534 addresses
+MIN_SCAN_PREFIXLEN = 16
+
+# Datapoints are integers scaled by 10, timeInShot is in tenths of a second
+DATAPOINT_SCALE = 10.0
+MS_PER_TIME_IN_SHOT = 100
+
+# Resampling grid spacing in timeInShot units (tenths of a second)
+DEFAULT_RESAMPLE_PERIOD = 1.0
+
+# Scale reading in grams taken as the first drip of a shot
+DEFAULT_FIRST_DRIP_WEIGHT = 0.5
+
+# Profile simulation, time in milliseconds for phases without a time limit
+DEFAULT_SIMULATED_PHASE_TIME = 10000
+DEFAULT_SIMULATION_CACHE_SIZE = 128
+
+# Deviation from the targets still counted as on target, in bar, ml/s and °C
+DEFAULT_PRESSURE_TOLERANCE = 0.5
+DEFAULT_FLOW_TOLERANCE = 0.5
+DEFAULT_TEMPERATURE_TOLERANCE = 2.0
+
+# Shot similarity index, curves sampled every second for the first minute
+DEFAULT_INDEX_PERIOD = 10.0
+DEFAULT_INDEX_POINTS = 60
+DEFAULT_NEIGHBOURS = 10
@@ -0,0 +1,188 @@
+"""Shot deviation from target scoring for Gaggiuino"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable
+
+from gaggiuino_api.analytics import iter_archive
+from gaggiuino_api.const import (
+    DATAPOINT_SCALE,
+    DEFAULT_FLOW_TOLERANCE,
+    DEFAULT_PRESSURE_TOLERANCE,
+    DEFAULT_TEMPERATURE_TOLERANCE,
+)
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.shot_cache import GaggiuinoShotCache
+from gaggiuino_api.tools import optional_numpy
+
+# Scored series with their target series
+_TARGETS = {
+    "pressure": "targetPressure",
+    "pumpFlow": "targetPumpFlow",
+    "temperature": "targetTemperature",
+}
+DEFAULT_TOLERANCES = {
+    "pressure": DEFAULT_PRESSURE_TOLERANCE,
+    "pumpFlow": DEFAULT_FLOW_TOLERANCE,
+    "temperature": DEFAULT_TEMPERATURE_TOLERANCE,
+}
+
+
+@dataclass(frozen=True)
+class GaggiuinoShotDeviation:
+    """
+    {
+        'shotId': 1,
+        'series': 'pressure',
+        'phaseIndex': None,
+        'rmse': 0.42,
+        'maxError': 1.8,
+        'timeInTolerance': 0.87
+    }
+
+    Field Notes:
+    - series: 'pressure', 'pumpFlow' or 'temperature', scored against its
+      target series in bar, ml/s and °C
+    - phaseIndex: Profile phase the row covers (see GaggiuinoShotPhase), None
+      for the whole shot
+    - timeInTolerance: Share of the time the series stayed within the
+      tolerance of its target, each sample counting until the next one. None
+      when the samples span no time.
+    """
+
+    shotId: int
+    series: str
+    phaseIndex: int | None
+    rmse: float
+    maxError: float
+    timeInTolerance: float | None = None
+
+
+def score_shots(
+    shots: Iterable[GaggiuinoShot] | GaggiuinoShotCache,
+    *,
+    tolerances: dict[str, float] | None = None,
+    use_numpy: bool | None = None,
+) -> list[GaggiuinoShotDeviation]:
+    """Score how closely shots tracked their targets.
+
+    Each shot is scored in one pass over its samples: with NumPy the errors
+    of a series are computed once and reduced per phase from running sums.
+    Series without their target are skipped. Scores computed with the
+    default tolerances are also cached on the shots, see
+    GaggiuinoShot.deviation.
+
+    Args:
+        shots: Shots or a shot cache holding an archive
+        tolerances: Allowed deviation by series in bar, ml/s and °C, merged
+            over DEFAULT_TOLERANCES
+        use_numpy: True to require NumPy, False for pure Python, None to use
+            NumPy when installed
+
+    Returns:
+        Per shot in order, a row per series for the whole shot followed by a
+        row per series for each reached phase
+
+    Raises:
+        ValueError: A series of a different length than timeInShot
+    """
+    if isinstance(shots, GaggiuinoShotCache):
+        shots = iter_archive(shots)
+    default = not tolerances
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    numpy = optional_numpy(use_numpy)
+
+    scores = []
+    for shot in shots:
+        rows = _score(numpy, shot, tolerances)
+        if default:
+            # GaggiuinoShot.deviation is a cached_property
+            shot.__dict__["deviation"] = rows
+        scores.extend(rows)
+    return scores
+
+
+def _score(
+    numpy, shot: GaggiuinoShot, tolerances: dict[str, float]
+) -> list[GaggiuinoShotDeviation]:
+    datapoints = shot.datapoints
+    times = datapoints.timeInShot
+    if not times:
+        return []
+    # Whole shot first, then the phases
+    ranges = [(None, 0, len(times))] + [
+        (_.phaseIndex, _.start, _.end) for _ in shot.segments
+    ]
+    score = _score_numpy if numpy is not None else _score_python
+
+    stats = {}
+    for name, target in _TARGETS.items():
+        values = getattr(datapoints, name)
+        expected = getattr(datapoints, target)
+        if values is None or expected is None:
+            continue
+        limit = tolerances[name] * DATAPOINT_SCALE
+        stats[name] = score(numpy, times, values, expected, limit, ranges)
+
+    return [
+        GaggiuinoShotDeviation(shot.id, name, index, *series[i])
+        for i, (index, _, _) in enumerate(ranges)
+        for name, series in stats.items()
+    ]
+
+
+def _score_python(numpy, times, values, expected, limit, ranges) -> list[tuple]:
+    # Running sums of the squared errors and of the time within tolerance
+    count = len(times)
+    errors = [abs(a - b) for a, b in zip(values, expected)]
+    squares = [0]
+    inside = [0]
+    for i, error in enumerate(errors):
+        squares.append(squares[-1] + error * error)
+        within = times[i + 1] - times[i] if error <= limit and i + 1 < count else 0
+        inside.append(inside[-1] + within)
+
+    stats = []
+    for _, start, end in ranges:
+        span = times[min(end, count - 1)] - times[start]
+        stats.append(
+            (
+                math.sqrt((squares[end] - squares[start]) / (end - start))
+                / DATAPOINT_SCALE,
+                max(errors[start:end]) / DATAPOINT_SCALE,
+                (inside[end] - inside[start]) / span if span > 0 else None,
+            )
+        )
+    return stats
+
+
+def _score_numpy(numpy, times, values, expected, limit, ranges) -> list[tuple]:
+    times = numpy.frombuffer(times, dtype=times.typecode).astype(numpy.float64)
+    values = numpy.frombuffer(values, dtype=values.typecode).astype(numpy.float64)
+    expected = numpy.frombuffer(expected, dtype=expected.typecode)
+    errors = numpy.abs(values - expected)
+    intervals = numpy.append(numpy.diff(times), 0.0)
+
+    # Running sums of the squared errors and of the time within tolerance
+    squares = numpy.concatenate(([0.0], numpy.cumsum(errors * errors)))
+    inside = numpy.concatenate(
+        ([0.0], numpy.cumsum(numpy.where(errors <= limit, intervals, 0.0)))
+    )
+    starts = numpy.array([start for _, start, _ in ranges])
+    ends = numpy.array([end for _, _, end in ranges])
+    spans = times[numpy.minimum(ends, len(times) - 1)] - times[starts]
+    rmse = (
+        numpy.sqrt((squares[ends] - squares[starts]) / (ends - starts))
+        / DATAPOINT_SCALE
+    )
+    ratio = (inside[ends] - inside[starts]) / numpy.where(spans > 0, spans, 1.0)
+    worst = [
+        float(errors[start:end].max()) / DATAPOINT_SCALE for _, start, end in ranges
+    ]
+
+    return [
+        (float(rmse[i]), worst[i], float(ratio[i]) if spans[i] > 0 else None)
+        for i in range(len(ranges))
+    ]
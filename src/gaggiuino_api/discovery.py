@@ -0,0 +1,218 @@
+"""Device discovery for Gaggiuino"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Type
+from urllib.parse import urlsplit
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from gaggiuino_api.api import GaggiuinoAPI
+from gaggiuino_api.const import (
+    DEFAULT_BASE_URL,
+    DEFAULT_DISCOVERY_CONCURRENCY,
+    DEFAULT_DISCOVERY_TIMEOUT,
+    DEFAULT_DISCOVERY_TTL,
+    MIN_SCAN_PREFIXLEN,
+)
+from gaggiuino_api.exceptions import GaggiuinoError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GaggiuinoDevice:
+    """
+    {
+        'host': 'gaggiuino.local',
+        'address': '192.168.1.42',
+        'baseUrl': 'http://192.168.1.42'
+    }
+    """
+
+    host: str
+    address: str
+    baseUrl: str
+
+
+class GaggiuinoDiscovery:
+    """Find machines by hostname or by scanning a subnet.
+
+    Candidates are probed concurrently with a short timeout on /api/health.
+    Hostnames, including mDNS names such as ``gaggiuino.local``, are resolved
+    through the system resolver once and the machines are addressed by IP
+    afterwards, so new sessions skip the slow mDNS lookup. Found machines
+    are cached for ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = DEFAULT_DISCOVERY_TIMEOUT,
+        concurrency: int = DEFAULT_DISCOVERY_CONCURRENCY,
+        ttl: float = DEFAULT_DISCOVERY_TTL,
+        port: int = 80,
+    ) -> None:
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self.port = port
+        self.session: ClientSession | None = None
+        # Keyed by hostname or network, valued by expiry and devices
+        self._cache: dict[str, tuple[float, list[GaggiuinoDevice]]] = {}
+
+    async def __aenter__(self) -> "GaggiuinoDiscovery":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    async def discover(
+        self,
+        hostnames: Iterable[str] = (urlsplit(DEFAULT_BASE_URL).hostname,),
+        networks: Iterable[str] = (),
+        *,
+        refresh: bool = False,
+    ) -> list[GaggiuinoDevice]:
+        """Find machines by hostname and in subnets concurrently.
+
+        Args:
+            hostnames: Hostnames or addresses to resolve and probe
+            networks: Subnets to scan, e.g. '192.168.1.0/24'
+            refresh: Ignore cached results
+
+        Returns:
+            Found machines, each address listed once
+        """
+        lookups = [self.resolve(_, refresh=refresh) for _ in hostnames]
+        lookups += [self.scan(_, refresh=refresh) for _ in networks]
+        devices: dict[str, GaggiuinoDevice] = {}
+        for found in await asyncio.gather(*lookups):
+            for device in found:
+                devices.setdefault(device.address, device)
+        return list(devices.values())
+
+    async def resolve(
+        self, hostname: str, *, refresh: bool = False
+    ) -> list[GaggiuinoDevice]:
+        """Resolve a hostname and probe its addresses.
+
+        Returns:
+            Machines answering at the hostname's addresses
+        """
+        cached = None if refresh else self._cached(hostname)
+        if cached is not None:
+            return cached
+
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                hostname, self.port, family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+        except OSError as err:
+            _LOGGER.debug("Couldn't resolve %s: %s", hostname, err)
+            return []
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        return self._store(hostname, await self._probe_all(hostname, addresses))
+
+    async def scan(
+        self, network: str, *, refresh: bool = False
+    ) -> list[GaggiuinoDevice]:
+        """Probe every host address of an IPv4 subnet.
+
+        Returns:
+            Machines found in the subnet
+
+        Raises:
+            ValueError: Not an IPv4 network or larger than MIN_SCAN_PREFIXLEN
+        """
+        subnet = ipaddress.ip_network(network, strict=False)
+        if not isinstance(subnet, ipaddress.IPv4Network):
+            raise ValueError(f"Only IPv4 networks can be scanned, got {network}")
+        if subnet.prefixlen < MIN_SCAN_PREFIXLEN:
+            raise ValueError(
+                f"Network {subnet} is too large to scan, "
+                f"the shortest prefix is /{MIN_SCAN_PREFIXLEN}"
+            )
+        network = str(subnet)
+        cached = None if refresh else self._cached(network)
+        if cached is not None:
+            return cached
+
+        addresses = [str(_) for _ in subnet.hosts()]
+        return self._store(network, await self._probe_all(None, addresses))
+
+    def clients(
+        self, devices: Iterable[GaggiuinoDevice], **kwargs: Any
+    ) -> list[GaggiuinoAPI]:
+        """Create clients of found machines, kwargs are passed to GaggiuinoAPI."""
+        return [GaggiuinoAPI(device.baseUrl, **kwargs) for device in devices]
+
+    def _cached(self, key: str) -> list[GaggiuinoDevice] | None:
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _store(self, key: str, devices: list[GaggiuinoDevice]) -> list[GaggiuinoDevice]:
+        # Misses are not cached, so machines switched on later are found
+        if devices:
+            self._cache[key] = (time.monotonic() + self.ttl, devices)
+        return devices
+
+    async def _probe_all(
+        self, hostname: str | None, addresses: list[str]
+    ) -> list[GaggiuinoDevice]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _probe(address: str) -> GaggiuinoDevice | None:
+            async with semaphore:
+                return await self.probe(address, hostname=hostname)
+
+        found = await asyncio.gather(*(_probe(_) for _ in addresses))
+        return [_ for _ in found if _ is not None]
+
+    async def probe(
+        self, address: str, *, hostname: str | None = None
+    ) -> GaggiuinoDevice | None:
+        """Check whether a Gaggiuino answers at an address.
+
+        Returns:
+            The machine or None
+        """
+        if self.session is None:
+            self.session = ClientSession(
+                timeout=ClientTimeout(total=self.timeout),
+                connector=TCPConnector(limit=self.concurrency, force_close=True),
+            )
+        base_url = f"http://{address}"
+        if self.port != 80:
+            base_url = f"{base_url}:{self.port}"
+        api = GaggiuinoAPI(
+            base_url, session=self.session, timeout=self.timeout, retry_policy=None
+        )
+        try:
+            if not await api.healthy():
+                return None
+        except GaggiuinoError:
+            return None
+        _LOGGER.debug("Found Gaggiuino at %s", base_url)
+        return GaggiuinoDevice(hostname or address, address, base_url)
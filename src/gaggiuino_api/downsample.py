@@ -0,0 +1,139 @@
+"""Shot downsampling for charts"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Literal
+
+from gaggiuino_api.models import GaggiuinoShotDataPoints
+from gaggiuino_api.tools import optional_numpy
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+
+def downsample(
+    datapoints: GaggiuinoShotDataPoints,
+    points: int,
+    *,
+    method: DownsampleMethod = "lttb",
+    use_numpy: bool | None = None,
+) -> dict[str, tuple[array, array]]:
+    """Reduce every series to at most ``points`` visually faithful samples.
+
+    'lttb' (Largest-Triangle-Three-Buckets) keeps the sample spanning the
+    largest triangle per bucket, 'minmax' keeps the lowest and highest sample
+    per bucket. Both always keep the first and last sample and pick original
+    samples, so the results are arrays of the original typecodes. LTTB picks
+    each sample relative to the previous pick, so it always runs in pure
+    Python and ``use_numpy`` only applies to 'minmax'.
+
+    Args:
+        datapoints: Samples to reduce, timeInShot must be non-decreasing
+        points: Maximum number of samples per series
+        method: 'lttb' or 'minmax'
+        use_numpy: True to require NumPy, False for pure Python, None to use
+            NumPy when installed
+
+    Returns:
+        timeInShot and value arrays of the kept samples by series name
+
+    Raises:
+        ValueError: Invalid points or method, missing timeInShot or a series
+            of a different length
+    """
+    if points < 3:
+        raise ValueError(f"Downsampling needs at least 3 points, got {points}")
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"Unknown downsampling method {method}")
+    times = datapoints.timeInShot
+    if times is None:
+        raise ValueError("Downsampling requires timeInShot")
+    datapoints.check_lengths()
+
+    numpy = optional_numpy(use_numpy)
+    if method == "lttb":
+        # NumPy calls on each small bucket cost more than they save
+        numpy = None
+    result = {}
+    for name, values in datapoints.series().items():
+        if name == "timeInShot":
+            continue
+        if len(values) <= points:
+            result[name] = (times, values)
+            continue
+
+        if numpy is not None:
+            t = numpy.frombuffer(times, dtype=times.typecode)
+            v = numpy.frombuffer(values, dtype=values.typecode)
+            kept = _minmax(numpy, t, v, points)
+            result[name] = (_pack(numpy, t[kept], times), _pack(numpy, v[kept], values))
+        else:
+            kept = (
+                _lttb(times, values, points)
+                if method == "lttb"
+                else _minmax(None, times, values, points)
+            )
+            result[name] = (
+                array(times.typecode, (times[i] for i in kept)),
+                array(values.typecode, (values[i] for i in kept)),
+            )
+    return result
+
+
+def _pack(numpy, values, like: array) -> array:
+    packed = array(like.typecode)
+    packed.frombytes(numpy.ascontiguousarray(values).tobytes())
+    return packed
+
+
+def _bucket_bounds(count: int, points: int, bucket: int) -> tuple[int, int]:
+    """Sample range of an inner bucket, the first and last sample excluded."""
+    every = (count - 2) / (points - 2)
+    return int(bucket * every) + 1, int((bucket + 1) * every) + 1
+
+
+def _lttb(times: array, values: array, points: int) -> list[int]:
+    count = len(values)
+    bounds = [_bucket_bounds(count, points, _) for _ in range(points - 2)]
+    # Centroid of the bucket following each bucket, the last sample at the end
+    centroids = [
+        (sum(times[start:end]) / (end - start), sum(values[start:end]) / (end - start))
+        for start, end in bounds[1:] + [(count - 1, count)]
+    ]
+
+    kept = [0]
+    a = 0
+    for (start, end), (cx, cy) in zip(bounds, centroids):
+        ax, ay = times[a], values[a]
+        best = -1.0
+        for i in range(start, end):
+            area = abs((ax - cx) * (values[i] - ay) - (ax - times[i]) * (cy - ay))
+            if area > best:
+                best = area
+                a = i
+        kept.append(a)
+    kept.append(count - 1)
+    return kept
+
+
+def _minmax(numpy, times, values, points: int):
+    count = len(values)
+    buckets = (points - 2) // 2
+    kept = [0]
+    for bucket in range(buckets):
+        start, end = _bucket_bounds(count, buckets + 2, bucket)
+        if numpy is not None:
+            window = values[start:end]
+            low = start + int(window.argmin())
+            high = start + int(window.argmax())
+        else:
+            low = high = start
+            for i in range(start + 1, end):
+                if values[i] < values[low]:
+                    low = i
+                elif values[i] > values[high]:
+                    high = i
+        # Keep the samples in time order, once if both are the same
+        kept.extend(sorted({low, high}))
+    kept.append(count - 1)
+    return kept
@@ -15,3 +15,7 @@ class GaggiuinoConnectionTimeoutError(GaggiuinoError):
 
 class GaggiuinoEndpointNotFoundError(GaggiuinoError):
     """Gaggiuino endpoint not found exception."""
+
+
+class GaggiuinoCircuitOpenError(GaggiuinoConnectionError):
+    """Gaggiuino request rejected while the machine is considered offline."""
@@ -0,0 +1,179 @@
+"""Multi-machine client for Gaggiuino"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Generic, Iterable, Type, TypeVar
+
+from aiohttp import ClientSession, ClientTimeout
+
+from gaggiuino_api.api import GaggiuinoAPI
+from gaggiuino_api.breaker import GaggiuinoCircuitBreaker
+from gaggiuino_api.const import DEFAULT_FLEET_CONCURRENCY, DEFAULT_TIMEOUT
+from gaggiuino_api.limiter import GaggiuinoRateLimiter
+from gaggiuino_api.models import GaggiuinoSettings, GaggiuinoShot, GaggiuinoStatus
+from gaggiuino_api.shot_cache import GaggiuinoShotCache
+from gaggiuino_api.transport import GaggiuinoTransport, GaggiuinoTransportStats
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GaggiuinoFleetResult(Generic[T]):
+    """Outcome of a call fanned out to every machine, keyed by base URL.
+
+    Machines that failed are listed in ``errors`` instead of ``results``.
+    """
+
+    results: dict[str, T] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class GaggiuinoFleet:
+    """Clients of many machines sharing one session and connector.
+
+    Calls are sent to all machines concurrently, at most ``concurrency``
+    machines at a time and at most ``transport.limit_per_host`` requests per
+    machine. Unless given, the transport's total connection limit is raised
+    so every machine can use its per-host share. Extra keyword arguments are
+    passed to every GaggiuinoAPI, except the stateful circuit breaker, rate
+    limiter and shot cache: each machine gets its own from the matching
+    factory called with its base URL.
+    """
+
+    def __init__(
+        self,
+        base_urls: Iterable[str],
+        *,
+        timeout: float | None = None,
+        transport: GaggiuinoTransport | None = None,
+        concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+        circuit_breaker_factory: Callable[[str], GaggiuinoCircuitBreaker] | None = None,
+        rate_limiter_factory: Callable[[str], GaggiuinoRateLimiter] | None = None,
+        shot_cache_factory: Callable[[str], GaggiuinoShotCache] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        # Options holding per-machine state must not be shared
+        factories = {
+            "circuit_breaker": circuit_breaker_factory,
+            "rate_limiter": rate_limiter_factory,
+            "shot_cache": shot_cache_factory,
+        }
+        for name in factories:
+            if name in kwargs:
+                raise TypeError(
+                    f"{name} would be shared by every machine, "
+                    f"pass {name}_factory instead"
+                )
+        self.machines: dict[str, GaggiuinoAPI] = {}
+        for base_url in base_urls:
+            base_url = base_url.rstrip("/")
+            per_machine = {
+                name: factory(base_url)
+                for name, factory in factories.items()
+                if factory is not None
+            }
+            api = GaggiuinoAPI(base_url, timeout=timeout, **per_machine, **kwargs)
+            self.machines[api.base_url] = api
+        if transport is None:
+            transport = GaggiuinoTransport()
+            transport = replace(
+                transport,
+                limit=max(transport.limit, transport.limit_per_host * len(self)),
+            )
+        self.transport = transport
+        self.transport_stats = GaggiuinoTransportStats()
+        self.timeout = float(timeout) if timeout is not None else DEFAULT_TIMEOUT
+        self.concurrency = concurrency
+        self.session: ClientSession | None = None
+
+    def __len__(self) -> int:
+        return len(self.machines)
+
+    async def __aenter__(self) -> "GaggiuinoFleet":
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object | None,
+    ) -> None:
+        await self.disconnect()
+
+    async def connect(self) -> None:
+        """Open the shared session."""
+        if self.session is not None:
+            return
+        self.session = ClientSession(
+            timeout=ClientTimeout(total=self.timeout),
+            connector=self.transport.create_connector(),
+            trace_configs=[self.transport_stats.trace_config()],
+        )
+        for api in self.machines.values():
+            api.session = self.session
+
+    async def disconnect(self) -> None:
+        """Close the shared session."""
+        if self.session is None:
+            return
+        for api in self.machines.values():
+            api.session = None
+        await self.session.close()
+        self.session = None
+
+    async def gather(
+        self, call: Callable[[GaggiuinoAPI], Awaitable[T]]
+    ) -> GaggiuinoFleetResult[T]:
+        """Run a call against every machine concurrently.
+
+        Args:
+            call: Coroutine function receiving the machine's client
+
+        Returns:
+            Per-machine results and errors
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _run(api: GaggiuinoAPI) -> T:
+            async with semaphore:
+                return await call(api)
+
+        outcomes = await asyncio.gather(
+            *(_run(api) for api in self.machines.values()), return_exceptions=True
+        )
+        result: GaggiuinoFleetResult[T] = GaggiuinoFleetResult()
+        for base_url, outcome in zip(self.machines, outcomes):
+            if isinstance(outcome, Exception):
+                _LOGGER.debug("%s failed: %s", base_url, outcome)
+                result.errors[base_url] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result.results[base_url] = outcome
+        return result
+
+    async def status_all(self) -> GaggiuinoFleetResult[GaggiuinoStatus | None]:
+        return await self.gather(lambda api: api.get_status())
+
+    async def settings_all(self) -> GaggiuinoFleetResult[GaggiuinoSettings | None]:
+        return await self.gather(lambda api: api.get_settings())
+
+    async def latest_shot_all(self) -> GaggiuinoFleetResult[GaggiuinoShot | None]:
+        return await self.gather(_latest_shot)
+
+
+async def _latest_shot(api: GaggiuinoAPI) -> GaggiuinoShot | None:
+    latest = await api.get_latest_shot_id()
+    if latest is None:
+        return None
+    return await api.get_shot(latest.lastShotId)
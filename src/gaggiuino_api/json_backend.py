@@ -0,0 +1,62 @@
+"""JSON encoding backends for Gaggiuino"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+# Preferred order when picking the fastest installed backend
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class GaggiuinoJSONBackend:
+    """JSON codec used by the client for request and response bodies.
+
+    Field Notes:
+    - loads: Decodes bytes or str into Python objects
+    - dumps: Encodes Python objects into compact UTF-8 bytes
+    """
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def get_json_backend(name: str | None = None) -> GaggiuinoJSONBackend:
+    """Create a JSON backend.
+
+    Args:
+        name: 'orjson', 'msgspec' or 'json'; the fastest installed backend
+            if None
+
+    Returns:
+        JSON backend
+
+    Raises:
+        ImportError: The requested backend is not installed
+        ValueError: The backend name is unknown
+    """
+    if name is None:
+        for candidate in JSON_BACKENDS:
+            try:
+                return get_json_backend(candidate)
+            except ImportError:
+                continue
+
+    if name == "orjson":
+        import orjson
+
+        return GaggiuinoJSONBackend(name, orjson.loads, orjson.dumps)
+    if name == "msgspec":
+        import msgspec
+
+        return GaggiuinoJSONBackend(name, msgspec.json.decode, msgspec.json.encode)
+    if name == "json":
+        return GaggiuinoJSONBackend(name, json.loads, _stdlib_dumps)
+    raise ValueError(f"Unknown JSON backend {name}, expected one of {JSON_BACKENDS}")
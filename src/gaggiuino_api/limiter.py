@@ -0,0 +1,114 @@
+"""Client-side rate limiting for Gaggiuino"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from gaggiuino_api.const import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    PRIORITY_NORMAL,
+)
+
+
+class GaggiuinoRateLimiter:
+    """Token bucket and in-flight limit shared by the requests of a client.
+
+    A request starts once a token is available and fewer than
+    ``max_in_flight`` requests are running. Waiting requests are served by
+    priority (PRIORITY_HIGH first), then in arrival order, so a profile
+    change is never queued behind a bulk shot download.
+
+    Field Notes:
+    - rate: Sustained requests per second, None for no rate limit
+    - burst: Requests that may start at once after an idle period
+    - max_in_flight: Concurrent requests, None for no limit
+    """
+
+    def __init__(
+        self,
+        rate: float | None = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_RATE_BURST,
+        max_in_flight: int | None = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting to start."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_NORMAL) -> AsyncIterator[None]:
+        """Wait for a turn to send a request and hold it until the block exits."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate is not None:
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    def _dispatch(self) -> None:
+        while self._waiters:
+            if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+                return
+            future = self._waiters[0][2]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+
+            if self.rate is not None:
+                self._refill()
+                if self._tokens < 1:
+                    if self._timer is None:
+                        self._timer = asyncio.get_running_loop().call_later(
+                            (1 - self._tokens) / self.rate, self._on_timer
+                        )
+                    return
+                self._tokens -= 1
+
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            future.set_result(None)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
@@ -1,22 +1,153 @@
 """Models for Gaggiuino"""
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Literal
+from array import array
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Iterable, Literal
+
+from gaggiuino_api.const import DEFAULT_RESAMPLE_PERIOD
+
+if TYPE_CHECKING:
+    import numpy
+
+    from gaggiuino_api.deviation import GaggiuinoShotDeviation
+    from gaggiuino_api.phases import GaggiuinoShotPhase
+    from gaggiuino_api.summary import GaggiuinoShotSummary
+
+
+def _series(values: Iterable[int] | None, typecode: str) -> array | None:
+    """Pack a datapoint series into a compact array."""
+    if values is None:
+        return None
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    try:
+        return array(typecode, values)
+    except TypeError:
+        # Tolerate firmware sending floats for the integer series
+        return array(typecode, (round(_) for _ in values))
+
+
+# Series with a short range are stored as 16-bit, the others as 32-bit integers
+DATAPOINT_TYPECODES = {
+    "pressure": "h",
+    "pumpFlow": "h",
+    "shotWeight": "i",
+    "targetPressure": "h",
+    "targetPumpFlow": "h",
+    "targetTemperature": "h",
+    "temperature": "h",
+    "timeInShot": "i",
+    "waterPumped": "i",
+    "weightFlow": "h",
+}
 
 
 @dataclass(frozen=True)
 class GaggiuinoShotDataPoints:
-    pressure: list[int] | None = None
-    pumpFlow: list[int] | None = None
-    shotWeight: list[int] | None = None
-    targetPressure: list[int] | None = None
-    targetPumpFlow: list[int] | None = None
-    targetTemperature: list[int] | None = None
-    temperature: list[int] | None = None
-    timeInShot: list[int] | None = None
-    waterPumped: list[int] | None = None
-    weightFlow: list[int] | None = None
+    """Columnar shot samples, one compact array per series.
+
+    Values are integers scaled by 10 (e.g. pressure 93 is 9.3 bar), series
+    with a short range are stored as 16-bit and the others as 32-bit integers.
+
+    Response Example:
+    {
+        'pressure': [3, 3, 3, ...],
+        'pumpFlow': [0, 6, 12, ...],
+        ...
+        'timeInShot': [2, 3, 5, ...],
+        'weightFlow': [0, 0, 0, ...]
+    }
+    """
+
+    pressure: array | None = None
+    pumpFlow: array | None = None
+    shotWeight: array | None = None
+    targetPressure: array | None = None
+    targetPumpFlow: array | None = None
+    targetTemperature: array | None = None
+    temperature: array | None = None
+    timeInShot: array | None = None
+    waterPumped: array | None = None
+    weightFlow: array | None = None
+
+    @staticmethod
+    def from_dict(data: dict) -> "GaggiuinoShotDataPoints":
+        return GaggiuinoShotDataPoints(
+            **{
+                name: _series(data.get(name), typecode)
+                for name, typecode in DATAPOINT_TYPECODES.items()
+            }
+        )
+
+    def __len__(self) -> int:
+        """Number of samples."""
+        return max((len(_) for _ in self.series().values()), default=0)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the sample buffers."""
+        return sum(len(_) * _.itemsize for _ in self.series().values())
+
+    def series(self) -> dict[str, array]:
+        """Present series by name."""
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
+
+    def check_lengths(self) -> None:
+        """Check every series has one sample per timeInShot sample.
+
+        Raises:
+            ValueError: A series of a different length than timeInShot
+        """
+        times = self.timeInShot
+        if times is None:
+            return
+        for name, values in self.series().items():
+            if len(values) != len(times):
+                raise ValueError(
+                    f"Series {name} has {len(values)} samples, timeInShot {len(times)}"
+                )
+
+    def to_dict(self) -> dict[str, list[int]]:
+        """Convert to the API response format."""
+        return {name: values.tolist() for name, values in self.series().items()}
+
+    def to_numpy(self) -> dict[str, numpy.ndarray]:
+        """Expose the series as NumPy arrays sharing the sample buffers.
+
+        Requires the optional numpy dependency.
+        """
+        import numpy
+
+        return {
+            name: numpy.frombuffer(values, dtype=values.typecode)
+            for name, values in self.series().items()
+        }
+
+    def resample(
+        self, period: float = DEFAULT_RESAMPLE_PERIOD, **kwargs
+    ) -> "GaggiuinoShotDataPoints":
+        """Interpolate every series onto a uniform time grid.
+
+        See gaggiuino_api.resample.resample for the options.
+        """
+        from gaggiuino_api.resample import resample
+
+        return resample(self, period, **kwargs)
+
+    def downsample(self, points: int, **kwargs) -> dict[str, tuple[array, array]]:
+        """Reduce every series to at most ``points`` samples for charting.
+
+        See gaggiuino_api.downsample.downsample for the options.
+        """
+        from gaggiuino_api.downsample import downsample
+
+        return downsample(self, points, **kwargs)
 
 
 @dataclass(frozen=True)
@@ -33,6 +164,14 @@ class GaggiuinoProfilePhaseStopCondition:
     time: int | None = None
     weight: float | None = None
 
+    @staticmethod
+    def from_dict(data: dict) -> "GaggiuinoProfilePhaseStopCondition":
+        return GaggiuinoProfilePhaseStopCondition(
+            pressureAbove=data.get("pressureAbove"),
+            time=data.get("time"),
+            weight=data.get("weight"),
+        )
+
 
 @dataclass(frozen=True)
 class GaggiuinoProfilePhaseTarget:
@@ -42,11 +181,25 @@ class GaggiuinoProfilePhaseTarget:
         'end': 2,
         'time': 10000
     },
+
+    Field Notes:
+    - start: Missing when the phase starts from the previous phase's value
+    - time: Transition duration in milliseconds, missing for INSTANT curves
     """
 
     curve: str
-    end: int
-    time: int
+    end: float
+    time: int | None = None
+    start: float | None = None
+
+    @staticmethod
+    def from_dict(data: dict) -> "GaggiuinoProfilePhaseTarget":
+        return GaggiuinoProfilePhaseTarget(
+            curve=str(data["curve"]),
+            end=data["end"],
+            time=data.get("time"),
+            start=data.get("start"),
+        )
 
 
 @dataclass(frozen=True)
@@ -57,6 +210,11 @@ class GaggiuinoProfileType:
 
     type: Literal['FLOW', 'PRESSURE']
 
+    @staticmethod
+    def from_dict(data: str) -> "GaggiuinoProfileType":
+        """Create instance from the phase's type string."""
+        return GaggiuinoProfileType(type=data)
+
 
 @dataclass(frozen=True)
 class GaggiuinoProfilePhase:
@@ -82,6 +240,24 @@ class GaggiuinoProfilePhase:
     skip: bool
     stopConditions: GaggiuinoProfilePhaseStopCondition
     type: GaggiuinoProfileType
+    target: GaggiuinoProfilePhaseTarget | None = None
+
+    @staticmethod
+    def from_dict(data: dict) -> "GaggiuinoProfilePhase":
+        target = data.get("target")
+        return GaggiuinoProfilePhase(
+            restriction=data.get("restriction"),
+            skip=bool(data.get("skip", False)),
+            stopConditions=GaggiuinoProfilePhaseStopCondition.from_dict(
+                data.get("stopConditions") or {}
+            ),
+            type=GaggiuinoProfileType.from_dict(data["type"]),
+            target=(
+                GaggiuinoProfilePhaseTarget.from_dict(target)
+                if target is not None
+                else None
+            ),
+        )
 
 
 @dataclass(frozen=True)
@@ -146,6 +322,34 @@ class GaggiuinoProfile:
     recipe: dict[str, Any] | None = None
     waterTemperature: int | None = None
 
+    @staticmethod
+    def from_dict(data: dict) -> "GaggiuinoProfile":
+        phases = data.get("phases")
+        return GaggiuinoProfile(
+            id=int(data["id"]),
+            name=str(data["name"]),
+            selected=data.get("selected"),
+            globalStopConditions=data.get("globalStopConditions"),
+            phases=(
+                [GaggiuinoProfilePhase.from_dict(_) for _ in phases]
+                if phases is not None
+                else None
+            ),
+            recipe=data.get("recipe"),
+            waterTemperature=data.get("waterTemperature"),
+        )
+
+    def simulate(
+        self, period: float = DEFAULT_RESAMPLE_PERIOD, **kwargs
+    ) -> GaggiuinoShotDataPoints:
+        """Render the target pressure and flow of the phases over time.
+
+        See gaggiuino_api.simulate.simulate_profile for the options.
+        """
+        from gaggiuino_api.simulate import simulate_profile
+
+        return simulate_profile(self, period, **kwargs)
+
 
 @dataclass(frozen=True)
 class GaggiuinoShot:
@@ -244,6 +448,74 @@ class GaggiuinoShot:
     profile: GaggiuinoProfile
     timestamp: int
 
+    @staticmethod
+    def from_dict(data: dict) -> "GaggiuinoShot":
+        return GaggiuinoShot(
+            datapoints=GaggiuinoShotDataPoints.from_dict(data["datapoints"]),
+            duration=int(data["duration"]),
+            id=int(data["id"]),
+            profile=GaggiuinoProfile.from_dict(data["profile"]),
+            timestamp=int(data["timestamp"]),
+        )
+
+    def resample(
+        self, period: float = DEFAULT_RESAMPLE_PERIOD, **kwargs
+    ) -> GaggiuinoShotDataPoints:
+        """Interpolate the datapoints onto a uniform time grid.
+
+        See gaggiuino_api.resample.resample for the options.
+        """
+        return self.datapoints.resample(period, **kwargs)
+
+    def downsample(self, points: int, **kwargs) -> dict[str, tuple[array, array]]:
+        """Reduce every series to at most ``points`` samples for charting.
+
+        See gaggiuino_api.downsample.downsample for the options.
+        """
+        return self.datapoints.downsample(points, **kwargs)
+
+    @cached_property
+    def summary(self) -> GaggiuinoShotSummary:
+        """Metrics of the shot, computed on first access.
+
+        Use gaggiuino_api.summary.summarize_shots to compute many at once.
+        """
+        from gaggiuino_api.summary import summarize_shots
+
+        return summarize_shots([self])[0]
+
+    @cached_property
+    def segments(self) -> list[GaggiuinoShotPhase]:
+        """Reached profile phases with their samples, computed on first access.
+
+        See gaggiuino_api.phases.segment_phases.
+        """
+        from gaggiuino_api.phases import segment_phases
+
+        return segment_phases(self)
+
+    @cached_property
+    def deviation(self) -> list[GaggiuinoShotDeviation]:
+        """Tracking of the targets, computed on first access.
+
+        Use gaggiuino_api.deviation.score_shots to score many at once or with
+        other tolerances.
+        """
+        from gaggiuino_api.deviation import score_shots
+
+        return score_shots([self])
+
+    def simulate(
+        self, period: float = DEFAULT_RESAMPLE_PERIOD, **kwargs
+    ) -> GaggiuinoShotDataPoints:
+        """Render the profile's targets with the phases timed as the shot ran them.
+
+        See gaggiuino_api.simulate.simulate_profile for the options.
+        """
+        ends = [round(_.endTime * 1000) for _ in self.segments]
+        durations = [end - begin for begin, end in zip([0] + ends, ends)]
+        return self.profile.simulate(period, durations=durations, **kwargs)
+
 
 @dataclass(frozen=True)
 class GaggiuinoStatus:
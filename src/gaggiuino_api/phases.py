@@ -0,0 +1,180 @@
+"""Shot phase segmentation for Gaggiuino"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from gaggiuino_api.const import DATAPOINT_SCALE, MS_PER_TIME_IN_SHOT
+from gaggiuino_api.models import GaggiuinoProfilePhaseStopCondition, GaggiuinoShot
+
+
+@dataclass(frozen=True)
+class GaggiuinoShotPhase:
+    """
+    {
+        'phaseIndex': 0,
+        'type': 'FLOW',
+        'start': 0,
+        'end': 42,
+        'startTime': 0.0,
+        'endTime': 8.1,
+        'duration': 8.1,
+        'stopReason': 'pressureAbove',
+        'meanPressure': 1.4,
+        'peakPressure': 2.1,
+        'meanPumpFlow': 2.0,
+        'weightGain': 0.2,
+        'waterPumped': 16.3
+    }
+
+    Field Notes:
+    - phaseIndex: Index of the phase in the profile, skipped phases included
+    - start, end: Sample range of the phase, end excluded
+    - Times are in seconds, pressures in bar, flows in ml/s, weights in grams
+      and water in ml
+    - startTime: When the previous phase stopped, the first sample for the
+      first phase
+    - stopReason: Stop condition that ended the phase ('time', 'weight' or
+      'pressureAbove'), None when the shot ended first
+    - weightGain, waterPumped: Increase over the phase
+    - Metrics are None when the shot lacks the series they need
+    """
+
+    phaseIndex: int
+    type: str
+    start: int
+    end: int
+    startTime: float
+    endTime: float
+    duration: float
+    stopReason: str | None = None
+    meanPressure: float | None = None
+    peakPressure: float | None = None
+    meanPumpFlow: float | None = None
+    weightGain: float | None = None
+    waterPumped: float | None = None
+
+
+def segment_phases(shot: GaggiuinoShot) -> list[GaggiuinoShotPhase]:
+    """Map the shot's samples to the phases of its profile.
+
+    Walks the samples once, checking the stop conditions of the active phase
+    like the machine does: a phase stops at the first sample past its time,
+    shot weight or pressure limit and the next one starts with the following
+    sample. Skipped phases are left out, phases the shot never reached are
+    missing and samples after the last phase stopped belong to no phase.
+
+    Args:
+        shot: Shot with its profile
+
+    Returns:
+        Reached phases in order with their sample ranges and metrics
+
+    Raises:
+        ValueError: Missing timeInShot or a series of a different length
+    """
+    datapoints = shot.datapoints
+    times = datapoints.timeInShot
+    if times is None:
+        raise ValueError("Phase segmentation requires timeInShot")
+    datapoints.check_lengths()
+
+    phases = [
+        (index, phase)
+        for index, phase in enumerate(shot.profile.phases or ())
+        if not phase.skip
+    ]
+    if not phases or not times:
+        return []
+
+    pressure = datapoints.pressure
+    flow = datapoints.pumpFlow
+    weight = datapoints.shotWeight
+    water = datapoints.waterPumped
+
+    segments = []
+    active = 0
+    start = 0
+    phase_time = times[0]
+    pressure_sum = flow_sum = 0
+    peak = None
+    for i, time in enumerate(times):
+        if pressure is not None:
+            pressure_sum += pressure[i]
+            peak = pressure[i] if peak is None else max(peak, pressure[i])
+        if flow is not None:
+            flow_sum += flow[i]
+
+        reason = _stop_reason(
+            phases[active][1].stopConditions,
+            time - phase_time,
+            weight[i] if weight is not None else None,
+            pressure[i] if pressure is not None else None,
+        )
+        last = i == len(times) - 1
+        if reason is None and not last:
+            continue
+
+        index, phase = phases[active]
+        count = i + 1 - start
+        before = start - 1 if start else 0
+        segments.append(
+            GaggiuinoShotPhase(
+                phaseIndex=index,
+                type=phase.type.type,
+                start=start,
+                end=i + 1,
+                startTime=phase_time / DATAPOINT_SCALE,
+                endTime=time / DATAPOINT_SCALE,
+                duration=(time - phase_time) / DATAPOINT_SCALE,
+                stopReason=reason,
+                meanPressure=(
+                    pressure_sum / count / DATAPOINT_SCALE
+                    if pressure is not None
+                    else None
+                ),
+                peakPressure=peak / DATAPOINT_SCALE if peak is not None else None,
+                meanPumpFlow=(
+                    flow_sum / count / DATAPOINT_SCALE if flow is not None else None
+                ),
+                weightGain=(
+                    (weight[i] - weight[before]) / DATAPOINT_SCALE
+                    if weight is not None
+                    else None
+                ),
+                waterPumped=(
+                    (water[i] - water[before]) / DATAPOINT_SCALE
+                    if water is not None
+                    else None
+                ),
+            )
+        )
+
+        active += 1
+        if active == len(phases):
+            break
+        start = i + 1
+        phase_time = time
+        pressure_sum = flow_sum = 0
+        peak = None
+    return segments
+
+
+def _stop_reason(
+    stop: GaggiuinoProfilePhaseStopCondition,
+    elapsed: int,
+    weight: int | None,
+    pressure: int | None,
+) -> str | None:
+    """First stop condition met by a sample, None if the phase goes on."""
+    if stop.time is not None and elapsed * MS_PER_TIME_IN_SHOT >= stop.time:
+        return "time"
+    if stop.weight and weight is not None and weight > stop.weight * DATAPOINT_SCALE:
+        return "weight"
+    if (
+        stop.pressureAbove
+        and pressure is not None
+        and pressure > stop.pressureAbove * DATAPOINT_SCALE
+    ):
+        return "pressureAbove"
+    return None
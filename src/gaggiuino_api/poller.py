@@ -0,0 +1,157 @@
+"""Adaptive status polling for Gaggiuino"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Callable
+
+from gaggiuino_api.const import (
+    DEFAULT_POLL_IDLE_INTERVAL,
+    DEFAULT_POLL_HEATING_INTERVAL,
+    DEFAULT_POLL_SHOT_INTERVAL,
+    DEFAULT_POLL_TEMPERATURE_DELTA,
+    DEFAULT_POLL_PRESSURE_THRESHOLD,
+)
+from gaggiuino_api.exceptions import GaggiuinoError
+from gaggiuino_api.models import GaggiuinoStatus
+
+if TYPE_CHECKING:
+    from gaggiuino_api.api import GaggiuinoAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+StatusCallback = Callable[[GaggiuinoStatus], Any]
+
+
+class GaggiuinoStatusPoller:
+    """Poll the system status at a rate matching what the machine is doing.
+
+    The shot rate is used while the brew or steam switch is on or the pump
+    builds pressure, the heating rate while the boiler is far from its target
+    temperature, and the idle rate otherwise. Subscribers are only notified
+    when the status actually changes.
+    """
+
+    def __init__(
+        self,
+        api: GaggiuinoAPI,
+        *,
+        idle_interval: float = DEFAULT_POLL_IDLE_INTERVAL,
+        heating_interval: float = DEFAULT_POLL_HEATING_INTERVAL,
+        shot_interval: float = DEFAULT_POLL_SHOT_INTERVAL,
+        temperature_delta: float = DEFAULT_POLL_TEMPERATURE_DELTA,
+        pressure_threshold: float = DEFAULT_POLL_PRESSURE_THRESHOLD,
+    ) -> None:
+        self.api = api
+        self.idle_interval = idle_interval
+        self.heating_interval = heating_interval
+        self.shot_interval = shot_interval
+        self.temperature_delta = temperature_delta
+        self.pressure_threshold = pressure_threshold
+        self.status: GaggiuinoStatus | None = None
+        self._callbacks: list[StatusCallback] = []
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "GaggiuinoStatusPoller":
+        self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, callback: StatusCallback) -> Callable[[], None]:
+        """Register a callback for changed statuses.
+
+        Args:
+            callback: Sync or async callable receiving the new status
+
+        Returns:
+            Callable removing the subscription
+        """
+        self._callbacks.append(callback)
+
+        def _unsubscribe() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return _unsubscribe
+
+    def interval(self, status: GaggiuinoStatus | None) -> float:
+        """Pick the delay before the next poll for the given status."""
+        if status is None:
+            return self.idle_interval
+        if (
+            status.brewSwitchState
+            or status.steamSwitchState
+            or status.pressure > self.pressure_threshold
+        ):
+            return self.shot_interval
+        if abs(status.targetTemperature - status.temperature) > self.temperature_delta:
+            return self.heating_interval
+        return self.idle_interval
+
+    async def poll(self) -> GaggiuinoStatus | None:
+        """Fetch the status once and notify subscribers if it changed.
+
+        A failed or empty poll keeps the last known status, so a short outage
+        neither slows the poll rate down nor notifies an unchanged status
+        again. Errors raised by subscribers are logged and do not stop the
+        polling.
+
+        Returns:
+            Fetched status or None if the machine did not respond
+        """
+        try:
+            status = await self.api.get_status()
+        except GaggiuinoError as err:
+            _LOGGER.debug("Status poll failed: %s", err)
+            return None
+        if status is None:
+            _LOGGER.debug("Status poll returned no status")
+            return None
+
+        if _changed(self.status, status):
+            for callback in list(self._callbacks):
+                try:
+                    result = callback(status)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    _LOGGER.exception("Status subscriber %r failed", callback)
+        self.status = status
+        return status
+
+    def start(self) -> None:
+        """Start polling in a background task."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.poll()
+            await asyncio.sleep(self.interval(self.status))
+
+
+def _changed(previous: GaggiuinoStatus | None, current: GaggiuinoStatus) -> bool:
+    # upTime changes on every poll and carries no state of its own
+    if previous is None:
+        return True
+    return replace(previous, upTime=0) != replace(current, upTime=0)
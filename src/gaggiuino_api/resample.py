@@ -0,0 +1,140 @@
+"""Shot resampling for Gaggiuino"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Literal
+
+from gaggiuino_api.const import DEFAULT_RESAMPLE_PERIOD
+from gaggiuino_api.models import GaggiuinoShotDataPoints
+from gaggiuino_api.tools import optional_numpy
+
+ResampleMethod = Literal["linear", "step"]
+
+
+def resample(
+    datapoints: GaggiuinoShotDataPoints,
+    period: float = DEFAULT_RESAMPLE_PERIOD,
+    *,
+    method: ResampleMethod = "linear",
+    use_numpy: bool | None = None,
+) -> GaggiuinoShotDataPoints:
+    """Interpolate every series onto a uniform time grid.
+
+    The grid starts at the first sample and advances by ``period`` up to the
+    last one. The surrounding samples of each grid point are located once and
+    reused for all series.
+
+    Args:
+        datapoints: Samples to resample, timeInShot must be non-decreasing
+        period: Grid spacing in timeInShot units (tenths of a second)
+        method: 'linear' interpolates between samples, 'step' holds the
+            previous sample
+        use_numpy: True to require NumPy, False for pure Python, None to use
+            NumPy when installed
+
+    Returns:
+        Samples on the grid as float arrays, values keep their scaling
+
+    Raises:
+        ValueError: Invalid period or method, missing timeInShot or a series
+            of a different length
+    """
+    if period <= 0:
+        raise ValueError(f"Resampling period must be positive, got {period}")
+    if method not in ("linear", "step"):
+        raise ValueError(f"Unknown resampling method {method}")
+    times = datapoints.timeInShot
+    if times is None:
+        raise ValueError("Resampling requires timeInShot")
+    datapoints.check_lengths()
+    series = datapoints.series()
+
+    if len(times) < 2:
+        return GaggiuinoShotDataPoints(
+            **{name: array("d", values) for name, values in series.items()}
+        )
+
+    numpy = optional_numpy(use_numpy)
+    if numpy is not None:
+        return _resample_numpy(numpy, series, period, method)
+    return _resample_python(series, period, method)
+
+
+def _grid_size(times: array, period: float) -> int:
+    return int((times[-1] - times[0]) // period) + 1
+
+
+def _resample_python(
+    series: dict[str, array], period: float, method: ResampleMethod
+) -> GaggiuinoShotDataPoints:
+    times = series["timeInShot"]
+    start = times[0]
+    last = len(times) - 2
+    grid = [start + i * period for i in range(_grid_size(times, period))]
+
+    # Left sample and position between it and the next one per grid point
+    lefts = []
+    weights = []
+    left = 0
+    for t in grid:
+        while left < last and times[left + 1] <= t:
+            left += 1
+        t0 = times[left]
+        span = times[left + 1] - t0
+        lefts.append(left)
+        weights.append(min((t - t0) / span, 1.0) if span > 0 else 0.0)
+
+    columns = {}
+    for name, values in series.items():
+        if name == "timeInShot":
+            columns[name] = array("d", grid)
+        elif method == "linear":
+            columns[name] = array(
+                "d",
+                (
+                    values[i] + (values[i + 1] - values[i]) * w
+                    for i, w in zip(lefts, weights)
+                ),
+            )
+        else:
+            columns[name] = array(
+                "d",
+                (
+                    values[i + 1] if w >= 1.0 else values[i]
+                    for i, w in zip(lefts, weights)
+                ),
+            )
+    return GaggiuinoShotDataPoints(**columns)
+
+
+def _resample_numpy(
+    numpy, series: dict[str, array], period: float, method: ResampleMethod
+) -> GaggiuinoShotDataPoints:
+    times = numpy.frombuffer(series["timeInShot"], dtype=series["timeInShot"].typecode)
+    times = times.astype(numpy.float64)
+    grid = times[0] + numpy.arange(_grid_size(times, period)) * period
+
+    lefts = numpy.searchsorted(times, grid, side="right") - 1
+    lefts = numpy.clip(lefts, 0, len(times) - 2)
+    t0 = times[lefts]
+    span = times[lefts + 1] - t0
+    weights = numpy.divide(grid - t0, span, out=numpy.zeros_like(grid), where=span > 0)
+    numpy.clip(weights, 0.0, 1.0, out=weights)
+
+    columns = {}
+    for name, values in series.items():
+        if name == "timeInShot":
+            column = grid
+        else:
+            values = numpy.frombuffer(values, dtype=values.typecode)
+            left = values[lefts].astype(numpy.float64)
+            right = values[lefts + 1]
+            if method == "linear":
+                column = left + (right - left) * weights
+            else:
+                column = numpy.where(weights >= 1.0, right, left)
+        packed = array("d")
+        packed.frombytes(numpy.ascontiguousarray(column, dtype=numpy.float64).tobytes())
+        columns[name] = packed
+    return GaggiuinoShotDataPoints(**columns)
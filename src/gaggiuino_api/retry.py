@@ -0,0 +1,91 @@
+"""Request retries for Gaggiuino"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from gaggiuino_api.const import (
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_DEADLINE,
+)
+from gaggiuino_api.exceptions import (
+    GaggiuinoConnectionError,
+    GaggiuinoConnectionTimeoutError,
+)
+
+
+@dataclass(frozen=True)
+class GaggiuinoRetryPolicy:
+    """When and how often a failed request is sent again.
+
+    Only connection errors and timeouts are retried, and only for idempotent
+    requests: every GET plus the endpoints listed in ``idempotent``, given as
+    'METHOD /api/path' keys with numeric path segments written as {id}, e.g.
+    'POST /api/profile-select/{id}'. Delays grow exponentially with full
+    jitter, and no retry starts once it would overrun ``deadline``. Retries
+    are opt-in: clients only retry when given a policy as ``retry_policy``,
+    and a request may then take up to ``deadline`` instead of the timeout.
+
+    Field Notes:
+    - attempts: Maximum number of attempts including the first one
+    - backoff: Upper bound of the first delay in seconds, doubled per retry
+    - max_backoff: Cap of the delay bound in seconds
+    - deadline: Overall time budget of a request in seconds, None for no limit
+    """
+
+    attempts: int = DEFAULT_RETRY_ATTEMPTS
+    backoff: float = DEFAULT_RETRY_BACKOFF
+    max_backoff: float = DEFAULT_RETRY_MAX_BACKOFF
+    deadline: float | None = DEFAULT_RETRY_DEADLINE
+    methods: frozenset[str] = frozenset({"GET"})
+    idempotent: frozenset[str] = frozenset()
+
+    def is_idempotent(self, method: str, endpoint: str) -> bool:
+        return method in self.methods or f"{method} {endpoint}" in self.idempotent
+
+    def should_retry(self, method: str, endpoint: str, err: Exception) -> bool:
+        if not isinstance(
+            err, (GaggiuinoConnectionError, GaggiuinoConnectionTimeoutError)
+        ):
+            return False
+        return self.is_idempotent(method, endpoint)
+
+    def delay(self, attempt: int) -> float:
+        """Jittered delay before the attempt following ``attempt``."""
+        bound = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, bound)
+
+
+@dataclass
+class GaggiuinoEndpointStats:
+    """Attempt and latency counters of one endpoint.
+
+    Latencies cover all attempts of a request including the retry delays.
+    """
+
+    requests: int = 0
+    attempts: int = 0
+    failures: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def retries(self) -> int:
+        return self.attempts - self.requests
+
+    @property
+    def mean_time(self) -> float:
+        """Average request latency in seconds."""
+        if not self.requests:
+            return 0.0
+        return self.total_time / self.requests
+
+    def record(self, attempts: int, elapsed: float, failed: bool = False) -> None:
+        self.requests += 1
+        self.attempts += attempts
+        self.failures += failed
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
@@ -0,0 +1,168 @@
+"""Persistent shot cache for Gaggiuino"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from typing import Any, Iterable
+
+from gaggiuino_api.const import DEFAULT_SHOT_CACHE_MAX_BYTES
+
+
+def _encode(value: Any) -> Any:
+    # Streamed shots carry their datapoints as arrays
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class GaggiuinoShotCache:
+    """SQLite store of raw shot payloads keyed by shot ID.
+
+    Recorded shots never change, so entries never expire; once the compressed
+    payloads exceed ``max_bytes`` the least recently read shots are evicted.
+    Use one file per machine, since shot IDs are only unique per machine.
+    Methods are blocking and thread-safe; the API calls them from a worker
+    thread.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int | None = DEFAULT_SHOT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS shots ("
+                "id INTEGER PRIMARY KEY, "
+                "data BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "key TEXT PRIMARY KEY, "
+                "value INTEGER NOT NULL)"
+            )
+
+    def __enter__(self) -> "GaggiuinoShotCache":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def __contains__(self, shot_id: int) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM shots WHERE id = ?", (shot_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM shots").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored payloads in bytes."""
+        with self._lock:
+            total = self._db.execute("SELECT SUM(size) FROM shots").fetchone()[0]
+        return total or 0
+
+    @property
+    def last_synced_id(self) -> int:
+        """Highest shot ID up to which the history was archived, 0 if never."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM state WHERE key = 'last_synced_id'"
+            ).fetchone()
+        return row[0] if row is not None else 0
+
+    @last_synced_id.setter
+    def last_synced_id(self, shot_id: int) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO state (key, value) "
+                "VALUES ('last_synced_id', ?)",
+                (shot_id,),
+            )
+
+    def ids(self) -> list[int]:
+        """IDs of the stored shots in ascending order."""
+        with self._lock:
+            rows = self._db.execute("SELECT id FROM shots ORDER BY id").fetchall()
+        return [row[0] for row in rows]
+
+    def get(self, shot_id: int) -> dict[str, Any] | None:
+        """Read a raw shot payload.
+
+        Returns:
+            Shot payload as returned by the API or None if not stored
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT data FROM shots WHERE id = ?", (shot_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE shots SET accessed = ? WHERE id = ?",
+                (time.time(), shot_id),
+            )
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, shot_id: int, shot: dict[str, Any]) -> None:
+        """Store a raw shot payload, evicting old shots if needed."""
+        data = zlib.compress(
+            json.dumps(shot, separators=(",", ":"), default=_encode).encode()
+        )
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO shots (id, data, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (shot_id, data, len(data), time.time()),
+            )
+            self._evict(keep=shot_id)
+
+    def delete(self, shot_ids: Iterable[int]) -> None:
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM shots WHERE id = ?", ((_,) for _ in shot_ids)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM shots")
+            self._db.execute("DELETE FROM state")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _evict(self, keep: int) -> None:
+        if self.max_bytes is None:
+            return
+        total = self._db.execute("SELECT SUM(size) FROM shots").fetchone()[0] or 0
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute(
+            "SELECT id, size FROM shots WHERE id != ? ORDER BY accessed", (keep,)
+        ).fetchall()
+        evicted = []
+        for shot_id, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((shot_id,))
+            total -= size
+        self._db.executemany("DELETE FROM shots WHERE id = ?", evicted)
@@ -0,0 +1,202 @@
+"""Shot similarity search for Gaggiuino"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from typing import Iterable
+
+from gaggiuino_api.const import (
+    DATAPOINT_SCALE,
+    DEFAULT_INDEX_PERIOD,
+    DEFAULT_INDEX_POINTS,
+    DEFAULT_NEIGHBOURS,
+)
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.tools import optional_numpy
+
+# Resampled curves and summary metrics making up a feature vector
+_CURVES = ("pressure", "pumpFlow", "shotWeight")
+_METRICS = (
+    "duration",
+    "finalWeight",
+    "peakPressure",
+    "meanPressure",
+    "timeToFirstDrip",
+)
+
+
+class GaggiuinoShotIndex:
+    """Find the shots most like a given one.
+
+    Every shot is reduced to a feature vector of its pressure, pump flow and
+    weight curves, resampled to ``points`` samples every ``period`` and held
+    at their last value after the shot ended, followed by its summary
+    metrics. Queries compare the vectors by euclidean distance with every
+    feature scaled by its standard deviation over the index, so curves and
+    metrics weigh alike. With NumPy the vectors live in one growing matrix
+    and a query is a single vectorized pass.
+
+    Shots can be added as they sync:
+
+        index = GaggiuinoShotIndex()
+        sync = GaggiuinoShotSync(api, on_shot=index.add)
+    """
+
+    def __init__(
+        self,
+        *,
+        period: float = DEFAULT_INDEX_PERIOD,
+        points: int = DEFAULT_INDEX_POINTS,
+        use_numpy: bool | None = None,
+    ) -> None:
+        self.period = period
+        self.points = points
+        self._numpy = optional_numpy(use_numpy)
+        self._ids: list[int] = []
+        self._positions: dict[int, int] = {}
+        # Feature vectors, in a preallocated NumPy matrix doubled when full
+        # or as arrays without NumPy
+        self._rows: list[array] = []
+        self._matrix = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, shot_id: int) -> bool:
+        return shot_id in self._positions
+
+    @property
+    def width(self) -> int:
+        """Number of features per shot."""
+        return len(_CURVES) * self.points + len(_METRICS)
+
+    def add(self, shot: GaggiuinoShot) -> None:
+        """Index a shot, replacing an indexed shot with the same ID.
+
+        Raises:
+            ValueError: A series of a different length than timeInShot
+        """
+        row = self.features(shot)
+        position = self._positions.get(shot.id)
+        if position is None:
+            position = len(self._ids)
+            self._positions[shot.id] = position
+            self._ids.append(shot.id)
+
+        numpy = self._numpy
+        if numpy is None:
+            if position < len(self._rows):
+                self._rows[position] = row
+            else:
+                self._rows.append(row)
+            return
+        if self._matrix is None or position >= len(self._matrix):
+            grown = numpy.zeros((max(16, 2 * len(self._ids)), self.width))
+            if self._matrix is not None:
+                grown[: len(self._matrix)] = self._matrix
+            self._matrix = grown
+        self._matrix[position] = numpy.frombuffer(row, dtype=numpy.float64)
+
+    def extend(self, shots: Iterable[GaggiuinoShot]) -> None:
+        """Index many shots, e.g. those of a shot cache archive."""
+        for shot in shots:
+            self.add(shot)
+
+    def features(self, shot: GaggiuinoShot) -> array:
+        """Feature vector of a shot in bar, ml/s, grams and seconds."""
+        row = array("d")
+        times = shot.datapoints.timeInShot
+        resampled = shot.resample(self.period) if times else None
+        for name in _CURVES:
+            values = getattr(resampled, name) if resampled is not None else None
+            if not values:
+                row.extend([0.0] * self.points)
+                continue
+            curve = [_ / DATAPOINT_SCALE for _ in values[: self.points]]
+            curve.extend([curve[-1]] * (self.points - len(curve)))
+            row.extend(curve)
+        summary = shot.summary
+        row.extend(getattr(summary, _) or 0.0 for _ in _METRICS)
+        return row
+
+    def nearest(
+        self, shot: GaggiuinoShot | int, k: int = DEFAULT_NEIGHBOURS
+    ) -> list[tuple[int, float]]:
+        """Find the indexed shots closest to a shot.
+
+        Args:
+            shot: Shot or ID of an indexed shot, the shot itself is left out
+                of the results
+            k: Number of shots to return
+
+        Returns:
+            Shot IDs with their distances, closest first
+
+        Raises:
+            KeyError: The shot ID is not indexed
+        """
+        if isinstance(shot, int):
+            shot_id = shot
+            position = self._positions[shot_id]
+            if self._numpy is not None:
+                query = array("d", self._matrix[position].tobytes())
+            else:
+                query = self._rows[position]
+        else:
+            shot_id = shot.id
+            query = self.features(shot)
+        if k <= 0 or not self._ids:
+            return []
+
+        if self._numpy is not None:
+            return self._nearest_numpy(query, shot_id, k)
+        return self._nearest_python(query, shot_id, k)
+
+    def _nearest_python(
+        self, query: array, shot_id: int, k: int
+    ) -> list[tuple[int, float]]:
+        count = len(self._rows)
+        scales = []
+        for column in zip(*self._rows):
+            mean = sum(column) / count
+            variance = sum((_ - mean) ** 2 for _ in column) / count
+            scales.append(1.0 / variance if variance > 1e-12 else 0.0)
+
+        distances = (
+            (sum(s * (a - b) ** 2 for s, a, b in zip(scales, row, query)), other)
+            for other, row in zip(self._ids, self._rows)
+            if other != shot_id
+        )
+        # Ties go to the lower shot ID
+        return [
+            (other, math.sqrt(distance))
+            for distance, other in heapq.nsmallest(k, distances)
+        ]
+
+    def _nearest_numpy(
+        self, query: array, shot_id: int, k: int
+    ) -> list[tuple[int, float]]:
+        numpy = self._numpy
+        matrix = self._matrix[: len(self._ids)]
+        variance = matrix.var(axis=0)
+        scales = numpy.divide(
+            1.0, variance, out=numpy.zeros_like(variance), where=variance > 1e-12
+        )
+        difference = matrix - numpy.frombuffer(query, dtype=numpy.float64)
+        distances = (difference * difference) @ scales
+
+        position = self._positions.get(shot_id)
+        if position is not None:
+            distances[position] = numpy.inf
+        k = min(k, len(distances) - (position is not None))
+        if k <= 0:
+            return []
+        closest = numpy.argpartition(distances, k - 1)[:k]
+        ids = numpy.array(self._ids)[closest]
+        # Ties go to the lower shot ID
+        closest = closest[numpy.lexsort((ids, distances[closest]))]
+        return [
+            (self._ids[i], math.sqrt(float(distances[i]))) for i in closest.tolist()
+        ]
@@ -0,0 +1,195 @@
+"""Profile target curve simulation for Gaggiuino"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from functools import lru_cache
+from typing import Sequence
+
+from gaggiuino_api.const import (
+    DATAPOINT_SCALE,
+    DEFAULT_RESAMPLE_PERIOD,
+    DEFAULT_SIMULATED_PHASE_TIME,
+    DEFAULT_SIMULATION_CACHE_SIZE,
+    MS_PER_TIME_IN_SHOT,
+)
+from gaggiuino_api.models import (
+    GaggiuinoProfile,
+    GaggiuinoProfilePhase,
+    GaggiuinoShotDataPoints,
+)
+from gaggiuino_api.tools import optional_numpy
+
+# Exponent of the firmware's EASE_IN and EASE_OUT curves
+_EASE_POWER = 1.675
+
+
+def simulate_profile(
+    profile: GaggiuinoProfile,
+    period: float = DEFAULT_RESAMPLE_PERIOD,
+    *,
+    durations: Sequence[int] | None = None,
+    use_numpy: bool | None = None,
+) -> GaggiuinoShotDataPoints:
+    """Render the target pressure and flow a profile asks for over time.
+
+    Each phase moves its target (pressure for PRESSURE phases, pump flow for
+    FLOW phases) from its start to its end value along its curve, like the
+    firmware does, while the other series holds the phase's restriction.
+    Phases without a start value continue from where the previous phase left
+    that series. Renderings are memoized by phases, period and durations, so
+    shots sharing a profile evaluate the curves once.
+
+    Args:
+        profile: Profile to render
+        period: Grid spacing in timeInShot units (tenths of a second)
+        durations: Time in milliseconds each non-skipped phase ran, phases
+            past the end are left out. By default phases run until their
+            time stop condition, else for their transition time, else for
+            DEFAULT_SIMULATED_PHASE_TIME.
+        use_numpy: True to require NumPy, False for pure Python, None to use
+            NumPy when installed
+
+    Returns:
+        timeInShot, targetPressure and targetPumpFlow as float arrays scaled
+        like the shot datapoints. The result is shared between callers and
+        must not be modified.
+
+    Raises:
+        ValueError: Invalid period or durations
+    """
+    if period <= 0:
+        raise ValueError(f"Simulation period must be positive, got {period}")
+    phases = tuple(_ for _ in profile.phases or () if not _.skip)
+    if durations is None:
+        durations = tuple(_phase_time(_) for _ in phases)
+    else:
+        durations = tuple(durations)
+        if any(_ < 0 for _ in durations):
+            raise ValueError(f"Phase durations must not be negative, got {durations}")
+    numpy = optional_numpy(use_numpy)
+    return _simulate(phases, float(period), durations, numpy is not None)
+
+
+def _phase_time(phase: GaggiuinoProfilePhase) -> int:
+    """Nominal phase duration in milliseconds."""
+    if phase.stopConditions.time is not None:
+        return phase.stopConditions.time
+    if phase.target is not None and phase.target.time:
+        return phase.target.time
+    return DEFAULT_SIMULATED_PHASE_TIME
+
+
+@lru_cache(maxsize=DEFAULT_SIMULATION_CACHE_SIZE)
+def _simulate(
+    phases: tuple[GaggiuinoProfilePhase, ...],
+    period: float,
+    durations: tuple[int, ...],
+    use_numpy: bool,
+) -> GaggiuinoShotDataPoints:
+    phases = phases[: len(durations)]
+    total = sum(durations[: len(phases)]) / MS_PER_TIME_IN_SHOT
+    count = int(total // period) + 1 if phases else 0
+
+    # Per phase: start and end on the grid, then the curve of each series
+    plans = []
+    last = {"PRESSURE": 0.0, "FLOW": 0.0}
+    start_time = 0.0
+    for phase, duration in zip(phases, durations):
+        end_time = start_time + duration / MS_PER_TIME_IN_SHOT
+        first = _grid_index(start_time, period)
+        stop = count if end_time >= total else _grid_index(end_time, period)
+        kind = phase.type.type
+        other = "FLOW" if kind == "PRESSURE" else "PRESSURE"
+        target = phase.target
+        if target is None:
+            curve = (last[kind], last[kind], None, "INSTANT")
+        else:
+            begin = (
+                last[kind] if target.start is None else target.start * DATAPOINT_SCALE
+            )
+            curve = (begin, target.end * DATAPOINT_SCALE, target.time, target.curve)
+        restriction = (phase.restriction or 0) * DATAPOINT_SCALE
+        plans.append((first, stop, start_time, kind, curve, restriction))
+        last[kind] = curve[1]
+        last[other] = restriction
+        start_time = end_time
+
+    if use_numpy:
+        return _render_numpy(optional_numpy(True), plans, period, count)
+    return _render_python(plans, period, count)
+
+
+def _grid_index(time: float, period: float) -> int:
+    """First grid point at or after a time, tolerating rounding errors."""
+    return math.ceil(time / period - 1e-9)
+
+
+def _ease(curve: str, pct: float) -> float:
+    if curve == "LINEAR":
+        return pct
+    if curve == "EASE_IN":
+        return pct**_EASE_POWER
+    if curve == "EASE_OUT":
+        return 1.0 - (1.0 - pct) ** _EASE_POWER
+    if curve == "EASE_IN_OUT":
+        return 0.5 * (math.sin((pct - 0.5) * math.pi) + 1.0)
+    # INSTANT and curves unknown to this version jump to the end value
+    return 1.0
+
+
+def _render_python(plans: list, period: float, count: int) -> GaggiuinoShotDataPoints:
+    columns = {"PRESSURE": [0.0] * count, "FLOW": [0.0] * count}
+    for first, stop, start_time, kind, curve, restriction in plans:
+        begin, end, time, name = curve
+        other = "FLOW" if kind == "PRESSURE" else "PRESSURE"
+        span = time / MS_PER_TIME_IN_SHOT if time else 0.0
+        for i in range(first, stop):
+            elapsed = i * period - start_time
+            pct = min(max(elapsed / span, 0.0), 1.0) if span > 0 else 1.0
+            columns[kind][i] = begin + (end - begin) * _ease(name, pct)
+            columns[other][i] = restriction
+    return GaggiuinoShotDataPoints(
+        timeInShot=array("d", (i * period for i in range(count))),
+        targetPressure=array("d", columns["PRESSURE"]),
+        targetPumpFlow=array("d", columns["FLOW"]),
+    )
+
+
+def _render_numpy(
+    numpy, plans: list, period: float, count: int
+) -> GaggiuinoShotDataPoints:
+    grid = numpy.arange(count) * period
+    columns = {"PRESSURE": numpy.zeros(count), "FLOW": numpy.zeros(count)}
+    for first, stop, start_time, kind, curve, restriction in plans:
+        begin, end, time, name = curve
+        other = "FLOW" if kind == "PRESSURE" else "PRESSURE"
+        span = time / MS_PER_TIME_IN_SHOT if time else 0.0
+        if span > 0:
+            pct = numpy.clip((grid[first:stop] - start_time) / span, 0.0, 1.0)
+        else:
+            pct = numpy.ones(stop - first)
+        if name == "LINEAR":
+            eased = pct
+        elif name == "EASE_IN":
+            eased = pct**_EASE_POWER
+        elif name == "EASE_OUT":
+            eased = 1.0 - (1.0 - pct) ** _EASE_POWER
+        elif name == "EASE_IN_OUT":
+            eased = 0.5 * (numpy.sin((pct - 0.5) * numpy.pi) + 1.0)
+        else:
+            eased = numpy.ones_like(pct)
+        columns[kind][first:stop] = begin + (end - begin) * eased
+        columns[other][first:stop] = restriction
+
+    def _pack(values) -> array:
+        packed = array("d")
+        packed.frombytes(numpy.ascontiguousarray(values, dtype=numpy.float64).tobytes())
+        return packed
+
+    return GaggiuinoShotDataPoints(
+        timeInShot=_pack(grid),
+        targetPressure=_pack(columns["PRESSURE"]),
+        targetPumpFlow=_pack(columns["FLOW"]),
+    )
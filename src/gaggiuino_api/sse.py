@@ -0,0 +1,79 @@
+"""Server-Sent Events parsing for Gaggiuino"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class GaggiuinoEvent:
+    """
+    event: status
+    id: 42
+    data: {"upTime": "89107", "profileId": "7", ...}
+    """
+
+    event: str = "message"
+    data: str = ""
+    id: str | None = None
+
+    def json(self) -> Any:
+        """Decode the event data as JSON."""
+        return json.loads(self.data)
+
+
+class GaggiuinoEventParser:
+    """Incremental parser of a ``text/event-stream`` body, fed line by line."""
+
+    def __init__(self, last_event_id: str | None = None) -> None:
+        self._event = ""
+        self._data: list[str] = []
+        self.last_event_id = last_event_id
+        # Reconnection delay requested by the server, in milliseconds
+        self.retry: int | None = None
+
+    def feed_line(self, line: str) -> GaggiuinoEvent | None:
+        """Consume a single line without its terminator.
+
+        Returns:
+            Event completed by this line or None
+        """
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "event":
+            self._event = value
+        elif field == "data":
+            self._data.append(value)
+        elif field == "id":
+            # ids containing NULL must be ignored per the spec
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self.retry = int(value)
+        return None
+
+    def discard(self) -> None:
+        """Drop a partially received event, e.g. when the stream is cut."""
+        self._event = ""
+        self._data = []
+
+    def _dispatch(self) -> GaggiuinoEvent | None:
+        event = None
+        if self._data:
+            event = GaggiuinoEvent(
+                event=self._event or "message",
+                data="\n".join(self._data),
+                id=self.last_event_id,
+            )
+        self.discard()
+        return event
@@ -0,0 +1,195 @@
+"""Incremental JSON parsing of shot responses for Gaggiuino"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from array import array
+from typing import Any
+
+from gaggiuino_api.models import DATAPOINT_TYPECODES
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<punct>[{}\[\]:,])
+        |(?P<string>"(?:[^"\\]|\\.)*")
+        |(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(?=[\s,\]}]|$))
+        |(?P<literal>true|false|null)
+    )""",
+    re.VERBOSE,
+)
+_LITERALS = {"true": True, "false": False, "null": None}
+_VALUE_STATES = ("value", "first_value")
+
+
+class GaggiuinoShotStreamParser:
+    """Parse a shot response chunk by chunk.
+
+    Scalars, the profile and other small values are parsed as they arrive,
+    while the numbers of the ``datapoints`` series are packed straight into
+    arrays of the typecodes used by GaggiuinoShotDataPoints. Only the
+    unconsumed tail of the last chunk is buffered, so memory stays bounded by
+    the chunk size plus the packed samples.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # Open containers with the key they will be stored under in the parent
+        self._stack: list[tuple[dict | list, str | None]] = []
+        self._key: str | None = None
+        # Next allowed token: value, key, colon, separator (a comma or the
+        # closing bracket) or end; first_value and first_key also accept the
+        # closing bracket of an empty container
+        self._expect = "value"
+        self._series: array | None = None
+        # Nothing consumed of the series yet, so it may be empty
+        self._series_open = False
+        self._result: Any = None
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the response body.
+
+        Raises:
+            ValueError: The body is not valid JSON
+        """
+        self._buffer += self._decoder.decode(chunk)
+        self._parse(final=False)
+
+    def close(self) -> Any:
+        """Finish parsing.
+
+        Returns:
+            Parsed shot payload with the datapoints series as arrays, or None
+            if the body was empty
+
+        Raises:
+            ValueError: The body is truncated or not valid JSON
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._parse(final=True)
+        if self._buffer.strip():
+            raise ValueError(f"Unexpected data: {self._buffer[:20]!r}")
+        if self._stack or self._series is not None:
+            raise ValueError("Truncated JSON")
+        return self._result
+
+    def _parse(self, final: bool) -> None:
+        buffer = self._buffer
+        pos = 0
+        while True:
+            if self._series is not None:
+                pos, complete = self._parse_series(buffer, pos)
+                if not complete:
+                    break
+                self._expect = "separator"
+                continue
+
+            match = _TOKEN.match(buffer, pos)
+            if match is None:
+                # Partial string or literal, wait for the next chunk
+                break
+            if match.end() == len(buffer) and match.lastgroup == "number" and not final:
+                # The number may continue in the next chunk
+                break
+            pos = match.end()
+
+            kind = match.lastgroup
+            token = match.group(kind)
+            if kind == "punct":
+                self._punct(token)
+            elif kind == "string" and self._expect in ("key", "first_key"):
+                self._key = json.loads(token)
+                self._expect = "colon"
+            elif self._expect not in _VALUE_STATES:
+                raise ValueError(f"Unexpected {token!r}")
+            elif kind == "literal":
+                self._value(_LITERALS[token])
+            else:
+                self._value(json.loads(token))
+
+        self._buffer = buffer[pos:]
+
+    def _parse_series(self, buffer: str, pos: int) -> tuple[int, bool]:
+        end = buffer.find("]", pos)
+        if end == -1:
+            # Pack the complete numbers and keep the last, possibly partial one
+            cut = buffer.rfind(",", pos)
+            if cut == -1:
+                return pos, False
+            self._extend(buffer[pos:cut], required=True)
+            # A number must follow the consumed comma
+            self._series_open = False
+            return cut + 1, False
+
+        self._extend(buffer[pos:end], required=not self._series_open)
+        self._series = None
+        return end + 1, True
+
+    def _extend(self, text: str, required: bool) -> None:
+        if not text.strip():
+            if required:
+                raise ValueError("Missing number in series")
+            return
+        values = text.split(",")
+        try:
+            self._series.fromlist(list(map(int, values)))
+        except ValueError:
+            # Tolerate firmware sending floats for the integer series
+            self._series.fromlist([round(float(_)) for _ in values])
+
+    def _punct(self, token: str) -> None:
+        expect = self._expect
+        if token in "{[":
+            if expect not in _VALUE_STATES:
+                raise ValueError(f"Unexpected {token!r}")
+            typecode = self._datapoints_typecode() if token == "[" else None
+            if typecode is not None:
+                self._series = array(typecode)
+                self._series_open = True
+                self._value(self._series)
+            else:
+                self._open({} if token == "{" else [])
+        elif token == ":":
+            if expect != "colon":
+                raise ValueError(f"Unexpected {token!r}")
+            self._expect = "value"
+        elif token == ",":
+            if expect != "separator":
+                raise ValueError(f"Unexpected {token!r}")
+            self._expect = "key" if isinstance(self._stack[-1][0], dict) else "value"
+        else:
+            empty = "first_key" if token == "}" else "first_value"
+            if (
+                not self._stack
+                or isinstance(self._stack[-1][0], dict) != (token == "}")
+                or expect not in ("separator", empty)
+            ):
+                raise ValueError(f"Unexpected {token!r}")
+            _, self._key = self._stack.pop()
+            self._expect = "separator" if self._stack else "end"
+
+    def _datapoints_typecode(self) -> str | None:
+        if len(self._stack) != 2 or not isinstance(self._stack[-1][0], dict):
+            return None
+        if self._stack[-1][1] != "datapoints":
+            return None
+        return DATAPOINT_TYPECODES.get(self._key)
+
+    def _open(self, container: dict | list) -> None:
+        self._value(container)
+        self._stack.append((container, self._key))
+        self._expect = "first_key" if isinstance(container, dict) else "first_value"
+
+    def _value(self, value: Any) -> None:
+        if not self._stack:
+            self._result = value
+            self._expect = "end"
+            return
+        self._expect = "separator"
+        parent = self._stack[-1][0]
+        if isinstance(parent, dict):
+            parent[self._key] = value
+        else:
+            parent.append(value)
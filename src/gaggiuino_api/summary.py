@@ -0,0 +1,259 @@
+"""Shot metrics for Gaggiuino"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable
+
+from gaggiuino_api.const import DATAPOINT_SCALE, DEFAULT_FIRST_DRIP_WEIGHT
+from gaggiuino_api.models import GaggiuinoShot
+from gaggiuino_api.tools import optional_numpy
+
+
+@dataclass(frozen=True)
+class GaggiuinoShotSummary:
+    """
+    {
+        'shotId': 1,
+        'duration': 28.4,
+        'finalWeight': 36.2,
+        'targetWeight': 36,
+        'dose': 18,
+        'brewRatio': 2.01,
+        'peakPressure': 9.1,
+        'meanPressure': 6.3,
+        'timeToFirstDrip': 7.2,
+        'flowStability': 0.12
+    }
+
+    Field Notes:
+    - Times are in seconds, weights in grams and pressures in bar
+    - Metrics are None when the shot lacks the series they need
+    - targetWeight: Weight stop condition of the profile
+    - dose: coffeeIn of the profile recipe
+    - brewRatio: finalWeight over dose
+    - timeToFirstDrip: Time until the scale first reads the first drip weight
+    - flowStability: Coefficient of variation of weightFlow from the first
+      drip on, lower is steadier
+    """
+
+    shotId: int
+    duration: float | None = None
+    finalWeight: float | None = None
+    targetWeight: float | None = None
+    dose: float | None = None
+    brewRatio: float | None = None
+    peakPressure: float | None = None
+    meanPressure: float | None = None
+    timeToFirstDrip: float | None = None
+    flowStability: float | None = None
+
+
+def summarize_shots(
+    shots: Iterable[GaggiuinoShot],
+    *,
+    first_drip_weight: float = DEFAULT_FIRST_DRIP_WEIGHT,
+    use_numpy: bool | None = None,
+) -> list[GaggiuinoShotSummary]:
+    """Compute the summaries of many shots at once.
+
+    With NumPy the series of all shots are concatenated and every metric is
+    computed for all shots in one vectorized pass. Summaries computed with
+    the default first drip weight are also cached on the shots, see
+    GaggiuinoShot.summary.
+
+    Args:
+        shots: Shots to summarize
+        first_drip_weight: Scale reading in grams taken as the first drip
+        use_numpy: True to require NumPy, False for pure Python, None to use
+            NumPy when installed
+
+    Returns:
+        One summary per shot in the same order
+    """
+    shots = list(shots)
+    numpy = optional_numpy(use_numpy)
+    if numpy is not None:
+        summaries = _summarize_numpy(numpy, shots, first_drip_weight)
+    else:
+        summaries = [_summarize_python(_, first_drip_weight) for _ in shots]
+
+    if first_drip_weight == DEFAULT_FIRST_DRIP_WEIGHT:
+        for shot, summary in zip(shots, summaries):
+            # GaggiuinoShot.summary is a cached_property
+            shot.__dict__["summary"] = summary
+    return summaries
+
+
+def _recipe(shot: GaggiuinoShot) -> dict:
+    """Target weight and dose of the shot's profile."""
+    stop = shot.profile.globalStopConditions or {}
+    recipe = shot.profile.recipe or {}
+    return {"targetWeight": stop.get("weight"), "dose": recipe.get("coffeeIn")}
+
+
+def _ratio(weight: float | None, dose: float | None) -> float | None:
+    if weight is None or not dose:
+        return None
+    return weight / dose
+
+
+def _summarize_python(
+    shot: GaggiuinoShot, first_drip_weight: float
+) -> GaggiuinoShotSummary:
+    datapoints = shot.datapoints
+    recipe = _recipe(shot)
+    times = datapoints.timeInShot
+    if not times:
+        return GaggiuinoShotSummary(shot.id, **recipe)
+
+    count = len(times)
+    weight, pressure, flow = (
+        values if values is not None and len(values) == count else None
+        for values in (
+            datapoints.shotWeight,
+            datapoints.pressure,
+            datapoints.weightFlow,
+        )
+    )
+
+    final_weight = drip_time = stability = None
+    if weight is not None:
+        final_weight = weight[-1] / DATAPOINT_SCALE
+        threshold = first_drip_weight * DATAPOINT_SCALE
+        drip = next((i for i, _ in enumerate(weight) if _ >= threshold), None)
+        if drip is not None:
+            drip_time = (times[drip] - times[0]) / DATAPOINT_SCALE
+            if flow is not None:
+                stability = _variation(flow[drip:])
+
+    peak = mean = None
+    if pressure is not None:
+        peak = max(pressure) / DATAPOINT_SCALE
+        mean = sum(pressure) / count / DATAPOINT_SCALE
+
+    return GaggiuinoShotSummary(
+        shotId=shot.id,
+        duration=times[-1] / DATAPOINT_SCALE,
+        finalWeight=final_weight,
+        brewRatio=_ratio(final_weight, recipe["dose"]),
+        peakPressure=peak,
+        meanPressure=mean,
+        timeToFirstDrip=drip_time,
+        flowStability=stability,
+        **recipe,
+    )
+
+
+def _variation(values) -> float | None:
+    count = len(values)
+    if count < 2:
+        return None
+    mean = sum(values) / count
+    if mean <= 0:
+        return None
+    variance = sum(_ * _ for _ in values) / count - mean * mean
+    return math.sqrt(max(variance, 0.0)) / mean
+
+
+def _summarize_numpy(
+    numpy, shots: list[GaggiuinoShot], first_drip_weight: float
+) -> list[GaggiuinoShotSummary]:
+    float64 = numpy.float64
+    lengths = numpy.array(
+        [len(_.datapoints.timeInShot or ()) for _ in shots], dtype=numpy.int64
+    )
+    total = int(lengths.sum())
+    starts = numpy.cumsum(lengths) - lengths
+    present = lengths > 0
+    ends = starts + lengths - 1
+
+    def _column(name: str) -> tuple:
+        """Concatenated series and which shots have it, zeros where missing."""
+        parts, has = [], []
+        for shot, length in zip(shots, lengths.tolist()):
+            values = getattr(shot.datapoints, name)
+            ok = values is not None and length > 0 and len(values) == length
+            has.append(ok)
+            parts.append(
+                numpy.frombuffer(values, dtype=values.typecode)
+                if ok
+                else numpy.zeros(length, dtype=float64)
+            )
+        column = numpy.concatenate(parts).astype(float64) if parts else numpy.zeros(0)
+        return column, numpy.array(has, dtype=bool)
+
+    def _sums(values) -> numpy.ndarray:
+        # reduceat misbehaves on empty segments, so skip them
+        sums = numpy.zeros(len(shots))
+        if total:
+            sums[present] = numpy.add.reduceat(values, starts[present])
+        return sums
+
+    times, _ = _column("timeInShot")
+    weight, has_weight = _column("shotWeight")
+    pressure, has_pressure = _column("pressure")
+    flow, has_flow = _column("weightFlow")
+    safe_ends = numpy.where(present, ends, 0)
+
+    peak = numpy.zeros(len(shots))
+    if total:
+        peak[present] = numpy.maximum.reduceat(pressure, starts[present])
+    mean = _sums(pressure) / numpy.maximum(lengths, 1)
+
+    # First sample per shot reaching the first drip weight
+    hits = numpy.flatnonzero(weight >= first_drip_weight * DATAPOINT_SCALE)
+    first = numpy.searchsorted(hits, starts)
+    first_hit = (
+        hits[numpy.minimum(first, max(len(hits) - 1, 0))] if len(hits) else starts
+    )
+    has_drip = has_weight & present & (first < len(hits)) & (first_hit <= ends)
+    drip_index = numpy.where(has_drip, first_hit, 0)
+
+    # Flow from the first drip on
+    segment = numpy.repeat(numpy.arange(len(shots)), lengths)
+    after = numpy.arange(total) >= numpy.where(has_drip, drip_index, ends + 1)[segment]
+    count = _sums(after.astype(float64))
+    flow_mean = _sums(flow * after) / numpy.maximum(count, 1)
+    flow_var = _sums(flow * flow * after) / numpy.maximum(count, 1) - flow_mean**2
+    has_stability = has_drip & has_flow & (count >= 2) & (flow_mean > 0)
+    stability = numpy.sqrt(numpy.maximum(flow_var, 0.0)) / numpy.where(
+        flow_mean > 0, flow_mean, 1.0
+    )
+
+    duration = times[safe_ends] / DATAPOINT_SCALE if total else numpy.zeros(len(shots))
+    final_weight = (
+        weight[safe_ends] / DATAPOINT_SCALE if total else numpy.zeros(len(shots))
+    )
+    drip_time = (
+        (times[drip_index] - times[numpy.where(present, starts, 0)]) / DATAPOINT_SCALE
+        if total
+        else numpy.zeros(len(shots))
+    )
+
+    summaries = []
+    for i, shot in enumerate(shots):
+        recipe = _recipe(shot)
+        if not present[i]:
+            summaries.append(GaggiuinoShotSummary(shot.id, **recipe))
+            continue
+        weight_i = float(final_weight[i]) if has_weight[i] else None
+        summaries.append(
+            GaggiuinoShotSummary(
+                shotId=shot.id,
+                duration=float(duration[i]),
+                finalWeight=weight_i,
+                brewRatio=_ratio(weight_i, recipe["dose"]),
+                peakPressure=float(peak[i] / DATAPOINT_SCALE)
+                if has_pressure[i]
+                else None,
+                meanPressure=float(mean[i] / DATAPOINT_SCALE)
+                if has_pressure[i]
+                else None,
+                timeToFirstDrip=float(drip_time[i]) if has_drip[i] else None,
+                flowStability=float(stability[i]) if has_stability[i] else None,
+                **recipe,
+            )
+        )
+    return summaries
@@ -0,0 +1,102 @@
+"""Incremental shot history sync for Gaggiuino"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from gaggiuino_api.const import DEFAULT_SHOT_CONCURRENCY
+from gaggiuino_api.models import GaggiuinoShot
+
+if TYPE_CHECKING:
+    from gaggiuino_api.api import GaggiuinoAPI
+    from gaggiuino_api.shot_cache import GaggiuinoShotCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GaggiuinoSyncResult:
+    """
+    {
+        'previousShotId': 100,
+        'lastShotId': 104,
+        'syncedShotIds': [101, 102, 104]
+    }
+    """
+
+    previousShotId: int
+    lastShotId: int
+    syncedShotIds: list[int]
+
+
+class GaggiuinoShotSync:
+    """Archive new shots of a machine into the API's shot cache.
+
+    The cache remembers the highest shot ID already archived, so each run only
+    downloads shots recorded since the previous one. Progress is saved after
+    every shot, so an interrupted run resumes where it stopped, and shots
+    already in the cache are never downloaded again. Create the cache with
+    ``max_bytes=None`` to keep the full history.
+    """
+
+    def __init__(
+        self,
+        api: GaggiuinoAPI,
+        *,
+        concurrency: int = DEFAULT_SHOT_CONCURRENCY,
+        on_shot: Callable[[GaggiuinoShot], Any] | None = None,
+    ) -> None:
+        if api.shot_cache is None:
+            raise ValueError("GaggiuinoShotSync requires an API with a shot_cache")
+        self.api = api
+        self.concurrency = concurrency
+        self.on_shot = on_shot
+
+    @property
+    def store(self) -> GaggiuinoShotCache:
+        return self.api.shot_cache
+
+    async def sync(self) -> GaggiuinoSyncResult:
+        """Download the shots recorded since the last sync.
+
+        Returns:
+            Summary of the synced shot IDs
+        """
+        previous = await asyncio.to_thread(lambda: self.store.last_synced_id)
+        latest_result = await self.api.get_latest_shot_id()
+        latest = latest_result.lastShotId if latest_result is not None else 0
+
+        if latest < previous:
+            _LOGGER.warning(
+                "Latest shot %s is below the synced shot %s, was the history reset?",
+                latest,
+                previous,
+            )
+            return GaggiuinoSyncResult(previous, previous, [])
+
+        synced = []
+        # Ordered download: once a shot arrives every lower ID was processed,
+        # so the mark can advance past deleted shots as well
+        async for shot in self.api.get_shots(
+            range(previous + 1, latest + 1),
+            concurrency=self.concurrency,
+            ordered=True,
+        ):
+            await asyncio.to_thread(self._mark, shot.id)
+            synced.append(shot.id)
+            if self.on_shot is not None:
+                result = self.on_shot(shot)
+                if inspect.isawaitable(result):
+                    await result
+
+        if latest > previous:
+            await asyncio.to_thread(self._mark, latest)
+        _LOGGER.debug("Synced %s shots up to %s", len(synced), latest)
+        return GaggiuinoSyncResult(previous, latest, synced)
+
+    def _mark(self, shot_id: int) -> None:
+        self.store.last_synced_id = shot_id
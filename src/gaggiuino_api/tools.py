@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from types import ModuleType
+from urllib.parse import urlsplit
+
 
 def strtobool(val: str):  # distutil strtobool
     """Convert a string representation of truth to true (1) or false (0).
@@ -23,3 +26,37 @@ def strtobool(val: str):  # distutil strtobool
         return False
     else:
         raise ValueError(f"invalid truth value {val}")
+
+
+def endpoint_path(url: str) -> str:
+    """Path of a URL with numeric segments replaced by {id}.
+
+    Groups requests by endpoint, e.g. 'http://host/api/shots/42?x=1' becomes
+    '/api/shots/{id}'.
+    """
+    path = urlsplit(url).path
+    return "/".join("{id}" if _.isdigit() else _ for _ in path.split("/"))
+
+
+def optional_numpy(use_numpy: bool | None = None) -> ModuleType | None:
+    """Import NumPy for an accelerated code path.
+
+    Args:
+        use_numpy: True to require NumPy, False to skip it, None to use it
+            when installed
+
+    Returns:
+        The numpy module or None for the pure Python path
+
+    Raises:
+        ImportError: NumPy was required but is not installed
+    """
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise
+        return None
+    return numpy
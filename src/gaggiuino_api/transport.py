@@ -0,0 +1,124 @@
+"""Connection pooling for Gaggiuino"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, TCPConnector, TraceConfig
+
+from gaggiuino_api.const import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_LIMIT_PER_HOST,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_DNS_CACHE_TTL,
+)
+
+
+@dataclass(frozen=True)
+class GaggiuinoTransport:
+    """Connector profile used when the client creates its own session.
+
+    The defaults keep a couple of sockets alive towards the machine and cache
+    the resolved address of ``gaggiuino.local``, so repeated polls skip both
+    the mDNS lookup and the TCP handshake.
+
+    Field Notes:
+    - limit: total number of simultaneous connections
+    - limit_per_host: simultaneous connections to the same machine
+    - keepalive_timeout: seconds an idle connection is kept for reuse
+    - ttl_dns_cache: seconds a resolved address is cached, None caches forever
+    - force_close: open a new connection for every request (disables keep-alive)
+    """
+
+    limit: int = DEFAULT_CONNECTION_LIMIT
+    limit_per_host: int = DEFAULT_LIMIT_PER_HOST
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    ttl_dns_cache: int | None = DEFAULT_DNS_CACHE_TTL
+    force_close: bool = False
+
+    @staticmethod
+    def no_keepalive() -> "GaggiuinoTransport":
+        """Fallback profile for firmware that drops idle connections."""
+        return GaggiuinoTransport(force_close=True)
+
+    def create_connector(self) -> TCPConnector:
+        """Create an aiohttp connector for this profile."""
+        kwargs: dict[str, Any] = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "use_dns_cache": True,
+        }
+        # aiohttp refuses keepalive_timeout together with force_close
+        if self.force_close:
+            kwargs["force_close"] = True
+        else:
+            kwargs["keepalive_timeout"] = self.keepalive_timeout
+        return TCPConnector(**kwargs)
+
+
+@dataclass
+class GaggiuinoTransportStats:
+    """Connection and latency counters of a client.
+
+    Connection and DNS counters are only collected for sessions created by the
+    client itself; request counters are collected for any session.
+    """
+
+    requests: int = 0
+    request_time: float = 0.0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests served over an already open connection."""
+        total = self.connections_created + self.connections_reused
+        if not total:
+            return 0.0
+        return self.connections_reused / total
+
+    @property
+    def mean_request_time(self) -> float:
+        """Average request latency in seconds."""
+        if not self.requests:
+            return 0.0
+        return self.request_time / self.requests
+
+    def record_request(self, elapsed: float) -> None:
+        self.requests += 1
+        self.request_time += elapsed
+
+    def trace_config(self) -> TraceConfig:
+        """Create an aiohttp trace config feeding these counters."""
+        trace_config = TraceConfig()
+
+        async def _on_create(
+            _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+        ) -> None:
+            self.connections_created += 1
+
+        async def _on_reuse(
+            _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+        ) -> None:
+            self.connections_reused += 1
+
+        async def _on_dns_hit(
+            _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+        ) -> None:
+            self.dns_cache_hits += 1
+
+        async def _on_dns_miss(
+            _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+        ) -> None:
+            self.dns_cache_misses += 1
+
+        trace_config.on_connection_create_end.append(_on_create)
+        trace_config.on_connection_reuseconn.append(_on_reuse)
+        trace_config.on_dns_cache_hit.append(_on_dns_hit)
+        trace_config.on_dns_cache_miss.append(_on_dns_miss)
+        return trace_config
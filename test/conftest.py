@@ -293,3 +293,11 @@ def mock_post_factory():
         return _mock_post
 
     return _create_mock_post
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def use_numpy(request):
+    """Run a test on the pure Python and the NumPy code path."""
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
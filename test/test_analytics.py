@@ -0,0 +1,166 @@
+"""Tests for batch shot analytics."""
+
+from dataclasses import astuple
+
+import pytest
+
+from gaggiuino_api import (
+    GaggiuinoShot,
+    GaggiuinoShotAggregate,
+    GaggiuinoShotCache,
+    GaggiuinoShotDeviation,
+    aggregate_shots,
+    score_shots,
+)
+
+DAY = 86400
+
+
+@pytest.fixture
+def history(mock_shot_data):
+    """Five shots of two profiles over two days, final weights 10 to 50 g."""
+    shots = []
+    for index, (profile_id, day) in enumerate([(1, 0), (1, 0), (1, 0), (2, 0), (1, 1)]):
+        data = {
+            **mock_shot_data,
+            "id": index + 1,
+            "timestamp": 1731283200 + day * DAY + index,
+            "profile": {**mock_shot_data["profile"], "id": profile_id},
+            "datapoints": {
+                **mock_shot_data["datapoints"],
+                "shotWeight": [0, 0, (index + 1) * 100],
+            },
+        }
+        shots.append(data)
+    return shots
+
+
+def test_aggregate_by_profile(history, use_numpy):
+    """Test percentiles per profile over all time."""
+    shots = [GaggiuinoShot.from_dict(_) for _ in history]
+
+    aggregates = aggregate_shots(shots, use_numpy=use_numpy)
+
+    assert [(_.profileId, _.shots) for _ in aggregates] == [(1, 4), (2, 1)]
+    first = aggregates[0]
+    # Final weights 10, 20, 30 and 50 g
+    assert first.finalWeightP50 == pytest.approx(25.0)
+    assert first.finalWeightP95 == pytest.approx(47.0)
+    assert first.durationP50 == pytest.approx(0.5)
+    assert first.peakPressureP95 == pytest.approx(0.3)
+    assert aggregates[1].finalWeightP50 == pytest.approx(40.0)
+
+
+def test_aggregate_by_window(history):
+    """Test shots are grouped into time windows."""
+    shots = [GaggiuinoShot.from_dict(_) for _ in history]
+
+    aggregates = aggregate_shots(shots, window=DAY)
+
+    assert [(_.profileId, _.windowStart, _.shots) for _ in aggregates] == [
+        (1, 1731283200, 3),
+        (1, 1731283200 + DAY, 1),
+        (2, 1731283200, 1),
+    ]
+
+
+def test_aggregate_archive_in_workers(history, tmp_path):
+    """Test aggregating a shot archive in worker processes."""
+    with GaggiuinoShotCache(tmp_path / "archive.db", max_bytes=None) as cache:
+        for data in history:
+            cache.put(data["id"], data)
+
+        in_process = aggregate_shots(cache)
+        pooled = aggregate_shots(cache, workers=2)
+
+    assert pooled == in_process
+    assert isinstance(pooled[0], GaggiuinoShotAggregate)
+
+
+def test_aggregate_missing_metrics(mock_shot_data):
+    """Test metrics no shot has are reported as None."""
+    shot = GaggiuinoShot.from_dict({**mock_shot_data, "datapoints": {}})
+
+    [aggregate] = aggregate_shots([shot])
+
+    assert aggregate.shots == 1
+    assert aggregate.finalWeightP50 is None
+
+
+@pytest.fixture
+def tracked_shot(mock_shot_data):
+    """A shot missing its pressure target twice, over a timed and an open phase."""
+    data = dict(mock_shot_data)
+    data["profile"] = {
+        **mock_shot_data["profile"],
+        "phases": [
+            {"restriction": 9, "stopConditions": {"time": 400}, "type": "FLOW"},
+            {"restriction": 3, "stopConditions": {}, "type": "PRESSURE"},
+        ],
+    }
+    data["datapoints"] = {
+        "timeInShot": [0, 2, 4, 6, 8],
+        "pressure": [10, 20, 30, 40, 50],
+        "targetPressure": [10, 30, 30, 40, 80],
+        "pumpFlow": [0, 10, 20, 20, 20],
+        "temperature": [900, 900, 900, 900, 900],
+        "targetTemperature": [900, 900, 900, 900, 930],
+    }
+    return data
+
+
+def test_score_shot(tracked_shot, use_numpy):
+    """Test the deviation of each series over the shot and per phase."""
+    shot = GaggiuinoShot.from_dict(tracked_shot)
+
+    scores = score_shots([shot], use_numpy=use_numpy)
+
+    # pumpFlow has no target
+    assert [(_.phaseIndex, _.series) for _ in scores] == [
+        (None, "pressure"),
+        (None, "temperature"),
+        (0, "pressure"),
+        (0, "temperature"),
+        (1, "pressure"),
+        (1, "temperature"),
+    ]
+    assert scores[0] == GaggiuinoShotDeviation(
+        shotId=1,
+        series="pressure",
+        phaseIndex=None,
+        rmse=pytest.approx(200**0.5 / 10),
+        maxError=3.0,
+        timeInTolerance=0.75,
+    )
+    # The last sample spans no time
+    assert scores[1].timeInTolerance == 1.0
+    assert scores[2].timeInTolerance == pytest.approx(4 / 6)
+    assert (scores[4].maxError, scores[4].timeInTolerance) == (3.0, 1.0)
+
+
+def test_score_tolerances_and_cache(tracked_shot):
+    """Test default scores are cached on the shot and custom ones are not."""
+    shot = GaggiuinoShot.from_dict(tracked_shot)
+
+    scores = score_shots([shot])
+    cached = shot.deviation
+    assert cached == scores
+
+    loose = score_shots([shot], tolerances={"pressure": 3.0})
+    assert loose[0].timeInTolerance == 1.0
+    assert shot.deviation is cached
+
+
+def test_score_archive_backends_agree(history, tracked_shot, tmp_path):
+    """Test scoring an archive gives the same rows on both paths."""
+    pytest.importorskip("numpy")
+    with GaggiuinoShotCache(tmp_path / "archive.db", max_bytes=None) as cache:
+        for data in history + [dict(tracked_shot, id=6)]:
+            cache.put(data["id"], data)
+
+        python = score_shots(cache, use_numpy=False)
+        numpy = score_shots(cache, use_numpy=True)
+
+    assert len(python) == len(numpy) == 5 * 3 + 6
+    for expected, actual in zip(python, numpy):
+        assert astuple(actual) == pytest.approx(astuple(expected))
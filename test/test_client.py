@@ -0,0 +1,672 @@
+"""Tests for the GaggiuinoClient request pipeline."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gaggiuino_api import (
+    GaggiuinoAPI,
+    GaggiuinoCircuitBreaker,
+    GaggiuinoCircuitOpenError,
+    GaggiuinoConnectionError,
+    GaggiuinoConnectionTimeoutError,
+    GaggiuinoEndpointNotFoundError,
+    GaggiuinoJSONBackend,
+    GaggiuinoRateLimiter,
+    GaggiuinoResponseCache,
+    GaggiuinoRetryPolicy,
+    get_json_backend,
+)
+from gaggiuino_api.const import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+from gaggiuino_api.json_backend import JSON_BACKENDS
+from gaggiuino_api.tools import endpoint_path
+
+
+@pytest.fixture
+def slow_request(api_client, monkeypatch):
+    """Replace _request with a slow fake recording every round-trip."""
+    calls = []
+
+    async def _mock_request(method, url, params=None, **kwargs):
+        calls.append((method, url, params))
+        await asyncio.sleep(0.01)
+        if "fail" in url:
+            raise GaggiuinoConnectionError("Connection failed")
+        return {"url": url, "params": params}
+
+    monkeypatch.setattr(api_client, "_request", _mock_request)
+    return calls
+
+
+# Request Coalescing Tests
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_coalesces_concurrent_requests(api_client, slow_request):
+    """Test concurrent identical GETs share one round-trip."""
+    coalesced = api_client.coalesced_requests
+    url = f"{api_client.api_base}/system/status"
+
+    results = await asyncio.gather(*(api_client.get(url) for _ in range(5)))
+
+    assert len(slow_request) == 1
+    assert all(result is results[0] for result in results)
+    assert api_client.coalesced_requests - coalesced == 4
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_does_not_coalesce_different_requests(api_client, slow_request):
+    """Test GETs with different URLs or params are sent separately."""
+    url = f"{api_client.api_base}/shots/1"
+
+    await asyncio.gather(
+        api_client.get(url),
+        api_client.get(url, params={"a": 1}),
+        api_client.get(f"{api_client.api_base}/shots/2"),
+    )
+
+    assert len(slow_request) == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_coalesced_error(api_client, slow_request):
+    """Test every coalesced caller receives the shared error."""
+    url = f"{api_client.api_base}/fail"
+
+    results = await asyncio.gather(
+        *(api_client.get(url) for _ in range(3)), return_exceptions=True
+    )
+
+    assert len(slow_request) == 1
+    assert all(isinstance(result, GaggiuinoConnectionError) for result in results)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_sequential_requests_not_coalesced(api_client, slow_request):
+    """Test a finished request is not reused by later callers."""
+    url = f"{api_client.api_base}/system/status"
+
+    await api_client.get(url)
+    await api_client.get(url)
+
+    assert len(slow_request) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_survives_leader_cancellation(api_client, slow_request):
+    """Test followers still get the response when the first caller is cancelled."""
+    url = f"{api_client.api_base}/system/status"
+
+    leader = asyncio.ensure_future(api_client.get(url))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(api_client.get(url))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    result = await follower
+
+    assert result["url"] == url
+    assert len(slow_request) == 1
+
+
+# Response Cache Tests
+
+
+def test_cache_policy_longest_prefix():
+    """Test the most specific policy applies and unknown paths are not cached."""
+    cache = GaggiuinoResponseCache()
+    base = "http://gaggiuino.local/api"
+
+    assert cache.ttl(f"{base}/settings/versions") == 6 * 3600.0
+    assert cache.ttl(f"{base}/settings/boiler") == 300.0
+    assert cache.ttl(f"{base}/settings") == 300.0
+    assert cache.ttl(f"{base}/settingsfoo") is None
+    assert cache.ttl(f"{base}/system/status") is None
+
+
+def test_cache_expiry(monkeypatch):
+    """Test entries expire after their lifetime."""
+    now = 1000.0
+    monkeypatch.setattr("gaggiuino_api.cache.time.monotonic", lambda: now)
+    cache = GaggiuinoResponseCache({"/api/settings": 10.0})
+    url = "http://gaggiuino.local/api/settings"
+
+    cache.set("key", url, {"a": 1})
+    assert cache.get("key") == (True, {"a": 1})
+
+    now += 11
+    assert cache.get("key") == (False, None)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cache_lru_bound():
+    """Test the least recently used entry is evicted first."""
+    cache = GaggiuinoResponseCache({"/api": 60.0}, max_entries=2)
+    url = "http://gaggiuino.local/api"
+
+    cache.set("a", f"{url}/a", 1)
+    cache.set("b", f"{url}/b", 2)
+    cache.get("a")
+    cache.set("c", f"{url}/c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+
+
+def test_cache_invalidate():
+    """Test invalidating exact URLs and URL prefixes."""
+    cache = GaggiuinoResponseCache({"/api": 60.0})
+    url = "http://gaggiuino.local/api/settings"
+    cache.set("all", url, 1)
+    cache.set("boiler", f"{url}/boiler", 2)
+
+    assert cache.invalidate(url) == 1
+    assert cache.get("boiler") == (True, 2)
+    assert cache.invalidate(url, prefix=True) == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_served_from_cache(api_client, slow_request, monkeypatch):
+    """Test cached endpoints are fetched once and uncached ones every time."""
+    monkeypatch.setattr(api_client, "cache", GaggiuinoResponseCache())
+    versions_url = f"{api_client.api_base}/settings/versions"
+    status_url = f"{api_client.api_base}/system/status"
+
+    for _ in range(3):
+        await api_client.get(versions_url)
+        await api_client.get(status_url)
+
+    assert [url for _, url, _ in slow_request].count(versions_url) == 1
+    assert [url for _, url, _ in slow_request].count(status_url) == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_settings_update_invalidates_cache(
+    api_client, slow_request, mock_post_factory, monkeypatch
+):
+    """Test a successful settings update drops the cached settings."""
+    monkeypatch.setattr(api_client, "cache", GaggiuinoResponseCache())
+    monkeypatch.setattr(api_client, "post", mock_post_factory(success=True))
+    boiler_url = f"{api_client.api_base}/settings/boiler"
+    settings_url = f"{api_client.api_base}/settings"
+    display_url = f"{api_client.api_base}/settings/display"
+
+    for url in (boiler_url, settings_url, display_url):
+        await api_client.get(url)
+    await api_client.update_boiler_settings({"steamSetPoint": 150})
+    for url in (boiler_url, settings_url, display_url):
+        await api_client.get(url)
+
+    fetched = [url for _, url, _ in slow_request]
+    assert fetched.count(boiler_url) == 2
+    assert fetched.count(settings_url) == 2
+    assert fetched.count(display_url) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_profile_writes_invalidate_cache(
+    api_client, slow_request, mock_post_factory, monkeypatch
+):
+    """Test selecting and deleting profiles drops the cached profile list."""
+    monkeypatch.setattr(api_client, "cache", GaggiuinoResponseCache())
+    monkeypatch.setattr(api_client, "post", mock_post_factory(success=True))
+    monkeypatch.setattr(api_client, "delete", mock_post_factory(success=False))
+    profiles_url = f"{api_client.api_base}/profiles/all"
+
+    await api_client.get(profiles_url)
+    await api_client.delete_profile(3)
+    await api_client.get(profiles_url)
+    await api_client.select_profile(3)
+    await api_client.get(profiles_url)
+
+    assert [url for _, url, _ in slow_request].count(profiles_url) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_write_during_in_flight_get(api_client, mock_post_factory, monkeypatch):
+    """Test a GET in flight during a write is neither cached nor shared."""
+    monkeypatch.setattr(api_client, "cache", GaggiuinoResponseCache())
+    monkeypatch.setattr(api_client, "post", mock_post_factory(success=True))
+    machine = {"steamSetPoint": 10}
+
+    async def _mock_request(method, url, params=None, **kwargs):
+        settings = dict(machine)
+        await asyncio.sleep(0.02)
+        return settings
+
+    monkeypatch.setattr(api_client, "_request", _mock_request)
+    url = f"{api_client.api_base}/settings/boiler"
+
+    async def _write_during_get(value):
+        stale = asyncio.ensure_future(api_client.get(url))
+        await asyncio.sleep(0.01)
+        machine["steamSetPoint"] = value
+        await api_client.update_boiler_settings(machine)
+        return stale
+
+    # The stale response must not be cached
+    stale = await _write_during_get(99)
+    assert (await stale)["steamSetPoint"] == 10
+    assert (await api_client.get(url))["steamSetPoint"] == 99
+
+    # Reads after the write must not join the stale request
+    stale = await _write_during_get(150)
+    assert (await api_client.get(url))["steamSetPoint"] == 150
+    assert (await stale)["steamSetPoint"] == 99
+
+
+# JSON Backend Tests
+
+
+def test_json_backend_default():
+    """Test the fastest installed backend is picked by default."""
+    backend = get_json_backend()
+
+    assert backend.name in JSON_BACKENDS
+    assert backend.loads(backend.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_json_backend_roundtrip(name, mock_shot_data):
+    """Test every backend produces compact JSON compatible with stdlib."""
+    if name != "json":
+        pytest.importorskip(name)
+    backend = get_json_backend(name)
+
+    encoded = backend.dumps(mock_shot_data)
+
+    assert isinstance(encoded, bytes)
+    assert b" " not in encoded
+    assert json.loads(encoded) == mock_shot_data
+    assert backend.loads(encoded) == mock_shot_data
+
+
+def test_json_backend_unknown():
+    """Test an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        get_json_backend("yaml")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_uses_json_backend(mock_settings_data):
+    """Test request bodies are encoded and responses decoded by the backend."""
+    calls = []
+
+    def _loads(data):
+        calls.append("loads")
+        return json.loads(data)
+
+    def _dumps(obj):
+        calls.append("dumps")
+        return json.dumps(obj).encode()
+
+    async def _echo(request):
+        assert request.content_type == "application/json"
+        return web.json_response(await request.json())
+
+    async def _empty(_request):
+        return web.Response(body=b"")
+
+    app = web.Application()
+    app.router.add_post("/api/echo", _echo)
+    app.router.add_get("/api/empty", _empty)
+
+    backend = GaggiuinoJSONBackend("test", _loads, _dumps)
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoAPI(base_url=base_url, json_backend=backend) as client:
+            echoed = await client._request(
+                "POST",
+                f"{client.api_base}/echo",
+                json_data=mock_settings_data,
+                json_response=True,
+            )
+            empty = await client.get(f"{client.api_base}/empty")
+
+    assert echoed == mock_settings_data
+    assert empty is None
+    assert calls == ["dumps", "loads"]
+
+
+# Retry Tests
+
+
+@pytest.fixture
+def flaky_send(api_client, monkeypatch):
+    """Replace _send with a fake failing the first attempts of each request."""
+    calls = []
+    failures = {"count": 2, "error": GaggiuinoConnectionError("Connection failed")}
+
+    async def _mock_send(method, url, params, **kwargs):
+        calls.append((method, url, kwargs["timeout"]))
+        if len(calls) <= failures["count"]:
+            raise failures["error"]
+        return True
+
+    monkeypatch.setattr(api_client, "_send", _mock_send)
+    monkeypatch.setattr(api_client, "endpoint_stats", {})
+    monkeypatch.setattr(api_client, "retry_policy", GaggiuinoRetryPolicy(backoff=0.001))
+    failures["calls"] = calls
+    return failures
+
+
+def test_endpoint_path():
+    """Test numeric path segments are grouped and the query dropped."""
+    assert endpoint_path("http://host/api/shots/42?x=1") == "/api/shots/{id}"
+    assert endpoint_path("http://host/api/shots/latest") == "/api/shots/latest"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_retries_get(api_client, flaky_send):
+    """Test a GET is retried until it succeeds and the attempts are recorded."""
+    assert await api_client._request("GET", f"{api_client.api_base}/shots/3")
+
+    stats = api_client.endpoint_stats["GET /api/shots/{id}"]
+    assert len(flaky_send["calls"]) == 3
+    assert (stats.requests, stats.attempts, stats.retries) == (1, 3, 2)
+    assert stats.failures == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_not_retried_by_default(api_client, flaky_send, monkeypatch):
+    """Test requests are sent once unless a retry policy is given."""
+    monkeypatch.setattr(api_client, "retry_policy", GaggiuinoAPI().retry_policy)
+
+    with pytest.raises(GaggiuinoConnectionError):
+        await api_client._request("GET", f"{api_client.api_base}/shots/3")
+
+    assert len(flaky_send["calls"]) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_retry_gives_up(api_client, flaky_send):
+    """Test the last error is raised once the attempts are used up."""
+    flaky_send["count"] = 5
+    flaky_send["error"] = GaggiuinoConnectionTimeoutError()
+
+    with pytest.raises(GaggiuinoConnectionTimeoutError):
+        await api_client._request("GET", f"{api_client.api_base}/system/status")
+
+    stats = api_client.endpoint_stats["GET /api/system/status"]
+    assert len(flaky_send["calls"]) == 3
+    assert stats.failures == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_does_not_retry_writes(api_client, flaky_send):
+    """Test writes are only retried when declared idempotent."""
+    url = f"{api_client.api_base}/profile-select/3"
+    with pytest.raises(GaggiuinoConnectionError):
+        await api_client._request("POST", url)
+    assert len(flaky_send["calls"]) == 1
+
+    api_client.retry_policy = GaggiuinoRetryPolicy(
+        backoff=0.001, idempotent=frozenset({"POST /api/profile-select/{id}"})
+    )
+    assert await api_client._request("POST", url)
+    assert len(flaky_send["calls"]) == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_does_not_retry_not_found(api_client, flaky_send):
+    """Test missing endpoints are not retried."""
+    flaky_send["error"] = GaggiuinoEndpointNotFoundError("endpoint not found")
+
+    with pytest.raises(GaggiuinoEndpointNotFoundError):
+        await api_client._request("GET", f"{api_client.api_base}/shots/3")
+
+    assert len(flaky_send["calls"]) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_retry_deadline(api_client, flaky_send, monkeypatch):
+    """Test no retry starts past the deadline and attempts share its budget."""
+    monkeypatch.setattr("gaggiuino_api.retry.random.uniform", lambda a, b: b)
+    api_client.retry_policy = GaggiuinoRetryPolicy(
+        attempts=10, backoff=0.02, deadline=0.05
+    )
+    flaky_send["count"] = 10
+
+    with pytest.raises(GaggiuinoConnectionError):
+        await api_client._request("GET", f"{api_client.api_base}/shots/3")
+
+    # Delays of 0.02 and 0.04 leave no room for a third retry
+    timeouts = [timeout for _, _, timeout in flaky_send["calls"]]
+    assert len(timeouts) == 2
+    assert timeouts[0] == pytest.approx(0.05, abs=0.005)
+    assert timeouts[1] < 0.035
+
+
+# Circuit Breaker Tests
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock of the circuit breaker."""
+    now = {"time": 1000.0}
+    monkeypatch.setattr("gaggiuino_api.breaker.time.monotonic", lambda: now["time"])
+    return now
+
+
+@pytest.fixture
+def offline_send(api_client, monkeypatch):
+    """Replace _send with a fake machine that can be switched off."""
+    machine = {"online": False, "calls": []}
+
+    async def _mock_send(method, url, params, **kwargs):
+        machine["calls"].append(url)
+        if not machine["online"]:
+            raise GaggiuinoConnectionTimeoutError()
+        return {"status": "ok"}
+
+    monkeypatch.setattr(api_client, "_send", _mock_send)
+    monkeypatch.setattr(api_client, "retry_policy", None)
+    return machine
+
+
+def test_circuit_breaker_states(clock):
+    """Test the circuit opens at the threshold and turns half-open later."""
+    breaker = GaggiuinoCircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.retry_in == 30.0
+
+    clock["time"] += 30
+    assert breaker.state == "half_open"
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.trips == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_circuit_fails_fast_and_recovers(
+    api_client, offline_send, clock, monkeypatch
+):
+    """Test an open circuit rejects requests until the health probe passes."""
+    breaker = GaggiuinoCircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    monkeypatch.setattr(api_client, "circuit_breaker", breaker)
+    url = f"{api_client.api_base}/system/status"
+
+    for _ in range(2):
+        with pytest.raises(GaggiuinoConnectionTimeoutError):
+            await api_client.get(url)
+    with pytest.raises(GaggiuinoCircuitOpenError):
+        await api_client.get(url)
+    assert len(offline_send["calls"]) == 2
+
+    offline_send["online"] = True
+    clock["time"] += 30
+    assert await api_client.get(url) == {"status": "ok"}
+
+    assert offline_send["calls"][2:] == [f"{api_client.api_base}/health", url]
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_circuit_failed_probe_stays_open(
+    api_client, offline_send, clock, monkeypatch
+):
+    """Test a failed probe keeps the circuit open for another period."""
+    breaker = GaggiuinoCircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    monkeypatch.setattr(api_client, "circuit_breaker", breaker)
+
+    with pytest.raises(GaggiuinoConnectionTimeoutError):
+        await api_client.get_health()
+    clock["time"] += 30
+    # The probe for the health endpoint must not wait for itself
+    with pytest.raises(GaggiuinoCircuitOpenError):
+        await asyncio.wait_for(api_client.get_health(), 1)
+
+    assert len(offline_send["calls"]) == 2
+    assert breaker.state == "open"
+    assert breaker.trips == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_circuit_rejects_callers_during_probe(
+    api_client, offline_send, monkeypatch
+):
+    """Test concurrent callers fail fast while the half-open probe runs."""
+    # Half-open right after tripping
+    breaker = GaggiuinoCircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    monkeypatch.setattr(api_client, "circuit_breaker", breaker)
+    url = f"{api_client.api_base}/profiles/all"
+    with pytest.raises(GaggiuinoConnectionTimeoutError):
+        await api_client.get(url)
+
+    answer = asyncio.Event()
+    send = api_client._send
+
+    async def _slow_send(method, url, params, **kwargs):
+        await answer.wait()
+        return await send(method, url, params, **kwargs)
+
+    monkeypatch.setattr(api_client, "_send", _slow_send)
+    monkeypatch.setattr(api_client, "retry_policy", GaggiuinoRetryPolicy())
+    probing = asyncio.ensure_future(api_client.get(url))
+    await asyncio.sleep(0.01)
+    assert breaker.probe_lock.locked()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *(api_client.get_status() for _ in range(5)), return_exceptions=True
+        ),
+        0.1,
+    )
+    assert all(isinstance(_, GaggiuinoCircuitOpenError) for _ in results)
+
+    # The probe is a single attempt despite the retry policy
+    answer.set()
+    with pytest.raises(GaggiuinoCircuitOpenError):
+        await probing
+    assert offline_send["calls"][1:] == [f"{api_client.api_base}/health"]
+    assert breaker.trips == 1
+
+
+# Rate Limiter Tests
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rate_limiter_priority():
+    """Test waiting requests start by priority, then in arrival order."""
+    limiter = GaggiuinoRateLimiter(rate=None, max_in_flight=1)
+    started = []
+
+    async def _request(name, priority):
+        async with limiter.slot(priority):
+            started.append(name)
+
+    await limiter.acquire()
+    tasks = [
+        asyncio.ensure_future(_request(name, priority))
+        for name, priority in [
+            ("low", PRIORITY_LOW),
+            ("normal", PRIORITY_NORMAL),
+            ("high", PRIORITY_HIGH),
+            ("low2", PRIORITY_LOW),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert limiter.queued == 4
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert started == ["high", "normal", "low", "low2"]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rate_limiter_token_bucket():
+    """Test requests beyond the burst are spread out at the rate."""
+    limiter = GaggiuinoRateLimiter(rate=100.0, burst=2, max_in_flight=None)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for _ in range(5):
+        async with limiter.slot():
+            pass
+
+    # Two requests from the burst, three at 10 ms intervals
+    assert loop.time() - started >= 0.025
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rate_limiter_cancelled_waiter():
+    """Test a cancelled waiter neither keeps nor leaks a slot."""
+    limiter = GaggiuinoRateLimiter(rate=None, max_in_flight=1)
+
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    limiter.release()
+
+    await asyncio.wait_for(limiter.acquire(), 1)
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rate_limiter_writes_skip_backfill(mock_shot_data):
+    """Test a profile change is not queued behind a bulk shot download."""
+    served = []
+
+    async def _shot(request):
+        served.append(request.path)
+        await asyncio.sleep(0.01)
+        return web.json_response(mock_shot_data)
+
+    async def _select(request):
+        served.append(request.path)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/api/shots/{shot_id}", _shot)
+    app.router.add_post("/api/profile-select/{profile_id}", _select)
+
+    limiter = GaggiuinoRateLimiter(rate=None, max_in_flight=1)
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoAPI(base_url=base_url, rate_limiter=limiter) as client:
+
+            async def _backfill():
+                return [shot async for shot in client.get_shots(range(1, 5))]
+
+            backfill = asyncio.ensure_future(_backfill())
+            await asyncio.sleep(0.005)
+            assert await client.select_profile(3)
+            await backfill
+
+    # Shot 2 was already waiting when the profile change arrived
+    assert served[:3] == ["/api/shots/1", "/api/profile-select/3", "/api/shots/2"]
+    assert len(served) == 5
@@ -0,0 +1,89 @@
+"""Tests for device discovery."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gaggiuino_api import GaggiuinoAPI, GaggiuinoDevice, GaggiuinoDiscovery
+
+
+@pytest.fixture
+def health_app(mock_health_data):
+    """Fake machine answering the health probe."""
+
+    async def _health(_request):
+        return web.json_response(mock_health_data)
+
+    app = web.Application()
+    app.router.add_get("/api/health", _health)
+    return app
+
+
+@pytest.fixture
+def other_app():
+    """Web server that is not a Gaggiuino."""
+
+    async def _health(_request):
+        return web.Response(text="<html></html>")
+
+    app = web.Application()
+    app.router.add_get("/api/health", _health)
+    return app
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_discovery_scan(health_app):
+    """Test a subnet scan finds the machine and skips silent addresses."""
+    async with TestServer(health_app, host="127.0.0.1") as server:
+        base_url = f"http://127.0.0.1:{server.port}"
+        async with GaggiuinoDiscovery(port=server.port) as discovery:
+            devices = await asyncio.wait_for(discovery.scan("127.0.0.0/29"), 5)
+
+    assert devices == [GaggiuinoDevice("127.0.0.1", "127.0.0.1", base_url)]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("network", ["fd00::/120", "10.0.0.0/8"])
+async def test_discovery_scan_invalid(network):
+    """Test IPv6 and too large networks are rejected before probing."""
+    async with GaggiuinoDiscovery() as discovery:
+        with pytest.raises(ValueError):
+            await discovery.scan(network)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_discovery_resolve_cached(health_app, monkeypatch):
+    """Test hostnames are resolved to addresses and results are cached."""
+    async with TestServer(health_app, host="127.0.0.1") as server:
+        async with GaggiuinoDiscovery(port=server.port) as discovery:
+            probe = discovery.probe
+            probed = []
+
+            async def _probe(address, **kwargs):
+                probed.append(address)
+                return await probe(address, **kwargs)
+
+            monkeypatch.setattr(discovery, "probe", _probe)
+            first = await discovery.discover(["localhost"], ["127.0.0.1/32"])
+            second = await discovery.discover(["localhost"], ["127.0.0.1/32"])
+
+    assert len(first) == 1
+    assert first[0].host == "localhost"
+    assert first[0].address == "127.0.0.1"
+    assert second == first
+    assert probed == ["127.0.0.1", "127.0.0.1"]
+
+    [client] = discovery.clients(first)
+    assert isinstance(client, GaggiuinoAPI)
+    assert client.base_url == first[0].baseUrl
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_discovery_ignores_other_servers(other_app):
+    """Test web servers that are not a Gaggiuino are not reported."""
+    async with TestServer(other_app, host="127.0.0.1") as server:
+        async with GaggiuinoDiscovery(port=server.port) as discovery:
+            assert await discovery.probe("127.0.0.1") is None
+            assert await discovery.resolve("unknown.invalid") == []
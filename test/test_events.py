@@ -0,0 +1,124 @@
+"""Tests for the Server-Sent Events stream."""
+
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gaggiuino_api import GaggiuinoAPI, GaggiuinoConnectionError, GaggiuinoStatus
+from gaggiuino_api.const import DEFAULT_EVENTS_PATH
+from gaggiuino_api.sse import GaggiuinoEventParser
+
+
+def test_event_parser():
+    """Test parsing a multi-line event with id and retry fields."""
+    parser = GaggiuinoEventParser()
+    lines = [
+        ": keep-alive",
+        "event: status",
+        "id: 7",
+        "retry: 50",
+        "data: a",
+        "data: b",
+    ]
+
+    assert all(parser.feed_line(line) is None for line in lines)
+    event = parser.feed_line("")
+
+    assert event is not None
+    assert event.event == "status"
+    assert event.data == "a\nb"
+    assert event.id == "7"
+    assert parser.last_event_id == "7"
+    assert parser.retry == 50
+
+
+def test_event_parser_ignores_empty_blocks():
+    """Test that blocks without data do not dispatch events."""
+    parser = GaggiuinoEventParser()
+
+    assert parser.feed_line("id: 3") is None
+    assert parser.feed_line("") is None
+    assert parser.last_event_id == "3"
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get(DEFAULT_EVENTS_PATH, handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_events_resume_after_disconnect():
+    """Test reconnecting with the Last-Event-ID of the previous stream."""
+    seen_ids = []
+
+    async def _handler(request):
+        seen_ids.append(request.headers.get("Last-Event-ID"))
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        next_id = len(seen_ids)
+        await response.write(f"retry: 1\nid: {next_id}\ndata: {next_id}\n\n".encode())
+        return response
+
+    server = await _serve(_handler)
+    try:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoAPI(base_url=base_url) as client:
+            received = []
+            async for event in client.events():
+                received.append(event.data)
+                if len(received) == 2:
+                    break
+    finally:
+        await server.close()
+
+    assert received == ["1", "2"]
+    assert seen_ids == [None, "1"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_events_without_reconnect():
+    """Test that a refused stream raises when reconnecting is disabled."""
+
+    async def _handler(_request):
+        return web.Response(status=503)
+
+    server = await _serve(_handler)
+    try:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoAPI(base_url=base_url) as client:
+            with pytest.raises(GaggiuinoConnectionError):
+                async for _ in client.events(reconnect=False):
+                    pass
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_status_events(mock_status_data):
+    """Test decoding pushed status events and skipping other payloads."""
+
+    async def _handler(request):
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(b"event: log\ndata: booting\n\n")
+        payload = json.dumps(mock_status_data)
+        await response.write(f"event: status\ndata: {payload}\n\n".encode())
+        return response
+
+    server = await _serve(_handler)
+    try:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoAPI(base_url=base_url) as client:
+            async for status in client.status_events():
+                break
+    finally:
+        await server.close()
+
+    assert isinstance(status, GaggiuinoStatus)
+    assert status.profileName == "OFF"
+    assert client.profile.id == 7
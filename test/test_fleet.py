@@ -0,0 +1,87 @@
+"""Tests for the multi-machine fleet client."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer, unused_port
+
+from gaggiuino_api import (
+    GaggiuinoCircuitBreaker,
+    GaggiuinoConnectionError,
+    GaggiuinoFleet,
+    GaggiuinoShot,
+    GaggiuinoStatus,
+)
+
+
+@pytest.fixture
+def machine_app(mock_status_data, mock_latest_shot_data, mock_shot_data):
+    """Fake machine serving its status and latest shot."""
+
+    async def _status(_request):
+        return web.json_response(mock_status_data)
+
+    async def _latest(_request):
+        return web.json_response(mock_latest_shot_data)
+
+    async def _shot(request):
+        return web.json_response(
+            {**mock_shot_data, "id": int(request.match_info["shot_id"])}
+        )
+
+    app = web.Application()
+    app.router.add_get("/api/system/status", _status)
+    app.router.add_get("/api/shots/latest", _latest)
+    app.router.add_get("/api/shots/{shot_id}", _shot)
+    return app
+
+
+def test_fleet_connection_limit():
+    """Test every machine gets its per-host share of the shared connector."""
+    fleet = GaggiuinoFleet([f"http://10.0.0.{_}" for _ in range(1, 13)])
+
+    assert len(fleet) == 12
+    assert fleet.transport.limit == 12 * fleet.transport.limit_per_host
+
+
+def test_fleet_per_machine_state():
+    """Test stateful options are created per machine and never shared."""
+    urls = ["http://10.0.0.1", "http://10.0.0.2/"]
+    created = []
+
+    def _breaker(base_url):
+        created.append(base_url)
+        return GaggiuinoCircuitBreaker()
+
+    fleet = GaggiuinoFleet(urls, circuit_breaker_factory=_breaker)
+    breakers = {id(api.circuit_breaker) for api in fleet.machines.values()}
+
+    assert created == ["http://10.0.0.1", "http://10.0.0.2"]
+    assert len(breakers) == 2
+    with pytest.raises(TypeError, match="circuit_breaker_factory"):
+        GaggiuinoFleet(urls, circuit_breaker=GaggiuinoCircuitBreaker())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_fleet_partial_results(machine_app, mock_status_data):
+    """Test offline machines are reported per host without failing the batch."""
+    offline_url = f"http://127.0.0.1:{unused_port()}"
+
+    async with TestServer(machine_app) as server:
+        online_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoFleet(
+            [online_url, offline_url], retry_policy=None
+        ) as fleet:
+            sessions = {api.session for api in fleet.machines.values()}
+            statuses = await fleet.status_all()
+            shots = await fleet.latest_shot_all()
+
+    assert len(sessions) == 1
+    assert not statuses.ok
+    assert statuses.results == {
+        online_url: GaggiuinoStatus.from_dict(mock_status_data[0])
+    }
+    assert isinstance(statuses.errors[offline_url], GaggiuinoConnectionError)
+    assert isinstance(shots.results[online_url], GaggiuinoShot)
+    assert shots.results[online_url].id == 100
+    assert offline_url in shots.errors
+    assert all(api.session is None for api in fleet.machines.values())
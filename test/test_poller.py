@@ -0,0 +1,160 @@
+"""Tests for the adaptive status poller."""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from gaggiuino_api import (
+    GaggiuinoConnectionError,
+    GaggiuinoStatus,
+    GaggiuinoStatusPoller,
+)
+
+
+@pytest.fixture
+def idle_status(mock_status_data):
+    """Idle machine close to its target temperature."""
+    return replace(
+        GaggiuinoStatus.from_dict(mock_status_data[0]),
+        targetTemperature=93.0,
+        temperature=92.5,
+    )
+
+
+def test_poller_interval(api_client, idle_status):
+    """Test the poll rate follows the machine state."""
+    poller = GaggiuinoStatusPoller(api_client)
+
+    assert poller.interval(None) == poller.idle_interval
+    assert poller.interval(idle_status) == poller.idle_interval
+    assert (
+        poller.interval(replace(idle_status, temperature=60.0))
+        == poller.heating_interval
+    )
+    assert (
+        poller.interval(replace(idle_status, brewSwitchState=True))
+        == poller.shot_interval
+    )
+    assert (
+        poller.interval(replace(idle_status, steamSwitchState=True))
+        == poller.shot_interval
+    )
+    assert poller.interval(replace(idle_status, pressure=9.0)) == poller.shot_interval
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_poller_notifies_changes_only(api_client, idle_status, monkeypatch):
+    """Test subscribers only receive changed statuses."""
+    statuses = [
+        idle_status,
+        replace(idle_status, upTime=idle_status.upTime + 1),
+        replace(idle_status, brewSwitchState=True),
+    ]
+
+    async def _mock_get_status():
+        return statuses.pop(0)
+
+    monkeypatch.setattr(api_client, "get_status", _mock_get_status)
+
+    poller = GaggiuinoStatusPoller(api_client)
+    received = []
+    received_async = []
+
+    async def _async_callback(status):
+        received_async.append(status)
+
+    poller.subscribe(received.append)
+    unsubscribe = poller.subscribe(_async_callback)
+
+    await poller.poll()
+    await poller.poll()
+    unsubscribe()
+    await poller.poll()
+
+    assert [s.brewSwitchState for s in received] == [False, True]
+    assert len(received_async) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_poller_survives_errors(api_client, idle_status, monkeypatch):
+    """Test failed and empty polls yield None and keep the last status."""
+    brewing = replace(idle_status, brewSwitchState=True)
+    statuses = [
+        brewing,
+        GaggiuinoConnectionError("Connection failed"),
+        None,
+        brewing,
+    ]
+
+    async def _mock_get_status():
+        result = statuses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(api_client, "get_status", _mock_get_status)
+
+    poller = GaggiuinoStatusPoller(api_client)
+    received = []
+    poller.subscribe(received.append)
+
+    assert await poller.poll() is brewing
+    assert await poller.poll() is None
+    assert poller.status is brewing
+    assert poller.interval(poller.status) == poller.shot_interval
+    # An empty response is treated like a failed poll
+    assert await poller.poll() is None
+    assert poller.status is brewing
+    assert await poller.poll() is brewing
+    assert received == [brewing]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_poller_survives_callback_errors(
+    api_client, idle_status, monkeypatch, caplog
+):
+    """Test a failing subscriber is logged and the others are still notified."""
+    statuses = [idle_status, replace(idle_status, brewSwitchState=True)]
+
+    async def _mock_get_status():
+        return statuses.pop(0) if len(statuses) > 1 else statuses[0]
+
+    def _failing_callback(status):
+        raise RuntimeError("subscriber failed")
+
+    monkeypatch.setattr(api_client, "get_status", _mock_get_status)
+
+    poller = GaggiuinoStatusPoller(api_client, idle_interval=0.01, shot_interval=0.01)
+    received = []
+    poller.subscribe(_failing_callback)
+    poller.subscribe(received.append)
+
+    async with poller:
+        while len(received) < 2:
+            await asyncio.sleep(0.01)
+        assert poller.running
+
+    assert len(received) == 2
+    failures = [_ for _ in caplog.records if _.exc_info is not None]
+    assert len(failures) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_poller_background_task(api_client, idle_status, monkeypatch):
+    """Test the background task polls until stopped."""
+    calls = 0
+
+    async def _mock_get_status():
+        nonlocal calls
+        calls += 1
+        return idle_status
+
+    monkeypatch.setattr(api_client, "get_status", _mock_get_status)
+
+    async with GaggiuinoStatusPoller(api_client, idle_interval=0.01) as poller:
+        await asyncio.sleep(0.05)
+        assert poller.running
+
+    assert not poller.running
+    assert calls > 1
@@ -1,7 +1,14 @@
 """Tests for Profiles API endpoints."""
 
 import pytest
-from gaggiuino_api import GaggiuinoProfile
+from gaggiuino_api import (
+    GaggiuinoProfile,
+    GaggiuinoProfilePhase,
+    GaggiuinoProfilePhaseStopCondition,
+    GaggiuinoProfilePhaseTarget,
+    GaggiuinoProfileType,
+    simulate_profile,
+)
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -198,7 +205,7 @@ async def test_profile_property_from_profiles(
 
 @pytest.mark.asyncio(loop_scope="session")
 async def test_profile_phases_parsing(api_client, mock_profiles_data, monkeypatch):
-    """Test that profile phases are available as dicts (not parsed into model objects)."""
+    """Test that profile phases are parsed into model objects."""
 
     async def _mock_get(url, params=None, json_response=True, **kwargs):
         if "/profiles/all" in url:
@@ -213,9 +220,104 @@ async def test_profile_phases_parsing(api_client, mock_profiles_data, monkeypatc
     profile = profiles[0]
     assert profile.phases is not None
     assert len(profile.phases) == 1
-    # Phases are passed through as dicts, not parsed into GaggiuinoProfilePhase objects
     phase = profile.phases[0]
-    assert isinstance(phase, dict)
-    assert phase["restriction"] == 2
-    assert phase["skip"] is False
-    assert phase["type"] == "FLOW"
+    assert isinstance(phase, GaggiuinoProfilePhase)
+    assert phase.restriction == 2
+    assert phase.skip is False
+    assert phase.type == GaggiuinoProfileType("FLOW")
+    assert phase.stopConditions == GaggiuinoProfilePhaseStopCondition(
+        pressureAbove=2, time=15000, weight=0.1
+    )
+    assert phase.target == GaggiuinoProfilePhaseTarget(
+        curve="INSTANT", end=2, time=10000
+    )
+
+
+def test_profile_from_dict_tolerates_unknown_keys(mock_profiles_data):
+    """Test that unknown and missing optional keys do not break parsing."""
+    data = {
+        **mock_profiles_data[0],
+        "newFirmwareField": 1,
+        "phases": [
+            {
+                "type": "PRESSURE",
+                "target": {"curve": "EASE_IN_OUT", "start": 2, "end": 1.5, "x": 0},
+                "stopConditions": {},
+                "unknown": True,
+            }
+        ],
+    }
+
+    profile = GaggiuinoProfile.from_dict(data)
+
+    phase = profile.phases[0]
+    assert phase.type.type == "PRESSURE"
+    assert phase.skip is False
+    assert phase.restriction is None
+    assert phase.stopConditions == GaggiuinoProfilePhaseStopCondition()
+    assert phase.target.start == 2
+    assert phase.target.end == 1.5
+    assert phase.target.time is None
+
+
+@pytest.fixture
+def curve_profile(mock_profiles_data):
+    """A flow preinfusion, a skipped, a linear ramp and an eased decline phase."""
+    data = mock_profiles_data[0]
+    data["phases"] = [
+        {
+            "restriction": 2,
+            "stopConditions": {"time": 2000},
+            "target": {"curve": "INSTANT", "end": 2},
+            "type": "FLOW",
+        },
+        {"skip": True, "stopConditions": {}, "type": "PRESSURE"},
+        {
+            "restriction": 3,
+            "stopConditions": {"time": 6000},
+            "target": {"curve": "LINEAR", "start": 2, "end": 9, "time": 4000},
+            "type": "PRESSURE",
+        },
+        {
+            "restriction": 3,
+            "stopConditions": {},
+            "target": {"curve": "EASE_IN_OUT", "end": 6, "time": 2000},
+            "type": "PRESSURE",
+        },
+    ]
+    return GaggiuinoProfile.from_dict(data)
+
+
+def test_simulate_profile(curve_profile, use_numpy):
+    """Test targets follow the phase curves and the other series the restriction."""
+    simulated = curve_profile.simulate(10, use_numpy=use_numpy)
+
+    assert simulated.timeInShot.tolist() == list(range(0, 101, 10))
+    assert simulated.targetPressure.tolist() == pytest.approx(
+        [20, 20, 20, 37.5, 55, 72.5, 90, 90, 90, 75, 60]
+    )
+    assert simulated.targetPumpFlow.tolist() == [20, 20] + [30] * 9
+
+
+def test_simulate_profile_durations(curve_profile, use_numpy):
+    """Test phases follow the given durations and unreached phases are left out."""
+    simulated = curve_profile.simulate(10, durations=[1000, 3000], use_numpy=use_numpy)
+
+    assert simulated.timeInShot.tolist() == [0, 10, 20, 30, 40]
+    assert simulated.targetPressure.tolist() == pytest.approx([20, 20, 37.5, 55, 72.5])
+
+
+def test_simulate_profile_memoized(curve_profile, mock_profiles_data):
+    """Test equal profiles share one rendering."""
+    other = GaggiuinoProfile.from_dict(mock_profiles_data[0])
+
+    assert simulate_profile(curve_profile) is simulate_profile(other)
+    assert simulate_profile(curve_profile, 2) is not simulate_profile(other)
+
+
+def test_simulate_profile_invalid(curve_profile):
+    """Test bad periods and durations are rejected."""
+    with pytest.raises(ValueError):
+        curve_profile.simulate(0)
+    with pytest.raises(ValueError):
+        curve_profile.simulate(durations=[-1])
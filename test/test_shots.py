@@ -1,9 +1,24 @@
 """Tests for Shots API endpoints."""
 
+import asyncio
+import json
+
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 from gaggiuino_api import (
+    GaggiuinoAPI,
+    GaggiuinoConnectionError,
+    GaggiuinoProfile,
     GaggiuinoShot,
     GaggiuinoEndpointNotFoundError,
+    GaggiuinoShotCache,
+    GaggiuinoShotDataPoints,
+    GaggiuinoShotPhase,
+    GaggiuinoShotStreamParser,
+    GaggiuinoShotSummary,
+    summarize_shots,
 )
 from gaggiuino_api.models import GaggiuinoLatestShotResult
 
@@ -93,12 +108,48 @@ async def test_shot_datapoints(api_client, mock_shot_data, monkeypatch):
     shot = await api_client.get_shot(shot_id)
 
     assert shot is not None
-    # datapoints is a dict in the current model implementation
-    assert shot.datapoints is not None
-    assert shot.datapoints["pressure"] == mock_shot_data["datapoints"]["pressure"]
-    assert shot.datapoints["pumpFlow"] == mock_shot_data["datapoints"]["pumpFlow"]
-    assert shot.datapoints["shotWeight"] == mock_shot_data["datapoints"]["shotWeight"]
-    assert shot.datapoints["temperature"] == mock_shot_data["datapoints"]["temperature"]
+    assert isinstance(shot.datapoints, GaggiuinoShotDataPoints)
+    assert len(shot.datapoints) == 3
+    assert shot.datapoints.to_dict() == mock_shot_data["datapoints"]
+    assert list(shot.datapoints.pressure) == mock_shot_data["datapoints"]["pressure"]
+    assert list(shot.datapoints.pumpFlow) == mock_shot_data["datapoints"]["pumpFlow"]
+    assert (
+        list(shot.datapoints.shotWeight) == mock_shot_data["datapoints"]["shotWeight"]
+    )
+    assert (
+        list(shot.datapoints.temperature) == mock_shot_data["datapoints"]["temperature"]
+    )
+
+
+def test_shot_datapoints_compact(mock_shot_data):
+    """Test datapoints are stored in 16/32-bit buffers."""
+    datapoints = GaggiuinoShotDataPoints.from_dict(mock_shot_data["datapoints"])
+
+    assert datapoints.pressure.typecode == "h"
+    assert datapoints.timeInShot.typecode == "i"
+    # 7 short series and 3 long series of 3 samples each
+    assert datapoints.nbytes == 3 * (7 * 2 + 3 * 4)
+
+
+def test_shot_datapoints_partial():
+    """Test missing series stay None and floats are rounded."""
+    datapoints = GaggiuinoShotDataPoints.from_dict({"pressure": [1.6, 2.2]})
+
+    assert list(datapoints.pressure) == [2, 2]
+    assert datapoints.pumpFlow is None
+    assert list(datapoints.series()) == ["pressure"]
+
+
+def test_shot_datapoints_numpy(mock_shot_data):
+    """Test NumPy views share the sample buffers."""
+    pytest.importorskip("numpy")
+    datapoints = GaggiuinoShotDataPoints.from_dict(mock_shot_data["datapoints"])
+
+    arrays = datapoints.to_numpy()
+    datapoints.pressure[0] = 42
+
+    assert arrays["pressure"].tolist() == [42, 3, 3]
+    assert arrays["timeInShot"].tolist() == [2, 3, 5]
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -116,11 +167,518 @@ async def test_shot_profile(api_client, mock_shot_data, monkeypatch):
     shot = await api_client.get_shot(shot_id)
 
     assert shot is not None
-    # profile is a dict in the current model implementation
-    assert shot.profile is not None
-    assert shot.profile["id"] == mock_shot_data["profile"]["id"]
-    assert shot.profile["name"] == mock_shot_data["profile"]["name"]
+    assert isinstance(shot.profile, GaggiuinoProfile)
+    assert shot.profile.id == mock_shot_data["profile"]["id"]
+    assert shot.profile.name == mock_shot_data["profile"]["name"]
     assert (
-        shot.profile["waterTemperature"]
-        == mock_shot_data["profile"]["waterTemperature"]
+        shot.profile.waterTemperature == mock_shot_data["profile"]["waterTemperature"]
+    )
+    assert shot.profile.phases == []
+
+
+def test_shot_from_dict_tolerates_unknown_keys(mock_shot_data):
+    """Test that unknown keys in a shot payload are ignored."""
+    shot = GaggiuinoShot.from_dict({**mock_shot_data, "newFirmwareField": 1})
+
+    assert shot.id == mock_shot_data["id"]
+
+
+# Shot Cache Tests
+
+
+def test_shot_cache_roundtrip(tmp_path, mock_shot_data):
+    """Test storing and reading a shot payload."""
+    with GaggiuinoShotCache(tmp_path / "shots.db") as cache:
+        assert cache.get(1) is None
+
+        cache.put(1, mock_shot_data)
+
+        assert 1 in cache
+        assert len(cache) == 1
+        assert cache.get(1) == mock_shot_data
+
+    with GaggiuinoShotCache(tmp_path / "shots.db") as cache:
+        assert cache.ids() == [1]
+
+
+def test_shot_cache_eviction(tmp_path, mock_shot_data):
+    """Test the least recently read shots are evicted over the size bound."""
+    with GaggiuinoShotCache(tmp_path / "shots.db", max_bytes=None) as cache:
+        cache.put(1, mock_shot_data)
+        shot_size = cache.size
+
+    # Room for two shots, compressed sizes may differ by a few bytes
+    max_bytes = int(shot_size * 2.5)
+    with GaggiuinoShotCache(tmp_path / "shots.db", max_bytes=max_bytes) as cache:
+        cache.put(2, {**mock_shot_data, "id": 2})
+        cache.get(1)
+        cache.put(3, {**mock_shot_data, "id": 3})
+
+        assert cache.ids() == [1, 3]
+        assert cache.size <= max_bytes
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_shot_uses_shot_cache(
+    api_client, mock_shot_data, tmp_path, monkeypatch
+):
+    """Test shots are downloaded once and then read from the shot cache."""
+    requested = []
+
+    async def _mock_get(url, params=None, json_response=True, **kwargs):
+        requested.append(url)
+        return mock_shot_data
+
+    monkeypatch.setattr(api_client, "get", _mock_get)
+
+    with GaggiuinoShotCache(tmp_path / "shots.db") as cache:
+        monkeypatch.setattr(api_client, "shot_cache", cache)
+        first = await api_client.get_shot(1)
+        second = await api_client.get_shot(1)
+
+    assert len(requested) == 1
+    assert first == second
+
+
+# Bulk Shot Download Tests
+
+
+@pytest.fixture
+def mock_shots_get(api_client, mock_shot_data, monkeypatch):
+    """Serve shots 1-10 with shots 4 and 7 deleted, tracking concurrency."""
+    stats = {"active": 0, "peak": 0}
+
+    async def _mock_get(url, params=None, json_response=True, **kwargs):
+        shot_id = int(url.rsplit("/", 1)[-1])
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        try:
+            # Later shots complete first
+            await asyncio.sleep(0.001 * (10 - shot_id))
+            if shot_id in (4, 7):
+                raise GaggiuinoEndpointNotFoundError("endpoint not found")
+            if shot_id == 99:
+                raise GaggiuinoConnectionError("Connection failed")
+            return {**mock_shot_data, "id": shot_id}
+        finally:
+            stats["active"] -= 1
+
+    monkeypatch.setattr(api_client, "get", _mock_get)
+    return stats
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_shots_ordered(api_client, mock_shots_get):
+    """Test shots are yielded in ID order, skipping deleted shots."""
+    progress = []
+
+    shots = [
+        shot
+        async for shot in api_client.get_shots(
+            range(1, 11),
+            concurrency=3,
+            ordered=True,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+    ]
+
+    assert [shot.id for shot in shots] == [1, 2, 3, 5, 6, 8, 9, 10]
+    assert progress[-1] == (10, 10)
+    assert mock_shots_get["peak"] == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_shots_completion_order(api_client, mock_shots_get):
+    """Test shots are yielded as they complete by default."""
+    shots = [shot async for shot in api_client.get_shots(range(1, 11), concurrency=10)]
+
+    assert sorted(shot.id for shot in shots) == [1, 2, 3, 5, 6, 8, 9, 10]
+    assert shots[0].id == 10
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_shots_error(api_client, mock_shots_get):
+    """Test connection errors stop the download."""
+    with pytest.raises(GaggiuinoConnectionError):
+        async for _ in api_client.get_shots([1, 99, 2]):
+            pass
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_shots_invalid_concurrency(api_client, mock_shots_get):
+    """Test a concurrency below 1 is rejected instead of hanging."""
+    with pytest.raises(ValueError):
+        async for _ in api_client.get_shots([1, 2], concurrency=0):
+            pass
+
+
+# Streaming Parser Tests
+
+
+def _stream_parse(body: bytes, chunk_size: int):
+    parser = GaggiuinoShotStreamParser()
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start : start + chunk_size])
+    return parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_stream_parser_chunks(mock_shot_data, chunk_size):
+    """Test parsing is independent of where the chunks are split."""
+    mock_shot_data["profile"]["name"] = "Café ☕"
+    mock_shot_data["profile"]["recipe"] = {"coffeeIn": 18.5, "notes": None}
+    body = json.dumps(mock_shot_data, indent=1, ensure_ascii=False).encode()
+
+    parsed = _stream_parse(body, chunk_size)
+
+    datapoints = parsed.pop("datapoints")
+    expected = mock_shot_data.copy()
+    expected_datapoints = expected.pop("datapoints")
+    assert parsed == expected
+    assert {name: _.tolist() for name, _ in datapoints.items()} == expected_datapoints
+    assert datapoints["pressure"].typecode == "h"
+    assert datapoints["timeInShot"].typecode == "i"
+    assert GaggiuinoShot.from_dict({**parsed, "datapoints": datapoints}).datapoints
+
+
+def test_stream_parser_float_datapoints(mock_shot_data):
+    """Test float samples are rounded into the integer series."""
+    mock_shot_data["datapoints"]["pressure"] = [3.4, 3.6, 4]
+
+    parsed = _stream_parse(json.dumps(mock_shot_data).encode(), 5)
+
+    assert parsed["datapoints"]["pressure"].tolist() == [3, 4, 4]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"id": 1, "datapoints": {"pressure": [1, 2',
+        b"{]",
+        b'{"a" 1}',
+        b'{"a": 1,}',
+        b"[1 2]",
+        b'{"a": 1} 2',
+        b'{"datapoints": {"pressure": [1, 2,]}}',
+        b'{"datapoints": {"pressure": [1,, 2]}}',
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 4])
+def test_stream_parser_invalid(body, chunk_size):
+    """Test truncated or malformed bodies are rejected."""
+    with pytest.raises(ValueError):
+        _stream_parse(body, chunk_size)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_shot_stream(mock_shot_data, tmp_path):
+    """Test streamed shots match buffered ones and can be cached."""
+
+    async def _shot(_request):
+        return web.json_response(mock_shot_data)
+
+    app = web.Application()
+    app.router.add_get("/api/shots/1", _shot)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        with GaggiuinoShotCache(tmp_path / "shots.db") as cache:
+            async with GaggiuinoAPI(base_url=base_url, shot_cache=cache) as client:
+                streamed = await client.get_shot(1, stream=True)
+            assert cache.get(1) == mock_shot_data
+
+    assert streamed == GaggiuinoShot.from_dict(mock_shot_data)
+
+
+# Resampling Tests
+
+
+@pytest.fixture
+def irregular_datapoints():
+    """Samples at irregular times with a repeated timestamp."""
+    return GaggiuinoShotDataPoints.from_dict(
+        {
+            "timeInShot": [0, 2, 2, 3, 7],
+            "pressure": [0, 20, 30, 40, 80],
+            "shotWeight": [0, 0, 10, 10, 50],
+        }
+    )
+
+
+def test_resample_linear(irregular_datapoints, use_numpy):
+    """Test linear interpolation onto a uniform grid."""
+    resampled = irregular_datapoints.resample(1, use_numpy=use_numpy)
+
+    assert resampled.timeInShot.tolist() == [0, 1, 2, 3, 4, 5, 6, 7]
+    assert resampled.pressure.tolist() == [0, 10, 30, 40, 50, 60, 70, 80]
+    assert resampled.shotWeight.tolist() == [0, 0, 10, 10, 20, 30, 40, 50]
+    assert resampled.pressure.typecode == "d"
+    assert resampled.pumpFlow is None
+
+
+def test_resample_step(irregular_datapoints, use_numpy):
+    """Test step interpolation holds the previous sample."""
+    resampled = irregular_datapoints.resample(2.5, method="step", use_numpy=use_numpy)
+
+    assert resampled.timeInShot.tolist() == [0, 2.5, 5]
+    assert resampled.pressure.tolist() == [0, 30, 40]
+
+
+def test_resample_backends_agree(mock_shot_data):
+    """Test the NumPy and pure Python paths give the same columns."""
+    pytest.importorskip("numpy")
+    shot = GaggiuinoShot.from_dict(mock_shot_data)
+
+    python = shot.resample(0.3, use_numpy=False)
+    numpy = shot.resample(0.3, use_numpy=True)
+
+    for name, values in python.series().items():
+        assert getattr(numpy, name).tolist() == pytest.approx(values.tolist())
+
+
+@pytest.mark.parametrize(
+    "data, kwargs",
+    [
+        ({"timeInShot": [0, 1], "pressure": [1]}, {}),
+        ({"pressure": [1, 2]}, {}),
+        ({"timeInShot": [0, 1]}, {"period": 0}),
+        ({"timeInShot": [0, 1]}, {"method": "cubic"}),
+    ],
+)
+def test_resample_invalid(data, kwargs):
+    """Test mismatched series, missing times and bad options are rejected."""
+    with pytest.raises(ValueError):
+        GaggiuinoShotDataPoints.from_dict(data).resample(**kwargs)
+
+
+# Downsampling Tests
+
+
+@pytest.fixture
+def long_datapoints():
+    """A 1000 sample shot with a pressure spike at sample 500."""
+    pressure = [90] * 1000
+    pressure[500] = 120
+    return GaggiuinoShotDataPoints.from_dict(
+        {
+            "timeInShot": list(range(0, 2000, 2)),
+            "pressure": pressure,
+            "shotWeight": list(range(1000)),
+        }
+    )
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample(long_datapoints, method, use_numpy):
+    """Test series are reduced to original samples keeping the extremes."""
+    reduced = long_datapoints.downsample(50, method=method, use_numpy=use_numpy)
+
+    assert set(reduced) == {"pressure", "shotWeight"}
+    times, pressure = reduced["pressure"]
+    assert len(times) == len(pressure) <= 50
+    assert pressure.typecode == "h"
+    assert (times[0], times[-1]) == (0, 1998)
+    assert list(times) == sorted(times)
+    assert 120 in pressure
+    assert times[pressure.index(120)] == 1000
+
+
+def test_downsample_backends_agree(long_datapoints):
+    """Test the NumPy and pure Python paths keep the same samples."""
+    pytest.importorskip("numpy")
+    for method in ("lttb", "minmax"):
+        python = long_datapoints.downsample(40, method=method, use_numpy=False)
+        numpy = long_datapoints.downsample(40, method=method, use_numpy=True)
+        for name, (times, values) in python.items():
+            assert numpy[name][0] == times
+            assert numpy[name][1] == values
+
+
+def test_downsample_short_series(irregular_datapoints):
+    """Test series already within the budget are returned unchanged."""
+    reduced = irregular_datapoints.downsample(10)
+
+    assert reduced["pressure"] == (
+        irregular_datapoints.timeInShot,
+        irregular_datapoints.pressure,
     )
+
+
+def test_downsample_invalid(irregular_datapoints):
+    """Test too few points and unknown methods are rejected."""
+    with pytest.raises(ValueError):
+        irregular_datapoints.downsample(2)
+    with pytest.raises(ValueError):
+        irregular_datapoints.downsample(10, method="average")
+
+
+# Summary Tests
+
+
+@pytest.fixture
+def brewed_shot(mock_shot_data):
+    """A short shot dripping from 0.4 s with an 18 g dose."""
+    mock_shot_data["profile"]["recipe"] = {"coffeeIn": 18}
+    mock_shot_data["datapoints"] = {
+        "timeInShot": [0, 2, 4, 6, 8],
+        "pressure": [10, 50, 90, 80, 70],
+        "shotWeight": [0, 0, 5, 20, 360],
+        "weightFlow": [0, 0, 20, 20, 20],
+    }
+    return GaggiuinoShot.from_dict(mock_shot_data)
+
+
+def test_shot_summary(brewed_shot, use_numpy):
+    """Test the metrics of a shot."""
+    [summary] = summarize_shots([brewed_shot], use_numpy=use_numpy)
+
+    assert summary == GaggiuinoShotSummary(
+        shotId=1,
+        duration=0.8,
+        finalWeight=36.0,
+        targetWeight=50,
+        dose=18,
+        brewRatio=2.0,
+        peakPressure=9.0,
+        meanPressure=pytest.approx(6.0),
+        timeToFirstDrip=0.4,
+        flowStability=0.0,
+    )
+
+
+def test_shot_summary_cached(brewed_shot):
+    """Test the summary is computed once and shared with batch results."""
+    assert brewed_shot.summary is brewed_shot.summary
+
+    [summary] = summarize_shots([brewed_shot])
+    assert brewed_shot.summary is summary
+
+
+def test_shot_summary_batch_backends_agree(brewed_shot, mock_shot_data):
+    """Test batches with missing data give the same summaries on both paths."""
+    pytest.importorskip("numpy")
+    # brewed_shot replaced the datapoints of mock_shot_data
+    datapoints = {
+        "timeInShot": [2, 3, 5],
+        "pressure": [3, 3, 3],
+        "shotWeight": [0, 0, 0],
+        "weightFlow": [0, 0, 0],
+    }
+    dry = dict(mock_shot_data, id=2, datapoints=datapoints)
+    empty = dict(mock_shot_data, id=3, datapoints={})
+    no_scale = dict(mock_shot_data, id=4)
+    no_scale["datapoints"] = {k: v for k, v in datapoints.items() if k != "shotWeight"}
+    shots = [brewed_shot] + [GaggiuinoShot.from_dict(_) for _ in (dry, empty, no_scale)]
+
+    python = summarize_shots(shots, use_numpy=False)
+    numpy = summarize_shots(shots, use_numpy=True)
+
+    assert numpy == python
+    assert python[1].timeToFirstDrip is None
+    assert python[2] == GaggiuinoShotSummary(shotId=3, targetWeight=50, dose=18)
+    assert python[3].finalWeight is None
+    assert python[3].peakPressure == 0.3
+
+
+# Phase Segmentation Tests
+
+
+@pytest.fixture
+def phased_shot(mock_shot_data):
+    """A shot through a preinfusion, a skipped, a timed and a weighed phase."""
+    mock_shot_data["profile"]["phases"] = [
+        {
+            "restriction": 2,
+            "skip": False,
+            "stopConditions": {"pressureAbove": 2, "time": 15000},
+            "type": "FLOW",
+        },
+        {"restriction": 9, "skip": True, "stopConditions": {}, "type": "PRESSURE"},
+        {
+            "restriction": 3,
+            "skip": False,
+            "stopConditions": {"time": 2000},
+            "type": "PRESSURE",
+        },
+        {
+            "restriction": 9,
+            "skip": False,
+            "stopConditions": {"weight": 36},
+            "type": "FLOW",
+        },
+        {"restriction": 9, "skip": False, "stopConditions": {}, "type": "FLOW"},
+    ]
+    mock_shot_data["datapoints"] = {
+        "timeInShot": [0, 2, 4, 6, 8, 10, 20, 30, 40, 50, 60],
+        "pressure": [5, 10, 25, 90, 90, 90, 90, 90, 80, 70, 60],
+        "pumpFlow": [20, 20, 20, 10, 10, 10, 10, 10, 20, 20, 20],
+        "shotWeight": [0, 0, 0, 0, 0, 5, 50, 100, 200, 370, 380],
+        "waterPumped": [0, 4, 8, 10, 12, 14, 24, 34, 54, 74, 94],
+    }
+    return GaggiuinoShot.from_dict(mock_shot_data)
+
+
+def test_segment_phases(phased_shot):
+    """Test phases stop on their conditions and skipped phases are left out."""
+    phases = phased_shot.segments
+
+    assert [(_.phaseIndex, _.start, _.end, _.stopReason) for _ in phases] == [
+        (0, 0, 3, "pressureAbove"),
+        (2, 3, 8, "time"),
+        (3, 8, 10, "weight"),
+        (4, 10, 11, None),
+    ]
+    assert phases[0] == GaggiuinoShotPhase(
+        phaseIndex=0,
+        type="FLOW",
+        start=0,
+        end=3,
+        startTime=0.0,
+        endTime=0.4,
+        duration=0.4,
+        stopReason="pressureAbove",
+        meanPressure=pytest.approx(40 / 3 / 10),
+        peakPressure=2.5,
+        meanPumpFlow=2.0,
+        weightGain=0.0,
+        waterPumped=0.8,
+    )
+    assert (phases[1].startTime, phases[1].endTime) == (0.4, 3.0)
+    assert phases[2].weightGain == pytest.approx(27.0)
+    assert phased_shot.segments is phases
+
+
+def test_segment_phases_shot_ended_early(phased_shot, mock_shot_data):
+    """Test phases the shot never reached are missing."""
+    mock_shot_data["datapoints"] = {
+        name: values[:5] for name, values in mock_shot_data["datapoints"].items()
+    }
+    del mock_shot_data["datapoints"]["pressure"]
+
+    phases = GaggiuinoShot.from_dict(mock_shot_data).segments
+
+    # Without pressure the preinfusion runs until its time limit
+    assert len(phases) == 1
+    assert (phases[0].end, phases[0].stopReason) == (5, None)
+    assert phases[0].peakPressure is None
+
+
+def test_shot_simulate(phased_shot):
+    """Test the simulated targets span the phases the shot ran."""
+    simulated = phased_shot.simulate(1)
+
+    assert simulated.timeInShot[-1] == 60
+    # The preinfusion ran until 0.4 s, then the flow restriction applies
+    assert simulated.targetPressure[:4].tolist() == [20, 20, 20, 20]
+    assert simulated.targetPumpFlow[3:5].tolist() == [0, 30]
+
+
+def test_segment_phases_invalid(mock_shot_data):
+    """Test shots without timeInShot are rejected."""
+    mock_shot_data["datapoints"] = {"pressure": [1, 2]}
+    mock_shot_data["profile"]["phases"] = [
+        {"restriction": 1, "skip": False, "stopConditions": {}, "type": "FLOW"}
+    ]
+
+    with pytest.raises(ValueError):
+        _ = GaggiuinoShot.from_dict(mock_shot_data).segments
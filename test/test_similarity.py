@@ -0,0 +1,89 @@
+"""Tests for the shot similarity index."""
+
+import pytest
+
+from gaggiuino_api import GaggiuinoShot, GaggiuinoShotIndex
+
+
+def make_shot(
+    mock_shot_data, shot_id: int, pressure: int, weight: int
+) -> GaggiuinoShot:
+    """A ten second shot holding a pressure and reaching a weight."""
+    return GaggiuinoShot.from_dict(
+        {
+            **mock_shot_data,
+            "id": shot_id,
+            "datapoints": {
+                "timeInShot": list(range(0, 101, 10)),
+                "pressure": [pressure] * 11,
+                "pumpFlow": [20] * 11,
+                "shotWeight": [weight * _ // 10 for _ in range(11)],
+            },
+        }
+    )
+
+
+@pytest.fixture
+def shots(mock_shot_data):
+    """Shots 1 to 6 from low to high pressure and weight."""
+    return [
+        make_shot(mock_shot_data, shot_id, 30 + 10 * shot_id, 200 + 20 * shot_id)
+        for shot_id in range(1, 7)
+    ]
+
+
+def test_index_nearest(shots, mock_shot_data, use_numpy):
+    """Test the closest shots are returned closest first."""
+    index = GaggiuinoShotIndex(period=10, points=8, use_numpy=use_numpy)
+    index.extend(shots)
+
+    query = make_shot(mock_shot_data, 99, 72, 284)
+    nearest = index.nearest(query, k=3)
+
+    assert [shot_id for shot_id, _ in nearest] == [4, 5, 3]
+    assert [distance for _, distance in nearest] == sorted(
+        distance for _, distance in nearest
+    )
+    assert 99 not in index
+    assert len(index) == 6
+
+
+def test_index_nearest_by_id(shots, use_numpy):
+    """Test querying an indexed shot leaves the shot itself out."""
+    index = GaggiuinoShotIndex(use_numpy=use_numpy)
+    index.extend(shots)
+
+    nearest = index.nearest(1, k=10)
+
+    assert [shot_id for shot_id, _ in nearest] == [2, 3, 4, 5, 6]
+    with pytest.raises(KeyError):
+        index.nearest(7)
+
+
+def test_index_replaces_shot(shots, mock_shot_data, use_numpy):
+    """Test adding a shot again replaces its features."""
+    index = GaggiuinoShotIndex(use_numpy=use_numpy)
+    index.extend(shots)
+
+    index.add(make_shot(mock_shot_data, 1, 90, 320))
+
+    assert len(index) == 6
+    assert index.nearest(1, k=1)[0][0] == 6
+
+
+def test_index_backends_agree(mock_shot_data):
+    """Test the NumPy and pure Python paths find the same shots."""
+    pytest.importorskip("numpy")
+    python = GaggiuinoShotIndex(use_numpy=False)
+    numpy = GaggiuinoShotIndex(use_numpy=True)
+    # Enough shots to grow the NumPy matrix past its initial capacity
+    for shot_id in range(1, 41):
+        shot = make_shot(mock_shot_data, shot_id, 20 + shot_id * 7 % 80, shot_id * 13)
+        python.add(shot)
+        numpy.add(shot)
+
+    for shot_id in (1, 17, 40):
+        expected = python.nearest(shot_id)
+        actual = numpy.nearest(shot_id)
+        assert [_[0] for _ in actual] == [_[0] for _ in expected]
+        assert [_[1] for _ in actual] == pytest.approx([_[1] for _ in expected])
@@ -0,0 +1,111 @@
+"""Tests for the incremental shot sync."""
+
+import pytest
+
+from gaggiuino_api import (
+    GaggiuinoConnectionError,
+    GaggiuinoEndpointNotFoundError,
+    GaggiuinoShotCache,
+    GaggiuinoShotIndex,
+    GaggiuinoShotSync,
+)
+
+
+@pytest.fixture
+def machine(api_client, mock_shot_data, tmp_path, monkeypatch):
+    """Fake machine history with a deleted shot 3 and an archive shot cache."""
+    state = {"latest": 5, "requested": [], "fail": set()}
+
+    async def _mock_get(url, params=None, json_response=True, **kwargs):
+        shot_id = url.rsplit("/", 1)[-1]
+        if shot_id == "latest":
+            return [{"lastShotId": str(state["latest"])}]
+        state["requested"].append(int(shot_id))
+        if int(shot_id) in state["fail"]:
+            raise GaggiuinoConnectionError("Connection failed")
+        if shot_id == "3":
+            raise GaggiuinoEndpointNotFoundError("endpoint not found")
+        return {**mock_shot_data, "id": int(shot_id)}
+
+    monkeypatch.setattr(api_client, "get", _mock_get)
+    cache = GaggiuinoShotCache(tmp_path / "archive.db", max_bytes=None)
+    monkeypatch.setattr(api_client, "shot_cache", cache)
+    yield state
+    cache.close()
+
+
+def test_sync_requires_shot_cache(api_client):
+    """Test the sync refuses an API without a shot cache."""
+    with pytest.raises(ValueError):
+        GaggiuinoShotSync(api_client)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sync_incremental(api_client, machine):
+    """Test only shots recorded since the previous sync are downloaded."""
+    received = []
+    sync = GaggiuinoShotSync(api_client, on_shot=lambda shot: received.append(shot.id))
+
+    result = await sync.sync()
+
+    assert result.previousShotId == 0
+    assert result.lastShotId == 5
+    assert result.syncedShotIds == [1, 2, 4, 5]
+    assert received == [1, 2, 4, 5]
+    assert api_client.shot_cache.ids() == [1, 2, 4, 5]
+
+    machine["latest"] = 7
+    machine["requested"].clear()
+    result = await sync.sync()
+
+    assert result.syncedShotIds == [6, 7]
+    assert sorted(machine["requested"]) == [6, 7]
+    assert api_client.shot_cache.last_synced_id == 7
+
+    machine["requested"].clear()
+    result = await sync.sync()
+
+    assert result.syncedShotIds == []
+    assert machine["requested"] == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sync_resumes_after_failure(api_client, machine):
+    """Test an interrupted sync keeps its progress and resumes."""
+    machine["fail"].add(4)
+    sync = GaggiuinoShotSync(api_client, concurrency=1)
+
+    with pytest.raises(GaggiuinoConnectionError):
+        await sync.sync()
+
+    assert api_client.shot_cache.last_synced_id == 2
+
+    machine["fail"].clear()
+    machine["requested"].clear()
+    result = await sync.sync()
+
+    assert result.syncedShotIds == [4, 5]
+    # The deleted shot 3 is probed again, archived shots are not
+    assert machine["requested"] == [3, 4, 5]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sync_history_reset(api_client, machine):
+    """Test a machine reporting fewer shots than archived syncs nothing."""
+    api_client.shot_cache.last_synced_id = 10
+
+    result = await GaggiuinoShotSync(api_client).sync()
+
+    assert result.syncedShotIds == []
+    assert api_client.shot_cache.last_synced_id == 10
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sync_feeds_shot_index(api_client, machine):
+    """Test synced shots can be indexed for similarity search as they arrive."""
+    index = GaggiuinoShotIndex()
+
+    await GaggiuinoShotSync(api_client, on_shot=index.add).sync()
+
+    assert len(index) == 4
+    assert [shot_id for shot_id, _ in index.nearest(1)] == [2, 4, 5]
@@ -0,0 +1,65 @@
+"""Tests for the connection pooling transport."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gaggiuino_api import GaggiuinoAPI, GaggiuinoTransport, GaggiuinoTransportStats
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_transport_connector_defaults():
+    """Test the default profile keeps connections alive."""
+    transport = GaggiuinoTransport()
+    connector = transport.create_connector()
+
+    assert connector.limit == transport.limit
+    assert connector.limit_per_host == transport.limit_per_host
+    assert connector.force_close is False
+    await connector.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_transport_no_keepalive():
+    """Test the fallback profile closes every connection."""
+    connector = GaggiuinoTransport.no_keepalive().create_connector()
+
+    assert connector.force_close is True
+    await connector.close()
+
+
+def test_transport_stats_ratios():
+    """Test derived transport statistics."""
+    stats = GaggiuinoTransportStats()
+    assert stats.reuse_ratio == 0.0
+    assert stats.mean_request_time == 0.0
+
+    stats.connections_created = 1
+    stats.connections_reused = 3
+    stats.record_request(0.2)
+    stats.record_request(0.4)
+
+    assert stats.reuse_ratio == 0.75
+    assert stats.mean_request_time == pytest.approx(0.3)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_transport_reuses_connections(mock_health_data):
+    """Test sequential requests share one keep-alive connection."""
+
+    async def _health(_request):
+        return web.json_response(mock_health_data)
+
+    app = web.Application()
+    app.router.add_get("/api/health", _health)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GaggiuinoAPI(base_url=base_url) as client:
+            for _ in range(3):
+                assert await client.healthy() is True
+
+    stats = client.transport_stats
+    assert stats.requests == 3
+    assert stats.connections_created == 1
+    assert stats.connections_reused == 2